@@ -11,12 +11,17 @@ Design principles:
 """
 
 # Core type validation
-from cascade.core.types import validate_type
+from cascade.core.types import validate_type, is_instance_of
+from cascade.core.compiler import compile_type, collect_type_errors
+from cascade.core.batch import BatchReport, validate_many
+from cascade.core.cache import ValidationCache
 
 # Type registry
 from cascade.core.registry import (
     register_type,
     unregister_type,
+    get_registry_generation,
+    subscribe_registry,
 )
 
 # Explicit coercion utilities
@@ -25,7 +30,10 @@ from cascade.core.coercion import (
     unregister_coercer,
     can_coerce,
     coerce,
+    get_coercion_generation,
+    subscribe_coercers,
 )
+from cascade.core.conversion import compile_coercer
 
 # Error hierarchy
 from cascade.core.errors import (
@@ -34,6 +42,8 @@ from cascade.core.errors import (
     TypeValidationError,
     RuleValidationError,
     CoercionError,
+    ErrorDetail,
+    ValidationErrors,
 )
 
 # Dataclass execution policy
@@ -45,16 +55,27 @@ from cascade.dataclass import (
 __all__ = [
     # Core validation
     "validate_type",
+    "is_instance_of",
+    "compile_type",
+    "collect_type_errors",
+    "validate_many",
+    "BatchReport",
+    "ValidationCache",
 
     # Type registry
     "register_type",
     "unregister_type",
+    "get_registry_generation",
+    "subscribe_registry",
 
     # Coercion
     "register_coercer",
     "unregister_coercer",
     "can_coerce",
     "coerce",
+    "get_coercion_generation",
+    "subscribe_coercers",
+    "compile_coercer",
 
     # Errors
     "CascadeError",
@@ -62,6 +83,8 @@ __all__ = [
     "TypeValidationError",
     "RuleValidationError",
     "CoercionError",
+    "ErrorDetail",
+    "ValidationErrors",
 
     # Dataclass utilities
     "validated_dataclass",
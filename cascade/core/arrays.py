@@ -0,0 +1,121 @@
+"""
+Array-backed container support for Cascade Core.
+
+array.array, memoryview and NumPy arrays store homogeneous elements.
+Their element type can be read from the typecode, buffer format or
+dtype instead of inspecting every element, and numeric reductions can
+run in C instead of a Python loop.
+
+NumPy is optional. It is never imported here; arrays are only
+recognized if numpy has already been imported by the application.
+"""
+
+import array
+import sys
+from typing import Any, Optional
+
+
+# Element types for array.array typecodes and struct-style buffer formats.
+_FORMAT_TYPES = {
+    "b": int,
+    "B": int,
+    "h": int,
+    "H": int,
+    "i": int,
+    "I": int,
+    "l": int,
+    "L": int,
+    "q": int,
+    "Q": int,
+    "n": int,
+    "N": int,
+    "e": float,
+    "f": float,
+    "d": float,
+    "?": bool,
+    "c": bytes,
+    "u": str,
+}
+
+# Element types for NumPy dtype kinds. Object arrays are not mapped.
+_DTYPE_KINDS = {
+    "b": bool,
+    "i": int,
+    "u": int,
+    "f": float,
+    "c": complex,
+    "U": str,
+    "S": bytes,
+}
+
+_NUMERIC_TYPES = (int, float, bool)
+
+
+def array_element_type(value: Any) -> Optional[type]:
+    """
+    Return the element type of a one-dimensional array, if known.
+
+    Returns None for anything that is not an array.array, a
+    one-dimensional memoryview with a simple format, or a
+    one-dimensional NumPy array with a non-object dtype.
+    """
+    value_type = type(value)
+
+    if value_type is array.array:
+        return _FORMAT_TYPES.get(value.typecode)
+
+    if value_type is memoryview:
+        try:
+            if value.ndim != 1:
+                return None
+            return _FORMAT_TYPES.get(value.format.lstrip("@=<>!"))
+        except ValueError:
+            # Released buffer.
+            return None
+
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if value.ndim != 1:
+            return None
+        return _DTYPE_KINDS.get(value.dtype.kind)
+
+    return None
+
+
+def is_numeric_array(value: Any) -> bool:
+    """
+    Return whether a value is a one-dimensional numeric array.
+
+    Empty arrays count; they have no elements to reduce.
+    """
+    return array_element_type(value) in _NUMERIC_TYPES
+
+
+def array_min(value: Any) -> Any:
+    """
+    Return the smallest element of a non-empty numeric array.
+
+    Returns None if the value is not a numeric array or is empty.
+    """
+    if array_element_type(value) not in _NUMERIC_TYPES or not len(value):
+        return None
+    if _is_ndarray(value):
+        return value.min().item()
+    return min(value)
+
+
+def array_max(value: Any) -> Any:
+    """
+    Return the largest element of a non-empty numeric array.
+
+    Returns None if the value is not a numeric array or is empty.
+    """
+    if array_element_type(value) not in _NUMERIC_TYPES or not len(value):
+        return None
+    if _is_ndarray(value):
+        return value.max().item()
+    return max(value)
+
+
+def _is_ndarray(value: Any) -> bool:
+    return type(value) not in (array.array, memoryview)
@@ -0,0 +1,146 @@
+"""
+Batch type validation for Cascade Core.
+
+This module validates many values against a single expected type
+in one pass. Instead of stopping at the first failure, it reports
+every failing index.
+
+Design constraints:
+- Same semantics as validate_type for every value
+- Always strict
+- No coercion
+- No rule execution
+"""
+
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from cascade.core.compiler import (
+    _cached_plan,
+    _compile,
+    _InstanceNode,
+    _mismatched_types,
+    _Node,
+)
+from cascade.core.errors import TypeValidationError, ValidationError
+from cascade.core.parallel import run_chunks
+
+
+class BatchReport:
+    """
+    Outcome of validating a batch of values.
+
+    Only failing indices are recorded. Each failing index maps to the
+    first error raised for the value at that position.
+    """
+
+    __slots__ = ("total", "errors")
+
+    def __init__(self, total: int, errors: Dict[int, ValidationError]):
+        self.total = total
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if every value in the batch passed validation.
+        """
+        return not self.errors
+
+    @property
+    def failed_indices(self) -> Tuple[int, ...]:
+        """
+        Indices of failing values, in ascending order.
+        """
+        return tuple(sorted(self.errors))
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchReport(total={self.total}, "
+            f"failed={len(self.errors)})"
+        )
+
+
+def validate_many(
+    values: Iterable[Any],
+    expected_type: Any,
+    *,
+    workers: Optional[int] = None,
+    executor: str = "process",
+) -> BatchReport:
+    """
+    Validate every value of a batch against an expected type.
+
+    Parameters
+    ----------
+    values:
+        The values to be validated.
+    expected_type:
+        The expected Python type or typing construct for each value.
+    workers:
+        Number of parallel workers. None or 1 validates in-process.
+    executor:
+        "process" or "thread". Process workers receive a snapshot of
+        the type and coercion registries; values, expected_type and
+        registered validators must then be picklable.
+
+    Returns
+    -------
+    BatchReport
+        A report listing every failing index.
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+
+    if workers is not None and workers > 1:
+        errors = run_chunks(
+            _validate_chunk,
+            values,
+            (expected_type,),
+            workers=workers,
+            executor=executor,
+        )
+        return BatchReport(len(values), dict(sorted(errors.items())))
+
+    return BatchReport(len(values), _check_batch(_compile(expected_type), values))
+
+
+def _validate_chunk(
+    values: Sequence[Any],
+    expected_type: Any,
+) -> Dict[int, TypeValidationError]:
+    return _check_batch(_cached_plan(expected_type), values)
+
+
+def _check_batch(
+    node: _Node,
+    values: Sequence[Any],
+) -> Dict[int, TypeValidationError]:
+    """
+    Check a sequence of values against a compiled node.
+
+    Returns a mapping of failing index to error.
+    """
+    errors: Dict[int, TypeValidationError] = {}
+
+    if type(node) is _InstanceNode and node.plain:
+        expected_type = node.expected_type
+        mismatched = _mismatched_types(values, expected_type)
+        if not mismatched:
+            return errors
+
+        for index, value in enumerate(values):
+            if type(value) in mismatched and not isinstance(value, expected_type):
+                errors[index] = TypeValidationError(
+                    value=value,
+                    expected_type=expected_type,
+                )
+        return errors
+
+    check = node.check
+    for index, value in enumerate(values):
+        try:
+            check(value)
+        except TypeValidationError as exc:
+            errors[index] = exc
+
+    return errors
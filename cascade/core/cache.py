@@ -0,0 +1,172 @@
+"""
+Optional memoization of successful type checks for Cascade Core.
+
+A ValidationCache sits in front of validate_type and remembers values
+that already passed. Only immutable values are remembered:
+
+- frozensets and frozen dataclass instances, keyed by identity
+  and dropped through a weak reference when the value is collected
+- tuples of primitive values, keyed by content and element types
+
+All other values are validated directly, without caching.
+Failures are never cached. The cache is cleared whenever the
+type registry changes.
+
+The cache assumes cached values are not mutated in ways that affect
+type validation (for example through mutable objects nested inside
+a frozen dataclass).
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+from cascade.core.compiler import _cached_plan
+from cascade.core.registry import get_registry_generation
+
+
+_PRIMITIVE_TYPES = frozenset(
+    {int, float, complex, bool, str, bytes, type(None)}
+)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache of successful type checks.
+
+    Use validate() as a drop-in replacement for validate_type.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._generation = get_registry_generation()
+        self._lock = threading.Lock()
+        # Identity entries whose values were collected. Weakref callbacks
+        # only append here; entries are removed under the lock.
+        self._pending_removals: list = []
+
+    def validate(self, value: Any, expected_type: Any) -> bool:
+        """
+        Validate a value, skipping the check if it already passed.
+
+        Semantics are identical to validate_type.
+        """
+        key = _cache_key(value, expected_type)
+        if key is None:
+            _cached_plan(expected_type).check(value)
+            return True
+
+        with self._lock:
+            if self._pending_removals:
+                self._purge()
+
+            generation = get_registry_generation()
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+
+            self.misses += 1
+
+        _cached_plan(expected_type).check(value)
+        self._store(key, value, generation)
+        return True
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hit and miss counters and the current size.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._pending_removals.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._pending_removals:
+                self._purge()
+            return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        if key[0] == "id":
+            pending = self._pending_removals
+            entry = weakref.ref(value, lambda ref: pending.append((key, ref)))
+        else:
+            entry = True
+
+        with self._lock:
+            if self._pending_removals:
+                self._purge()
+
+            if generation != self._generation:
+                # The registry changed while the value was being validated.
+                return
+
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _purge(self) -> None:
+        pending = self._pending_removals
+        entries = self._entries
+        while pending:
+            key, ref = pending.pop()
+            if entries.get(key) is ref:
+                del entries[key]
+
+
+def _cache_key(value: Any, expected_type: Any) -> Optional[Hashable]:
+    """
+    Build a cache key for an immutable value, or None if not cacheable.
+    """
+    try:
+        hash(expected_type)
+    except TypeError:
+        return None
+
+    value_type = type(value)
+
+    if value_type is tuple:
+        element_types = tuple(map(type, value))
+        if not _PRIMITIVE_TYPES.issuperset(element_types):
+            return None
+        return ("content", expected_type, value, element_types)
+
+    if value_type is frozenset or _is_frozen_dataclass(value_type):
+        try:
+            weakref.ref(value)
+        except TypeError:
+            return None
+        return ("id", expected_type, id(value))
+
+    return None
+
+
+def _is_frozen_dataclass(value_type: type) -> bool:
+    params = getattr(value_type, "__dataclass_params__", None)
+    return params is not None and params.frozen
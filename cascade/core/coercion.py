@@ -10,49 +10,127 @@ Design goals:
 - No dependency on rules, profiles, or validation logic
 """
 
-from typing import Any, Callable, Dict, Optional, Type
+import heapq
+import itertools
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
-from cascade.core.errors import CoercionError
+from cascade.core.errors import CoercionError, short_repr
+from cascade.core.registry import RegistryListener, VersionedRegistry
 
 
 Coercer = Callable[[Any], Any]
 
+# A resolved conversion: the coercers to apply, in order.
+CoercionPath = Tuple[Coercer, ...]
 
-class CoercionRegistry:
+
+class CoercionRegistry(VersionedRegistry):
     """
     Passive registry for coercion functions.
 
-    This registry maps a target type to a coercion callable.
-    Coercers must either return a value of the target type
-    or raise an exception on failure.
+    A coercer is registered either for a target type alone (a generic
+    coercer accepting any input) or as an edge from a source type to
+    a target type. Coercers must either return a value of their target
+    type or raise an exception on failure.
+
+    Edges form a graph. The cheapest chain of edges from the type of
+    a value to the target type, e.g. bytes -> str -> Decimal, is
+    computed once per (source, target) pair and cached until the
+    registry changes. Generic coercers are only used when no such
+    chain exists.
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self._coercers: Dict[Type[Any], Coercer] = {}
-
-    def register(self, target_type: Type[Any], coercer: Coercer) -> None:
+        self._edges: Dict[Type[Any], Dict[Type[Any], Tuple[Coercer, int]]] = {}
+        self._paths: Dict[Tuple[Any, Any], Optional[CoercionPath]] = {}
+
+    def register(
+        self,
+        target_type: Type[Any],
+        coercer: Coercer,
+        *,
+        source: Optional[Type[Any]] = None,
+        cost: int = 1,
+    ) -> None:
         """
         Register a coercion function for a specific target type.
+
+        With source, the coercer is registered as a graph edge and
+        only applies to values of that source type (or a subclass).
         """
         if not callable(coercer):
             raise TypeError("Coercer must be a callable.")
 
-        self._coercers[target_type] = coercer
-
-    def unregister(self, target_type: Type[Any]) -> None:
+        if source is None:
+            self._coercers[target_type] = coercer
+        else:
+            if not isinstance(source, type):
+                raise TypeError("Coercion source must be a class.")
+            if cost < 0:
+                raise ValueError("Coercion cost must not be negative.")
+            self._edges.setdefault(source, {})[target_type] = (coercer, cost)
+
+        self._changed("register", target_type)
+
+    def unregister(
+        self,
+        target_type: Type[Any],
+        *,
+        source: Optional[Type[Any]] = None,
+    ) -> None:
         """
         Remove a registered coercer for a given type.
 
-        This operation is idempotent.
+        Without source, the generic coercer is removed; with source,
+        only that edge. This operation is idempotent.
         """
-        self._coercers.pop(target_type, None)
+        if source is None:
+            self._coercers.pop(target_type, None)
+        else:
+            edges = self._edges.get(source)
+            if edges is not None:
+                edges.pop(target_type, None)
+                if not edges:
+                    del self._edges[source]
+
+        self._changed("unregister", target_type)
 
     def get(self, target_type: Type[Any]) -> Optional[Coercer]:
         """
-        Retrieve a coercer for the given target type, if available.
+        Retrieve the generic coercer for the given target type, if available.
         """
         return self._coercers.get(target_type)
 
+    def has_coercers_for(self, target_type: Any) -> bool:
+        """
+        Return whether any coercer or edge leads to the target type.
+        """
+        if target_type in self._coercers:
+            return True
+        return any(target_type in edges for edges in self._edges.values())
+
+    def resolve(self, source_type: type, target_type: Any) -> Optional[CoercionPath]:
+        """
+        Return the cheapest coercion path from source_type to target_type.
+
+        Returns None if no edge chain and no generic coercer applies.
+        Values that already are instances of the target type are never
+        routed through edges; only a generic coercer applies to them.
+        """
+        key = (source_type, target_type)
+        try:
+            return self._paths[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._find_path(source_type, target_type)
+
+        path = self._find_path(source_type, target_type)
+        self._paths[key] = path
+        return path
+
     def clear(self) -> None:
         """
         Remove all registered coercers.
@@ -60,36 +138,166 @@ class CoercionRegistry:
         Intended for test isolation only.
         """
         self._coercers.clear()
+        self._edges.clear()
+        self._changed("clear", None)
+
+    def snapshot(self) -> Tuple[Dict[Any, Coercer], Dict[Any, Dict[Any, Any]]]:
+        """
+        Return a copy of all coercers and edges, e.g. to ship to a worker.
+        """
+        edges = {source: dict(targets) for source, targets in self._edges.items()}
+        return dict(self._coercers), edges
+
+    def restore(
+        self,
+        snapshot: Tuple[Dict[Any, Coercer], Dict[Any, Dict[Any, Any]]],
+    ) -> None:
+        """
+        Replace all coercers and edges with a snapshot.
+        """
+        coercers, edges = snapshot
+        self._coercers = dict(coercers)
+        self._edges = {source: dict(targets) for source, targets in edges.items()}
+        self._changed("restore", None)
+
+    def _changed(self, event: str, target_type: Any) -> None:
+        self._paths.clear()
+        super()._changed(event, target_type)
+
+    def _find_path(self, source_type: type, target_type: Any) -> Optional[CoercionPath]:
+        if self._edges and not _is_subtype(source_type, target_type):
+            path = self._shortest_path(source_type, target_type)
+            if path is not None:
+                return path
+
+        coercer = self._coercers.get(target_type)
+        if coercer is None:
+            return None
+        return (coercer,)
+
+    def _shortest_path(
+        self,
+        source_type: type,
+        target_type: Any,
+    ) -> Optional[CoercionPath]:
+        """
+        Dijkstra over source-specific edges.
+
+        An edge registered for a base class applies to its subclasses.
+        Ties are broken by registration order.
+        """
+        counter = itertools.count()
+        queue = [(0, next(counter), source_type, ())]
+        settled = set()
+
+        while queue:
+            distance, _, node, path = heapq.heappop(queue)
+            if node == target_type:
+                return path
+            if node in settled:
+                continue
+            settled.add(node)
+
+            for base in getattr(node, "__mro__", (node,)):
+                for next_type, (coercer, cost) in self._edges.get(base, {}).items():
+                    if next_type in settled and next_type != target_type:
+                        continue
+                    heapq.heappush(
+                        queue,
+                        (
+                            distance + cost,
+                            next(counter),
+                            next_type,
+                            path + (coercer,),
+                        ),
+                    )
+
+        return None
+
+
+def _is_subtype(source_type: type, target_type: Any) -> bool:
+    try:
+        return issubclass(source_type, target_type)
+    except TypeError:
+        # Typing constructs are not classes.
+        return False
 
 
 # Global coercion registry used by Cascade Core.
 _registry = CoercionRegistry()
 
 
-def register_coercer(target_type: Type[Any], coercer: Coercer) -> None:
+def register_coercer(
+    target_type: Type[Any],
+    coercer: Coercer,
+    *,
+    source: Optional[Type[Any]] = None,
+    cost: int = 1,
+) -> None:
     """
     Register a coercer for a target type.
 
+    Parameters
+    ----------
+    target_type:
+        The type the coercer produces.
+    coercer:
+        A callable converting a value to target_type.
+    source:
+        Optional source type. When given, the coercer is registered as
+        an edge and may be chained with other edges, e.g.
+        bytes -> str -> Decimal.
+    cost:
+        Relative cost of the edge, used to pick the cheapest chain.
+
     This does not validate or execute the coercer.
     """
-    _registry.register(target_type, coercer)
+    _registry.register(target_type, coercer, source=source, cost=cost)
 
 
-def unregister_coercer(target_type: Type[Any]) -> None:
+def unregister_coercer(
+    target_type: Type[Any],
+    *,
+    source: Optional[Type[Any]] = None,
+) -> None:
     """
     Unregister a coercer for a target type.
+
+    Without source, the generic coercer is removed; with source,
+    only the edge from that source type.
     """
-    _registry.unregister(target_type)
+    _registry.unregister(target_type, source=source)
+
+
+def get_coercion_generation() -> int:
+    """
+    Return the current generation of the global coercion registry.
+
+    The number increases with every register, unregister or clear.
+    """
+    return _registry.generation
+
+
+def subscribe_coercers(listener: RegistryListener) -> Callable[[], None]:
+    """
+    Subscribe to changes of the global coercion registry.
+
+    Returns a function that removes the subscription.
+    """
+    return _registry.subscribe(listener)
 
 
 def can_coerce(value: Any, target_type: Type[Any]) -> bool:
     """
     Check whether a value can be coerced to the target type.
 
-    This function does not perform coercion. It only checks whether
-    a coercer is registered for the target type.
+    This function does not perform coercion. It checks whether a chain
+    of edges from type(value) or a generic coercer for the target
+    type is registered. A value that is already an instance of the
+    target type is never routed through edges and needs a generic
+    coercer.
     """
-    return _registry.get(target_type) is not None
+    return _registry.resolve(type(value), target_type) is not None
 
 
 def coerce(value: Any, target_type: Type[Any]) -> Any:
@@ -113,29 +321,22 @@ def coerce(value: Any, target_type: Type[Any]) -> Any:
     CoercionError
         If no coercer is registered or coercion fails.
     """
-    coercer = _registry.get(target_type)
-    if coercer is None:
+    path = _registry.resolve(type(value), target_type)
+    if path is None:
         raise CoercionError(
             value=value,
             target_type=target_type,
             message=f"No coercer registered for target type {target_type!r}.",
         )
 
-    try:
-        result = coercer(value)
-    except Exception as exc:
-        raise CoercionError(
-            value=value,
-            target_type=target_type,
-            message=str(exc),
-        ) from exc
+    result = _run_path(value, target_type, path)
 
     if not isinstance(result, target_type):
         raise CoercionError(
             value=value,
             target_type=target_type,
             message=(
-                f"Coercer returned value {result!r} "
+                f"Coercer returned value {short_repr(result)} "
                 f"which is not of type {target_type!r}."
             ),
         )
@@ -143,6 +344,23 @@ def coerce(value: Any, target_type: Type[Any]) -> Any:
     return result
 
 
+def _run_path(value: Any, target_type: Any, path: CoercionPath) -> Any:
+    """
+    Apply the coercers of a resolved path in order.
+    """
+    result = value
+    try:
+        for coercer in path:
+            result = coercer(result)
+    except Exception as exc:
+        raise CoercionError(
+            value=value,
+            target_type=target_type,
+            message=str(exc),
+        ) from exc
+    return result
+
+
 def clear_coercers() -> None:
     """
     Clear all registered coercers.
@@ -0,0 +1,762 @@
+"""
+Compiled type checkers for Cascade Core.
+
+This module turns a type annotation into a reusable checker plan.
+All typing introspection (registry lookup, origin and argument dispatch)
+happens once at compile time. Checking a value only walks the resulting
+plan.
+
+Every plan node can either raise on the first failure (check), answer
+without raising (matches), or record every failure (collect).
+Exceptions are only constructed when a failure is actually reported.
+
+Design constraints:
+- Same semantics as validate_type
+- Always strict
+- No coercion
+- No rule execution
+"""
+
+import collections
+import collections.abc
+import types
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Final,
+    List,
+    Literal,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from cascade.core.arrays import array_element_type
+from cascade.core.errors import (
+    ErrorDetail,
+    Path,
+    TypeValidationError,
+    ValidationErrors,
+)
+from cascade.core.registry import (
+    get_registered_validator,
+    get_registry_generation,
+    resolve_validator,
+    subscribe_registry,
+)
+
+
+class CompiledType:
+    """
+    Reusable checker for a single type annotation.
+
+    Calling the checker behaves exactly like validate_type:
+    it returns True on success and raises TypeValidationError otherwise.
+
+    Registered validators are resolved when the checker is compiled.
+    The checker compares the registry generation on every call and
+    recompiles itself after the registry has changed.
+    """
+
+    __slots__ = ("expected_type", "_node", "_generation")
+
+    def __init__(self, expected_type: Any):
+        self.expected_type = expected_type
+        self._recompile()
+
+    @property
+    def stale(self) -> bool:
+        """
+        True if the type registry changed since the last compilation.
+        """
+        return self._generation != get_registry_generation()
+
+    def __call__(self, value: Any) -> bool:
+        if self._generation != get_registry_generation():
+            self._recompile()
+        self._node.check(value)
+        return True
+
+    def matches(self, value: Any) -> bool:
+        """
+        Non-raising variant: return whether the value passes.
+        """
+        if self._generation != get_registry_generation():
+            self._recompile()
+        return self._node.matches(value)
+
+    def collect(self, value: Any) -> ValidationErrors:
+        """
+        Run every check and return all failures instead of raising.
+        """
+        if self._generation != get_registry_generation():
+            self._recompile()
+        return _collect(self._node, value, ())
+
+    def _recompile(self) -> None:
+        self._generation = get_registry_generation()
+        self._node = _compile(self.expected_type)
+
+    def __repr__(self) -> str:
+        return f"CompiledType({self.expected_type!r})"
+
+
+def compile_type(expected_type: Any) -> CompiledType:
+    """
+    Compile a type annotation into a reusable checker.
+
+    Parameters
+    ----------
+    expected_type:
+        The expected Python type or typing construct.
+
+    Returns
+    -------
+    CompiledType
+        A callable that validates values against the expected type.
+    """
+    return CompiledType(expected_type)
+
+
+def collect_type_errors(value: Any, expected_type: Any) -> ValidationErrors:
+    """
+    Validate a value and collect every type failure.
+
+    Unlike validate_type, this does not stop at the first failing
+    element. Each failure is recorded with its path inside the value.
+
+    Returns
+    -------
+    ValidationErrors
+        All failures found. An empty result means validation passed.
+    """
+    return _collect(_compile(expected_type), value, ())
+
+
+def _collect(node: "_Node", value: Any, path: Path) -> ValidationErrors:
+    errors: List[ErrorDetail] = []
+    if not node.matches(value):
+        node.collect(value, path, errors)
+    return ValidationErrors(errors)
+
+
+# Plans used by validate_type, keyed by annotation.
+# Dropped through a registry subscription, so lookups need no version check.
+_plans: Dict[Any, "_Node"] = {}
+_PLAN_CACHE_LIMIT = 1024
+
+
+def _cached_plan(expected_type: Any) -> "_Node":
+    """
+    Return a compiled plan for an annotation, reusing earlier plans.
+
+    The cache is dropped whenever the type registry changes.
+    Unhashable annotations are compiled without caching.
+    """
+    try:
+        return _plans[expected_type]
+    except KeyError:
+        pass
+    except TypeError:
+        return _compile(expected_type)
+
+    generation = get_registry_generation()
+    node = _compile(expected_type)
+
+    # Only keep plans that were not raced by a registry change.
+    if generation == get_registry_generation():
+        if len(_plans) >= _PLAN_CACHE_LIMIT:
+            _plans.clear()
+        _plans[expected_type] = node
+    return node
+
+
+def _drop_plans(event: str, target_type: Any) -> None:
+    _plans.clear()
+
+
+subscribe_registry(_drop_plans)
+
+
+def _compile(expected_type: Any) -> "_Node":
+    """
+    Internal compiler mirroring the validate_type dispatcher.
+
+    Generic annotations are dispatched on their origin through
+    _ORIGIN_COMPILERS. Unknown origins fall back to container-only
+    validation.
+    """
+    if expected_type is Any:
+        return _AnyNode(expected_type)
+
+    validator = resolve_validator(expected_type)
+    if validator is not None:
+        if get_registered_validator(expected_type) is validator:
+            return _CustomNode(expected_type, validator)
+        return _InheritedNode(expected_type, validator)
+
+    origin = get_origin(expected_type)
+
+    if origin is None:
+        return _InstanceNode(expected_type)
+
+    compiler = _ORIGIN_COMPILERS.get(origin)
+    if compiler is None:
+        return _ContainerNode(expected_type, origin)
+
+    return compiler(expected_type, origin, get_args(expected_type))
+
+
+class _Node:
+    """
+    Base class for compiled plan nodes.
+    """
+
+    __slots__ = ("expected_type",)
+
+    def __init__(self, expected_type: Any):
+        self.expected_type = expected_type
+
+    def check(self, value: Any) -> None:
+        """
+        Raise TypeValidationError for the first failure.
+        """
+        raise NotImplementedError
+
+    def matches(self, value: Any) -> bool:
+        """
+        Return whether the value passes, without raising.
+        """
+        raise NotImplementedError
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        """
+        Record every failure below this node instead of raising.
+
+        The default implementation records the first failure only.
+        """
+        try:
+            self.check(value)
+        except TypeValidationError as exc:
+            errors.append(ErrorDetail.from_error(path, exc))
+
+    def _record(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        errors.append(ErrorDetail(path, "type", self.expected_type, value))
+
+
+class _AnyNode(_Node):
+    __slots__ = ()
+
+    def check(self, value: Any) -> None:
+        return None
+
+    def matches(self, value: Any) -> bool:
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        return None
+
+
+class _InstanceNode(_Node):
+    __slots__ = ("plain",)
+
+    def __init__(self, expected_type: Any):
+        super().__init__(expected_type)
+        # Plain classes allow isinstance checks to be decided per type().
+        self.plain = type(expected_type) is type
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.expected_type):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+    def matches(self, value: Any) -> bool:
+        return isinstance(value, self.expected_type)
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.expected_type):
+            self._record(value, path, errors)
+
+
+class _CustomNode(_Node):
+    __slots__ = ("validator",)
+
+    def __init__(self, expected_type: Any, validator):
+        super().__init__(expected_type)
+        self.validator = validator
+
+    def check(self, value: Any) -> None:
+        try:
+            self.validator(value)
+        except TypeValidationError:
+            raise
+        except Exception as exc:
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+                message=str(exc),
+            ) from exc
+
+    def matches(self, value: Any) -> bool:
+        try:
+            self.validator(value)
+        except Exception:
+            return False
+        return True
+
+
+class _InheritedNode(_CustomNode):
+    """
+    Validator inherited from a registered base class.
+
+    The value must be an instance of the requested subclass before
+    the inherited validator runs.
+    """
+
+    __slots__ = ()
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.expected_type):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+        super().check(value)
+
+    def matches(self, value: Any) -> bool:
+        return isinstance(value, self.expected_type) and super().matches(value)
+
+
+class _UnionNode(_Node):
+    __slots__ = ("options",)
+
+    def __init__(self, expected_type: Any, options: tuple):
+        super().__init__(expected_type)
+        self.options = options
+
+    def check(self, value: Any) -> None:
+        for option in self.options:
+            if option.matches(value):
+                return
+
+        raise TypeValidationError(
+            value=value,
+            expected_type=self.expected_type,
+        )
+
+    def matches(self, value: Any) -> bool:
+        for option in self.options:
+            if option.matches(value):
+                return True
+        return False
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not self.matches(value):
+            self._record(value, path, errors)
+
+
+class _ContainerNode(_Node):
+    __slots__ = ("origin",)
+
+    def __init__(self, expected_type: Any, origin: Any):
+        super().__init__(expected_type)
+        self.origin = origin
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.origin):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+    def matches(self, value: Any) -> bool:
+        return isinstance(value, self.origin)
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.origin):
+            self._record(value, path, errors)
+
+
+class _IterableNode(_ContainerNode):
+    __slots__ = ("item", "arrays")
+
+    def __init__(self, expected_type: Any, origin: Any, item: _Node):
+        super().__init__(expected_type, origin)
+        self.item = item
+        # Array-backed values can only satisfy the abstract origins.
+        self.arrays = (
+            origin in _ARRAY_ORIGINS
+            and type(item) is _InstanceNode
+            and item.plain
+        )
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.origin):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+        if self.arrays and self._typed_array(value):
+            return
+
+        item = self.item
+        if type(item) is _InstanceNode:
+            item_type = item.expected_type
+            if item.plain:
+                mismatched = _mismatched_types(value, item_type)
+                if not mismatched:
+                    return
+            for element in value:
+                if not isinstance(element, item_type):
+                    raise TypeValidationError(
+                        value=element,
+                        expected_type=item_type,
+                    )
+            return
+
+        check = item.check
+        for element in value:
+            check(element)
+
+    def matches(self, value: Any) -> bool:
+        if not isinstance(value, self.origin):
+            return False
+
+        if self.arrays and self._typed_array(value):
+            return True
+
+        item = self.item
+        if type(item) is _InstanceNode:
+            item_type = item.expected_type
+            if item.plain:
+                mismatched = _mismatched_types(value, item_type)
+                if not mismatched:
+                    return True
+            for element in value:
+                if not isinstance(element, item_type):
+                    return False
+            return True
+
+        matches = item.matches
+        for element in value:
+            if not matches(element):
+                return False
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.origin):
+            self._record(value, path, errors)
+            return
+
+        item = self.item
+        matches = item.matches
+        for index, element in enumerate(value):
+            if not matches(element):
+                item.collect(element, path + (index,), errors)
+
+    def _typed_array(self, value: Any) -> bool:
+        """
+        Check an array's element type once instead of every element.
+        """
+        element_type = array_element_type(value)
+        return element_type is not None and issubclass(
+            element_type, self.item.expected_type
+        )
+
+
+class _MappingNode(_ContainerNode):
+    __slots__ = ("key_node", "value_node")
+
+    def __init__(
+        self,
+        expected_type: Any,
+        origin: Any,
+        key_node: _Node,
+        value_node: _Node,
+    ):
+        super().__init__(expected_type, origin)
+        self.key_node = key_node
+        self.value_node = value_node
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.origin):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+        check_key = self.key_node.check
+        check_value = self.value_node.check
+        for key, item in value.items():
+            check_key(key)
+            check_value(item)
+
+    def matches(self, value: Any) -> bool:
+        if not isinstance(value, self.origin):
+            return False
+
+        matches_key = self.key_node.matches
+        matches_value = self.value_node.matches
+        for key, item in value.items():
+            if not (matches_key(key) and matches_value(item)):
+                return False
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.origin):
+            self._record(value, path, errors)
+            return
+
+        key_node = self.key_node
+        value_node = self.value_node
+        for key, item in value.items():
+            if not key_node.matches(key):
+                key_node.collect(key, path + ((key,),), errors)
+            if not value_node.matches(item):
+                value_node.collect(item, path + ((key,),), errors)
+
+
+class _TupleNode(_ContainerNode):
+    """
+    Fixed-shape tuple such as Tuple[int, str].
+    """
+
+    __slots__ = ("positions", "size")
+
+    def __init__(self, expected_type: Any, positions: Tuple[_Node, ...]):
+        super().__init__(expected_type, tuple)
+        self.positions = tuple(enumerate(positions))
+        self.size = len(positions)
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, tuple) or len(value) != self.size:
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+        for index, node in self.positions:
+            node.check(value[index])
+
+    def matches(self, value: Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != self.size:
+            return False
+
+        for index, node in self.positions:
+            if not node.matches(value[index]):
+                return False
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, tuple) or len(value) != self.size:
+            self._record(value, path, errors)
+            return
+
+        for index, node in self.positions:
+            element = value[index]
+            if not node.matches(element):
+                node.collect(element, path + (index,), errors)
+
+
+class _LiteralNode(_Node):
+    __slots__ = ("values",)
+
+    def __init__(self, expected_type: Any, values: tuple):
+        super().__init__(expected_type)
+        # Literal[1] must not accept True, so membership includes the type.
+        self.values = frozenset((type(value), value) for value in values)
+
+    def check(self, value: Any) -> None:
+        if not self.matches(value):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+    def matches(self, value: Any) -> bool:
+        try:
+            return (type(value), value) in self.values
+        except TypeError:
+            return False
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not self.matches(value):
+            self._record(value, path, errors)
+
+
+class _CallableNode(_Node):
+    """
+    Callable[...] annotations. Signatures are not checked.
+    """
+
+    __slots__ = ()
+
+    def check(self, value: Any) -> None:
+        if not callable(value):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+    def matches(self, value: Any) -> bool:
+        return callable(value)
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not callable(value):
+            self._record(value, path, errors)
+
+
+class _SubclassNode(_Node):
+    """
+    Type[X] annotations: the value must be a class derived from X.
+    """
+
+    __slots__ = ("base",)
+
+    def __init__(self, expected_type: Any, base: Any):
+        super().__init__(expected_type)
+        self.base = base
+
+    def check(self, value: Any) -> None:
+        if not self.matches(value):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+    def matches(self, value: Any) -> bool:
+        return isinstance(value, type) and issubclass(value, self.base)
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not self.matches(value):
+            self._record(value, path, errors)
+
+
+def _compile_union(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    return _UnionNode(expected_type, tuple(_compile(option) for option in args))
+
+
+def _compile_unwrapped(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    # Annotated, Final and ClassVar only qualify the first argument.
+    return _compile(args[0])
+
+
+def _compile_literal(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    return _LiteralNode(expected_type, args)
+
+
+def _compile_callable(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    return _CallableNode(expected_type)
+
+
+def _compile_subclass(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    if not args or args[0] is Any:
+        return _ContainerNode(expected_type, type)
+    return _SubclassNode(expected_type, args[0])
+
+
+def _compile_iterable(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    if not args:
+        return _ContainerNode(expected_type, origin)
+    return _IterableNode(expected_type, origin, _compile(args[0]))
+
+
+def _compile_tuple(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    if not args:
+        # Tuple[()] has empty arguments, while bare Tuple has none at all.
+        if getattr(expected_type, "__args__", None) == ():
+            return _TupleNode(expected_type, ())
+        return _ContainerNode(expected_type, origin)
+
+    if args == ((),):
+        return _TupleNode(expected_type, ())
+
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _IterableNode(expected_type, origin, _compile(args[0]))
+
+    return _TupleNode(expected_type, tuple(_compile(arg) for arg in args))
+
+
+def _compile_mapping(expected_type: Any, origin: Any, args: tuple) -> _Node:
+    if len(args) == 2:
+        return _MappingNode(
+            expected_type,
+            origin,
+            _compile(args[0]),
+            _compile(args[1]),
+        )
+
+    if len(args) == 1 and origin is collections.Counter:
+        return _MappingNode(
+            expected_type,
+            origin,
+            _compile(args[0]),
+            _AnyNode(Any),
+        )
+
+    return _ContainerNode(expected_type, origin)
+
+
+# Origin dispatch table used by _compile.
+# One-shot iterables (Iterable, Iterator, Generator) are deliberately
+# absent: checking their items would consume them.
+_ORIGIN_COMPILERS: Dict[Any, Callable[[Any, Any, tuple], _Node]] = {
+    Union: _compile_union,
+    types.UnionType: _compile_union,
+    Annotated: _compile_unwrapped,
+    Final: _compile_unwrapped,
+    ClassVar: _compile_unwrapped,
+    Literal: _compile_literal,
+    collections.abc.Callable: _compile_callable,
+    type: _compile_subclass,
+    tuple: _compile_tuple,
+    list: _compile_iterable,
+    set: _compile_iterable,
+    frozenset: _compile_iterable,
+    collections.deque: _compile_iterable,
+    collections.abc.Collection: _compile_iterable,
+    collections.abc.Sequence: _compile_iterable,
+    collections.abc.MutableSequence: _compile_iterable,
+    collections.abc.Set: _compile_iterable,
+    collections.abc.MutableSet: _compile_iterable,
+    collections.abc.KeysView: _compile_iterable,
+    collections.abc.ValuesView: _compile_iterable,
+    dict: _compile_mapping,
+    collections.defaultdict: _compile_mapping,
+    collections.OrderedDict: _compile_mapping,
+    collections.Counter: _compile_mapping,
+    collections.abc.Mapping: _compile_mapping,
+    collections.abc.MutableMapping: _compile_mapping,
+}
+
+# Origins satisfied by array.array, memoryview or NumPy arrays, whose
+# element type is checked once from the typecode, format or dtype.
+_ARRAY_ORIGINS = frozenset(
+    {
+        collections.abc.Collection,
+        collections.abc.Sequence,
+        collections.abc.MutableSequence,
+    }
+)
+
+
+def _mismatched_types(values: Any, item_type: type) -> set:
+    """
+    Return the distinct element types that are not subclasses of item_type.
+
+    An empty result proves every element is an instance of item_type
+    without a per-element isinstance call. A non-empty result only
+    narrows down which elements need an exact check.
+    """
+    return {
+        element_type
+        for element_type in set(map(type, values))
+        if not issubclass(element_type, item_type)
+    }
@@ -0,0 +1,304 @@
+"""
+Compiled coercion pipelines for Cascade Core.
+
+This module turns a (possibly nested) type annotation into a reusable
+converter. Registered leaf coercers are applied element by element,
+values that already have the right type are passed through untouched,
+and containers are only copied once an element actually changes.
+
+Coercion is still explicit: nothing here is triggered by type checking.
+"""
+
+import collections.abc
+import types
+from itertools import islice
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Final,
+    List,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from cascade.core.coercion import (
+    _registry as _coercers,
+    _run_path,
+    get_coercion_generation,
+)
+from cascade.core.compiler import _compile
+from cascade.core.errors import CoercionError, short_repr
+from cascade.core.registry import get_registry_generation
+
+
+Converter = Callable[[Any], Any]
+
+
+class CompiledCoercer:
+    """
+    Reusable converter for a single target annotation.
+
+    Calling the converter returns the coerced value or raises
+    CoercionError. If the input already satisfies the target type,
+    the very same object is returned.
+
+    The converter recompiles itself after the type or coercion
+    registry has changed.
+    """
+
+    __slots__ = ("target_type", "_convert", "_generations")
+
+    def __init__(self, target_type: Any):
+        self.target_type = target_type
+        self._recompile()
+
+    def __call__(self, value: Any) -> Any:
+        if self._generations != _generations():
+            self._recompile()
+        return self._convert(value)
+
+    def _recompile(self) -> None:
+        self._generations = _generations()
+        self._convert = _compile_converter(self.target_type)
+
+    def __repr__(self) -> str:
+        return f"CompiledCoercer({self.target_type!r})"
+
+
+def compile_coercer(target_type: Any) -> CompiledCoercer:
+    """
+    Compile a target annotation into a reusable converter.
+
+    Parameters
+    ----------
+    target_type:
+        The desired Python type or typing construct,
+        e.g. List[Dict[str, int]].
+
+    Returns
+    -------
+    CompiledCoercer
+        A callable converting values to the target type.
+    """
+    return CompiledCoercer(target_type)
+
+
+def _generations() -> tuple:
+    return get_registry_generation(), get_coercion_generation()
+
+
+def _compile_converter(target_type: Any) -> Converter:
+    """
+    Build a converter for an annotation.
+    """
+    if target_type is Any:
+        return _identity
+
+    try:
+        has_coercers = _coercers.has_coercers_for(target_type)
+    except TypeError:
+        has_coercers = False
+
+    matches = _compile(target_type).matches
+
+    if has_coercers:
+        return _leaf_converter(target_type, matches, _coercers.resolve)
+
+    origin = get_origin(target_type)
+    args = get_args(target_type)
+
+    if origin in (Annotated, Final):
+        return _compile_converter(args[0])
+
+    if origin is Union or origin is types.UnionType:
+        return _union_converter(target_type, matches, args)
+
+    if origin is tuple and args and not (len(args) == 2 and args[1] is Ellipsis):
+        if args == ((),):
+            args = ()
+        return _tuple_converter(target_type, matches, args)
+
+    if origin in _SEQUENCE_BUILDERS and args:
+        return _sequence_converter(target_type, matches, origin, args[0])
+
+    if origin in _MAPPING_BUILDERS and len(args) == 2:
+        return _mapping_converter(target_type, matches, origin, args)
+
+    # Plain types and other constructs can only pass through unchanged.
+    return _leaf_converter(target_type, matches, None)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _fail(
+    value: Any,
+    target_type: Any,
+    message: Optional[str] = None,
+) -> CoercionError:
+    return CoercionError(value=value, target_type=target_type, message=message)
+
+
+def _leaf_converter(
+    target_type: Any,
+    matches: Callable,
+    resolve: Optional[Callable],
+) -> Converter:
+    def convert(value: Any) -> Any:
+        if matches(value):
+            return value
+
+        # Paths are dispatched on the runtime type of each value.
+        path = resolve(type(value), target_type) if resolve is not None else None
+        if path is None:
+            raise _fail(
+                value,
+                target_type,
+                f"No coercer registered for target type {target_type!r}.",
+            )
+
+        result = _run_path(value, target_type, path)
+
+        if not matches(result):
+            raise _fail(
+                value,
+                target_type,
+                f"Coercer returned value {short_repr(result)} "
+                f"which is not of type {target_type!r}.",
+            )
+        return result
+
+    return convert
+
+
+def _union_converter(target_type: Any, matches: Callable, args: tuple) -> Converter:
+    options = tuple(_compile_converter(option) for option in args)
+
+    def convert(value: Any) -> Any:
+        if matches(value):
+            return value
+
+        for option in options:
+            try:
+                return option(value)
+            except CoercionError:
+                continue
+
+        raise _fail(value, target_type)
+
+    return convert
+
+
+def _sequence_converter(
+    target_type: Any,
+    matches: Callable,
+    origin: Any,
+    item_type: Any,
+) -> Converter:
+    convert_item = _compile_converter(item_type)
+    build = _SEQUENCE_BUILDERS[origin]
+
+    def convert(value: Any) -> Any:
+        if matches(value):
+            return value
+
+        if isinstance(value, (str, bytes)) or not isinstance(value, _ARRAY_LIKE):
+            raise _fail(value, target_type)
+
+        changed: Optional[List[Any]] = None
+        for index, item in enumerate(value):
+            new_item = convert_item(item)
+            if changed is None and new_item is not item:
+                changed = list(islice(value, index))
+            if changed is not None:
+                changed.append(new_item)
+
+        if changed is None:
+            if isinstance(value, origin):
+                return value
+            changed = list(value)
+
+        return build(changed)
+
+    return convert
+
+
+def _tuple_converter(target_type: Any, matches: Callable, args: tuple) -> Converter:
+    positions = tuple(enumerate(_compile_converter(arg) for arg in args))
+    size = len(args)
+
+    def convert(value: Any) -> Any:
+        if matches(value):
+            return value
+
+        if not isinstance(value, (list, tuple)) or len(value) != size:
+            raise _fail(value, target_type)
+
+        return tuple(
+            convert_item(value[index])
+            for index, convert_item in positions
+        )
+
+    return convert
+
+
+def _mapping_converter(
+    target_type: Any,
+    matches: Callable,
+    origin: Any,
+    args: tuple,
+) -> Converter:
+    convert_key = _compile_converter(args[0])
+    convert_value = _compile_converter(args[1])
+    build = _MAPPING_BUILDERS[origin]
+
+    def convert(value: Any) -> Any:
+        if matches(value):
+            return value
+
+        if not isinstance(value, collections.abc.Mapping):
+            raise _fail(value, target_type)
+
+        changed: Optional[dict] = None
+        for index, (key, item) in enumerate(value.items()):
+            new_key = convert_key(key)
+            new_item = convert_value(item)
+            if changed is None and (new_key is not key or new_item is not item):
+                changed = dict(islice(value.items(), index))
+            if changed is not None:
+                changed[new_key] = new_item
+
+        if changed is None:
+            if isinstance(value, origin):
+                return value
+            changed = dict(value)
+
+        return build(changed)
+
+    return convert
+
+
+# Inputs accepted for sequence targets, e.g. JSON arrays for Set[int].
+_ARRAY_LIKE = (list, tuple, set, frozenset, collections.abc.Sequence)
+
+_SEQUENCE_BUILDERS = {
+    list: list,
+    tuple: tuple,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Collection: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+}
+
+_MAPPING_BUILDERS = {
+    dict: dict,
+    collections.abc.Mapping: dict,
+    collections.abc.MutableMapping: dict,
+}
@@ -11,7 +11,57 @@ Design goals:
 - Zero upward dependencies
 """
 
-from typing import Any, Optional
+import reprlib
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+
+# Default maximum length of value representations inside error messages.
+DEFAULT_REPR_LIMIT = 200
+
+_repr = reprlib.Repr()
+
+
+def set_repr_limit(limit: int) -> None:
+    """
+    Set the maximum length of value representations in error messages.
+
+    Large containers are abbreviated element-wise and long strings
+    or objects are cut to the limit.
+    """
+    if limit < 4:
+        raise ValueError("Repr limit must be at least 4.")
+
+    _repr.maxstring = limit
+    _repr.maxother = limit
+    _repr.maxlong = limit
+
+
+def get_repr_limit() -> int:
+    """
+    Return the current maximum length of value representations.
+    """
+    return _repr.maxstring
+
+
+def short_repr(value: Any) -> str:
+    """
+    Return a truncated representation of a value for error messages.
+    """
+    text = _repr.repr(value)
+    limit = _repr.maxstring
+    if len(text) > limit:
+        text = text[: limit - 3] + "..."
+    return text
+
+
+set_repr_limit(DEFAULT_REPR_LIMIT)
+
+
+def _restore_error(cls: type, args: tuple, state: dict) -> "CascadeError":
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
 
 
 class CascadeError(Exception):
@@ -20,15 +70,40 @@ class CascadeError(Exception):
 
     This class exists mainly for catch-all purposes and should not be raised
     directly in normal validation flows.
+
+    Subclasses store structured fields and render their message only
+    when it is first accessed. An explicit message is also kept in args.
     """
 
-    def __init__(self, message: str):
-        super().__init__(message)
-        self.message = message
+    def __init__(self, message: Optional[str]):
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self._message = message
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._render_message()
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message = message
+
+    def _render_message(self) -> str:
+        return ""
 
     def __str__(self) -> str:
         return self.message
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __reduce__(self):
+        return _restore_error, (type(self), self.args, self.__dict__)
+
 
 class ValidationError(CascadeError):
     """
@@ -40,7 +115,7 @@ class ValidationError(CascadeError):
 
     def __init__(
         self,
-        message: str,
+        message: Optional[str],
         *,
         value: Any = None,
         expected: Any = None,
@@ -65,18 +140,19 @@ class TypeValidationError(ValidationError):
         expected_type: Any,
         message: Optional[str] = None,
     ):
-        if message is None:
-            message = (
-                f"Expected value of type {expected_type!r}, "
-                f"but received value {value!r} of type {type(value)!r}."
-            )
-
         super().__init__(
             message,
             value=value,
             expected=expected_type,
         )
 
+    def _render_message(self) -> str:
+        return (
+            f"Expected value of type {self.expected!r}, "
+            f"but received value {short_repr(self.value)} "
+            f"of type {type(self.value)!r}."
+        )
+
 
 class RuleValidationError(ValidationError):
     """
@@ -93,9 +169,6 @@ class RuleValidationError(ValidationError):
         rule_name: str,
         message: Optional[str] = None,
     ):
-        if message is None:
-            message = f"Validation rule '{rule_name}' failed for value {value!r}."
-
         super().__init__(
             message,
             value=value,
@@ -104,6 +177,12 @@ class RuleValidationError(ValidationError):
 
         self.rule_name = rule_name
 
+    def _render_message(self) -> str:
+        return (
+            f"Validation rule '{self.rule_name}' failed "
+            f"for value {short_repr(self.value)}."
+        )
+
 
 class CoercionError(CascadeError):
     """
@@ -120,12 +199,113 @@ class CoercionError(CascadeError):
         target_type: Any,
         message: Optional[str] = None,
     ):
-        if message is None:
-            message = (
-                f"Failed to coerce value {value!r} "
-                f"to target type {target_type!r}."
-            )
-
         super().__init__(message)
         self.value = value
         self.target_type = target_type
+
+    def _render_message(self) -> str:
+        return (
+            f"Failed to coerce value {short_repr(self.value)} "
+            f"to target type {self.target_type!r}."
+        )
+
+
+# Location of a value inside a validated object.
+Path = Tuple[Any, ...]
+
+
+class ErrorDetail:
+    """
+    A single failure recorded by a collect-all validation run.
+
+    The path locates the failing value inside the validated object.
+    Path segments are attribute names (str), positions (int), or
+    mapping keys wrapped in a one-element tuple.
+
+    The message is only rendered when it is accessed.
+    """
+
+    __slots__ = ("path", "code", "expected", "value", "error")
+
+    def __init__(
+        self,
+        path: Path,
+        code: str,
+        expected: Any,
+        value: Any,
+        error: Optional[CascadeError] = None,
+    ):
+        self.path = path
+        self.code = code
+        self.expected = expected
+        self.value = value
+        self.error = error
+
+    @classmethod
+    def from_error(cls, path: Path, error: ValidationError) -> "ErrorDetail":
+        """
+        Build a detail entry from a raised validation error.
+        """
+        if isinstance(error, RuleValidationError):
+            code = error.rule_name
+        else:
+            code = "type"
+
+        return cls(path, code, error.expected, error.value, error)
+
+    @property
+    def location(self) -> str:
+        """
+        Render the path, e.g. ``items[3].price``.
+        """
+        parts = []
+        for segment in self.path:
+            if isinstance(segment, str):
+                parts.append(f".{segment}" if parts else segment)
+            elif isinstance(segment, tuple):
+                parts.append(f"[{segment[0]!r}]")
+            else:
+                parts.append(f"[{segment!r}]")
+        return "".join(parts)
+
+    @property
+    def message(self) -> str:
+        if self.error is not None:
+            return str(self.error)
+
+        return TypeValidationError(
+            value=self.value,
+            expected_type=self.expected,
+        )._render_message()
+
+    def __repr__(self) -> str:
+        return f"ErrorDetail({self.location!r}, code={self.code!r})"
+
+
+class ValidationErrors(ValidationError):
+    """
+    Aggregate of every failure found by a collect-all validation run.
+
+    An empty instance means validation passed. The individual messages
+    are only rendered when the error is converted to a string.
+    """
+
+    def __init__(self, errors: Iterable[ErrorDetail] = ()):
+        self.errors: Tuple[ErrorDetail, ...] = tuple(errors)
+        super().__init__(f"{len(self.errors)} validation error(s).")
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __iter__(self) -> Iterator[ErrorDetail]:
+        return iter(self.errors)
+
+    def __bool__(self) -> bool:
+        return bool(self.errors)
+
+    def __str__(self) -> str:
+        lines = [self.message]
+        for detail in self.errors:
+            location = detail.location or "<value>"
+            lines.append(f"  {location}: {detail.message}")
+        return "\n".join(lines)
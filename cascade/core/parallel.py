@@ -0,0 +1,160 @@
+"""
+Parallel batch execution for Cascade Core.
+
+Large batches are split into chunks that are validated by a thread
+or process pool. Per-chunk error mappings are merged back with their
+input indices, so reports do not depend on how the work was split.
+
+Worker processes start with a snapshot of the global type and
+coercion registries, taken when the batch is submitted and installed
+by the pool initializer before any chunk runs. Registrations made
+afterwards are not seen by running workers. All context variables
+(such as active profiles) are copied into worker threads. Worker
+processes only receive the variables registered with
+propagate_context(), whose values must be picklable.
+"""
+
+import contextvars
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from cascade.core.coercion import _registry as _coercers
+from cascade.core.registry import _registry as _validators
+
+
+EXECUTORS = ("process", "thread")
+
+# Chunks per worker; more chunks balance uneven workloads.
+_CHUNKS_PER_WORKER = 4
+
+ChunkFunction = Callable[..., Dict[int, Any]]
+
+# None selects the platform's default start method.
+_MP_CONTEXT: Any = None
+
+# Context variables copied into worker processes, by name.
+_propagated: Dict[str, contextvars.ContextVar] = {}
+
+_UNSET = object()
+
+
+def propagate_context(name: str, variable: contextvars.ContextVar) -> None:
+    """
+    Copy a context variable into worker processes.
+
+    Higher layers register their context (e.g. active profiles) under
+    a stable name. A worker sets the submitted value before running a
+    chunk if the variable has been registered there as well, which
+    happens when the module defining it is imported.
+    """
+    _propagated[name] = variable
+
+
+def run_chunks(
+    function: ChunkFunction,
+    values: Sequence[Any],
+    args: Tuple[Any, ...],
+    *,
+    workers: int,
+    executor: str = "process",
+) -> Dict[int, Any]:
+    """
+    Run function(chunk, *args) over chunks of values in a pool.
+
+    The function returns a mapping of chunk-local index to error.
+    For process pools, the function, its arguments and the values
+    must be picklable.
+
+    Returns the merged mapping keyed by index into values.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS!r}.")
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    size = len(values)
+    step = max(1, -(-size // (workers * _CHUNKS_PER_WORKER)))
+
+    with _make_pool(executor, workers) as pool:
+        if executor == "thread":
+            context = contextvars.copy_context()
+            futures = [
+                (
+                    start,
+                    pool.submit(
+                        context.copy().run,
+                        function,
+                        values[start:start + step],
+                        *args,
+                    ),
+                )
+                for start in range(0, size, step)
+            ]
+        else:
+            state = _context_state()
+            futures = [
+                (
+                    start,
+                    pool.submit(
+                        _run_in_context,
+                        state,
+                        function,
+                        values[start:start + step],
+                        *args,
+                    ),
+                )
+                for start in range(0, size, step)
+            ]
+
+        merged: Dict[int, Any] = {}
+        for start, future in futures:
+            for index, error in future.result().items():
+                merged[start + index] = error
+
+    return merged
+
+
+def _make_pool(executor: str, workers: int) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_install_registries,
+        initargs=(_validators.snapshot(), _coercers.snapshot()),
+    )
+
+
+def _install_registries(validators: Any, coercers: Any) -> None:
+    """
+    Pool initializer: install the parent's registries in a worker.
+    """
+    _validators.restore(validators)
+    _coercers.restore(coercers)
+
+
+def _context_state() -> Dict[str, Any]:
+    state = {}
+    for name, variable in _propagated.items():
+        value = variable.get(_UNSET)
+        if value is not _UNSET:
+            state[name] = value
+    return state
+
+
+def _run_in_context(
+    state: Dict[str, Any],
+    function: ChunkFunction,
+    *args: Any,
+) -> Dict[int, Any]:
+    """
+    Run a chunk in a worker process with the submitted context values.
+    """
+    # Unpickling the function and chunk imported the modules that
+    # register their variables, so lookups by name succeed here.
+    for name, value in state.items():
+        variable = _propagated.get(name)
+        if variable is not None:
+            variable.set(value)
+    return function(*args)
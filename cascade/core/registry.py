@@ -3,39 +3,175 @@ Global type registry for Cascade Core.
 
 This registry is process-global by design.
 Context-local or request-local registries are explicitly out of scope for v1.
+
+Registries carry a monotonically increasing generation number and
+notify subscribers of every change, so compiled plans and caches built
+on top of them can detect staleness cheaply.
 """
 
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type
 
 
 Validator = Callable[[Any], None]
 
+# Called with the event name ("register", "unregister", "clear" or
+# "restore") and the affected type (None for "clear" and "restore").
+RegistryListener = Callable[[str, Any], None]
+
+
+class VersionedRegistry:
+    """
+    Generation counter and change notifications shared by registries.
+    """
 
-class TypeRegistry:
     def __init__(self) -> None:
-        self._validators: Dict[Type[Any], Validator] = {}
+        self.generation = 0
+        self._listeners: List[RegistryListener] = []
+
+    def subscribe(self, listener: RegistryListener) -> Callable[[], None]:
+        """
+        Call listener after every change.
+
+        Returns a function that removes the subscription.
+        """
+        if not callable(listener):
+            raise TypeError("Listener must be callable.")
+
+        self._listeners.append(listener)
 
-    def register(self, target_type: Type[Any], validator: Validator) -> None:
+        def unsubscribe() -> None:
+            self.unsubscribe(listener)
+
+        return unsubscribe
+
+    def unsubscribe(self, listener: RegistryListener) -> None:
+        """
+        Remove a listener. This operation is idempotent.
+        """
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def _changed(self, event: str, target_type: Any) -> None:
+        self.generation += 1
+        for listener in tuple(self._listeners):
+            listener(event, target_type)
+
+
+_MISSING = object()
+
+
+class TypeRegistry(VersionedRegistry):
+    def __init__(self) -> None:
+        super().__init__()
+        self._validators: Dict[Type[Any], Validator] = {}
+        # Types whose validator also applies to their subclasses.
+        self._inherited: Set[Type[Any]] = set()
+        # Resolution results per requested type, dropped on every change.
+        self._resolved: Dict[Any, Optional[Validator]] = {}
+
+    def register(
+        self,
+        target_type: Type[Any],
+        validator: Validator,
+        *,
+        inherit: bool = False,
+    ) -> None:
         if not callable(validator):
             raise TypeError("Validator must be callable.")
 
         self._validators[target_type] = validator
+        if inherit:
+            self._inherited.add(target_type)
+        else:
+            self._inherited.discard(target_type)
+        self._changed("register", target_type)
 
     def unregister(self, target_type: Type[Any]) -> None:
         self._validators.pop(target_type, None)
+        self._inherited.discard(target_type)
+        self._changed("unregister", target_type)
 
     def get(self, target_type: Type[Any]) -> Optional[Validator]:
         return self._validators.get(target_type)
 
+    def resolve(self, target_type: Any) -> Optional[Validator]:
+        """
+        Find the validator for a type, following its MRO.
+
+        An exact registration always wins. Otherwise the nearest base
+        class registered with inherit=True provides the validator.
+        Results are cached per type until the registry changes.
+        Unhashable annotations can never be registered and resolve
+        to None.
+        """
+        try:
+            resolved = self._resolved.get(target_type, _MISSING)
+        except TypeError:
+            return None
+
+        if resolved is _MISSING:
+            resolved = self._lookup(target_type)
+            self._resolved[target_type] = resolved
+        return resolved
+
+    def _lookup(self, target_type: Any) -> Optional[Validator]:
+        validator = self._validators.get(target_type)
+        if validator is not None or not self._inherited:
+            return validator
+
+        for base in getattr(target_type, "__mro__", ())[1:]:
+            if base in self._inherited:
+                return self._validators[base]
+        return None
+
     def clear(self) -> None:
         self._validators.clear()
+        self._inherited.clear()
+        self._changed("clear", None)
+
+    def snapshot(self) -> Tuple[Dict[Type[Any], Validator], FrozenSet[type]]:
+        """
+        Return a copy of all registrations, e.g. to ship to a worker.
+        """
+        return dict(self._validators), frozenset(self._inherited)
+
+    def restore(
+        self,
+        snapshot: Tuple[Dict[Type[Any], Validator], FrozenSet[type]],
+    ) -> None:
+        """
+        Replace all registrations with a snapshot.
+        """
+        validators, inherited = snapshot
+        self._validators = dict(validators)
+        self._inherited = set(inherited)
+        self._changed("restore", None)
+
+    def _changed(self, event: str, target_type: Any) -> None:
+        self._resolved.clear()
+        super()._changed(event, target_type)
 
 
 _registry = TypeRegistry()
 
 
-def register_type(target_type: Type[Any], validator: Validator) -> None:
-    _registry.register(target_type, validator)
+def register_type(
+    target_type: Type[Any],
+    validator: Validator,
+    *,
+    inherit: bool = False,
+) -> None:
+    """
+    Register a validator for a type.
+
+    With inherit=True the validator also applies to subclasses of
+    target_type that have no registration of their own. For those
+    subclasses the value must additionally be an instance of the
+    subclass itself.
+    """
+    _registry.register(target_type, validator, inherit=inherit)
 
 
 def unregister_type(target_type: Type[Any]) -> None:
@@ -46,6 +182,31 @@ def get_registered_validator(target_type: Type[Any]) -> Optional[Validator]:
     return _registry.get(target_type)
 
 
+def resolve_validator(target_type: Any) -> Optional[Validator]:
+    """
+    Return the validator that applies to a type, following its MRO.
+    """
+    return _registry.resolve(target_type)
+
+
+def get_registry_generation() -> int:
+    """
+    Return the current generation of the global type registry.
+
+    The number increases with every register, unregister or clear.
+    """
+    return _registry.generation
+
+
+def subscribe_registry(listener: RegistryListener) -> Callable[[], None]:
+    """
+    Subscribe to changes of the global type registry.
+
+    Returns a function that removes the subscription.
+    """
+    return _registry.subscribe(listener)
+
+
 def clear_registry() -> None:
     """
     Clear the global registry.
@@ -0,0 +1,230 @@
+"""
+Compiled dict decoders for validated dataclasses.
+
+from_dict() turns a mapping into a validated instance in one pass:
+each key is pulled, optionally coerced, type checked and run through
+the field rules before the instance is built. The decoding function
+is generated per validation plan, like the hooks in
+cascade.dataclass.hooks, and rebuilt together with the plan.
+
+Classes with generated on_init/on_assign hooks are built without
+running them, since every value has already been validated. Their
+user-defined __post_init__ still runs. Since it may rewrite fields,
+every field is checked again after a user-defined __post_init__.
+
+Nested validated dataclasses, and lists, tuples, dicts or optionals
+of them, are decoded recursively with their own compiled decoders.
+"""
+
+import collections.abc
+import types
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, List, Optional, Union, get_args, get_origin
+
+from cascade.core.conversion import compile_coercer
+from cascade.core.errors import TypeValidationError
+from cascade.dataclass.hooks import (
+    _create_fn,
+    has_generated_hooks,
+    is_validated_dataclass,
+    user_post_init,
+)
+
+
+Decoder = Callable[[Any], Any]
+
+
+def build_decoder(cls: type, plan: Any, coerce: bool) -> Decoder:
+    """
+    Generate the decoding function for a class and its current plan.
+    """
+    # Construct through __init__ unless that would validate again.
+    direct = has_generated_hooks(cls)
+    user_hook = user_post_init(cls)
+    namespace: Dict[str, Any] = {
+        "__cls": cls,
+        "__entries": plan.fields,
+        "__names": frozenset(f.name for f in fields(cls) if f.init),
+        "__Mapping": collections.abc.Mapping,
+        "__not_a_mapping": _not_a_mapping,
+        "__unknown": _unknown_keys,
+        "__missing": _missing_key,
+        "__new": object.__new__,
+        "__set": object.__setattr__,
+        "__user_hook": user_hook,
+    }
+
+    lines = [
+        "def decode(mapping):",
+        "    if not isinstance(mapping, __Mapping):",
+        "        raise __not_a_mapping(mapping, __cls)",
+        "    if not __names.issuperset(mapping):",
+        "        raise __unknown(mapping, __cls, __names)",
+        "    instance = __new(__cls)" if direct else "    kwargs = {}",
+    ]
+    after_init = []
+
+    for index, f in enumerate(fields(cls)):
+        name = f.name
+        # Only the constructor sets init=False fields, and a user
+        # __post_init__ may rewrite any field; check the result.
+        if not f.init or user_hook is not None:
+            after_init.append(
+                f"    __entries[{index}].validate(instance.{name})"
+            )
+        if not f.init:
+            if direct:
+                _set_default(lines, namespace, index, f)
+            continue
+
+        convert = _converter(plan.fields[index].node.expected_type, coerce)
+        if convert is not None:
+            namespace[f"__convert_{index}"] = convert
+
+        if f.default is not MISSING:
+            namespace[f"__default_{index}"] = f.default
+            fallback = f"__default_{index}"
+        elif f.default_factory is not MISSING:
+            namespace[f"__factory_{index}"] = f.default_factory
+            fallback = f"__factory_{index}()"
+        else:
+            fallback = None
+
+        lines.append(f"    if {name!r} in mapping:")
+        lines.append(f"        value = mapping[{name!r}]")
+        if convert is not None:
+            lines.append(f"        value = __convert_{index}(value)")
+        lines.append("    else:")
+        if fallback is None:
+            lines.append(f"        raise __missing(mapping, __cls, {name!r})")
+        else:
+            lines.append(f"        value = {fallback}")
+        lines.append(f"    __entries[{index}].validate(value)")
+        if direct:
+            lines.append(f"    __set(instance, {name!r}, value)")
+        else:
+            lines.append(f"    kwargs[{name!r}] = value")
+
+    if not direct:
+        lines.append("    instance = __cls(**kwargs)")
+    elif user_hook is not None:
+        lines.append("    __user_hook(instance)")
+    lines.extend(after_init)
+    lines.append("    return instance")
+
+    return _create_fn("\n".join(lines), "decode", namespace)
+
+
+def _set_default(
+    lines: List[str],
+    namespace: Dict[str, Any],
+    index: int,
+    f: Any,
+) -> None:
+    # Mirrors what the dataclass __init__ does for init=False fields.
+    if f.default is not MISSING:
+        namespace[f"__default_{index}"] = f.default
+        lines.append(f"    __set(instance, {f.name!r}, __default_{index})")
+    elif f.default_factory is not MISSING:
+        namespace[f"__factory_{index}"] = f.default_factory
+        lines.append(f"    __set(instance, {f.name!r}, __factory_{index}())")
+
+
+def _converter(annotation: Any, coerce: bool) -> Optional[Decoder]:
+    """
+    Build the value converter for a field, or None if values pass as-is.
+    """
+    nested = _nested_decoder(annotation, coerce)
+    if nested is not None:
+        return nested
+    if coerce:
+        return compile_coercer(annotation)
+    return None
+
+
+def _nested_decoder(annotation: Any, coerce: bool) -> Optional[Decoder]:
+    if is_validated_dataclass(annotation):
+        decode = annotation.from_dict
+
+        def decode_nested(value: Any) -> Any:
+            if isinstance(value, collections.abc.Mapping):
+                return decode(value, coerce=coerce)
+            return value
+
+        return decode_nested
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union or origin is types.UnionType:
+        options = [arg for arg in args if is_validated_dataclass(arg)]
+        if len(options) != 1:
+            return None
+        return _nested_decoder(options[0], coerce)
+
+    if origin in (list, collections.abc.Sequence, collections.abc.MutableSequence):
+        item = _nested_decoder(args[0], coerce) if args else None
+        if item is None:
+            return None
+
+        def decode_list(value: Any) -> Any:
+            if isinstance(value, (list, tuple)):
+                return [item(element) for element in value]
+            return value
+
+        return decode_list
+
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        item = _nested_decoder(args[0], coerce)
+        if item is None:
+            return None
+
+        def decode_tuple(value: Any) -> Any:
+            if isinstance(value, (list, tuple)):
+                return tuple(item(element) for element in value)
+            return value
+
+        return decode_tuple
+
+    if origin in (dict, collections.abc.Mapping) and len(args) == 2:
+        item = _nested_decoder(args[1], coerce)
+        if item is None:
+            return None
+
+        def decode_dict(value: Any) -> Any:
+            if isinstance(value, collections.abc.Mapping):
+                return {key: item(element) for key, element in value.items()}
+            return value
+
+        return decode_dict
+
+    return None
+
+
+def _not_a_mapping(value: Any, cls: type) -> TypeValidationError:
+    return TypeValidationError(
+        value=value,
+        expected_type=cls,
+        message=f"Expected a mapping to build {cls.__name__}.",
+    )
+
+
+def _unknown_keys(
+    mapping: Any,
+    cls: type,
+    names: frozenset,
+) -> TypeValidationError:
+    unknown: List[str] = sorted(map(repr, set(mapping) - names))
+    return TypeValidationError(
+        value=mapping,
+        expected_type=cls,
+        message=f"Unknown keys for {cls.__name__}: {', '.join(unknown)}.",
+    )
+
+
+def _missing_key(mapping: Any, cls: type, name: str) -> TypeValidationError:
+    return TypeValidationError(
+        value=mapping,
+        expected_type=cls,
+        message=f"Missing required key '{name}' for {cls.__name__}.",
+    )
@@ -12,6 +12,7 @@ from typing import Any, Iterable, Optional
 def field(
     *,
     rules: Optional[Iterable[Any]] = None,
+    depends_on: Optional[Iterable[str]] = None,
     default: Any = MISSING,
     default_factory: Any = MISSING,
 ):
@@ -23,6 +24,9 @@ def field(
     rules:
         Iterable of callable rules.
         Each rule must expose a 'name' attribute.
+    depends_on:
+        Names of fields whose changes require this field to be
+        re-checked (used by change tracking).
     default:
         Default field value.
     default_factory:
@@ -33,6 +37,9 @@ def field(
     if rules is not None:
         metadata["cascade_rules"] = list(rules)
 
+    if depends_on is not None:
+        metadata["cascade_depends_on"] = tuple(depends_on)
+
     kwargs = {"metadata": metadata}
 
     if default is not MISSING:
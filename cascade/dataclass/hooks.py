@@ -0,0 +1,275 @@
+"""
+Generated validation hooks for validated dataclasses.
+
+Validated dataclasses never validate implicitly unless asked to.
+With on_init or on_assign, this module generates a specialized
+__post_init__ or __setattr__ for the class, the same way dataclasses
+generates __init__: the source is built per class and compiled once,
+so the per-instance path is straight-line code without loops over
+fields.
+
+The generated code fetches the current validation plan on every call,
+so registry changes and bound profiles keep applying.
+
+This module also rebuilds classes with __slots__, including slots for
+the validation state of change tracking.
+"""
+
+import itertools
+from dataclasses import fields
+from typing import Any, Callable, Dict, Tuple
+
+
+_GENERATED_ATTRIBUTE = "__cascade_generated__"
+
+# Class attribute holding the validation plan of a validated dataclass.
+PLAN_ATTRIBUTE = "__cascade_plan__"
+
+# Optional hook installed by higher layers (e.g. profile registries).
+# Called as resolver(cls, plan) and returns the plan to execute.
+RESOLVER_ATTRIBUTE = "__cascade_plan_resolver__"
+
+# Per-instance change tracking state. Unset attributes mean every
+# field is dirty and no plan has been validated yet. The clean state
+# stores the plan's token rather than the plan, so instances stay
+# picklable; an unpickled token never matches a live plan.
+DIRTY_ATTRIBUTE = "__cascade_dirty__"
+CLEAN_TOKEN_ATTRIBUTE = "__cascade_clean_token__"
+
+
+def is_validated_dataclass(cls: Any) -> bool:
+    """
+    Return whether a class was decorated with validated_dataclass.
+    """
+    return isinstance(cls, type) and hasattr(cls, PLAN_ATTRIBUTE)
+
+
+def set_plan_resolver(cls: type, resolver: Callable[[type, Any], Any]) -> None:
+    """
+    Install a resolver choosing the validation plan of a class.
+
+    The resolver is called as resolver(cls, plan) on every validation
+    and returns the plan to execute, e.g. plan.extend(extra_rules).
+    Subclasses inherit the resolver.
+    """
+    setattr(cls, RESOLVER_ATTRIBUTE, resolver)
+
+
+def clear_plan_resolver(cls: type, resolver: Callable[[type, Any], Any]) -> None:
+    """
+    Remove a resolver installed by set_plan_resolver(), if still set.
+    """
+    if cls.__dict__.get(RESOLVER_ATTRIBUTE) == resolver:
+        delattr(cls, RESOLVER_ATTRIBUTE)
+
+
+def install_post_init(
+    cls: type,
+    get_plan: Callable[[type], Any],
+    user_hook: Any,
+    *,
+    check_fields: bool = True,
+) -> None:
+    """
+    Install a __post_init__ validating every field after __init__.
+
+    A user-defined __post_init__ runs first, so values it computes
+    are validated as well.
+    """
+    names = [f.name for f in fields(cls)]
+
+    lines = ["def __post_init__(self, *initvars):"]
+    if user_hook is not None:
+        lines.append("    __user_hook(self, *initvars)")
+    if check_fields and names:
+        lines.append("    entries = __get_plan(type(self)).fields")
+        lines.extend(
+            f"    entries[{index}].validate(self.{name})"
+            for index, name in enumerate(names)
+        )
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    post_init = _create_fn(
+        "\n".join(lines),
+        "__post_init__",
+        {"__get_plan": get_plan, "__user_hook": user_hook},
+    )
+    setattr(post_init, _GENERATED_ATTRIBUTE, user_hook)
+    _set_method(cls, post_init)
+
+
+def install_setattr(
+    cls: type,
+    get_plan: Callable[[type], Any],
+    *,
+    validate: bool = True,
+    track: bool = False,
+) -> None:
+    """
+    Install a __setattr__ for field assignments.
+
+    validate:
+        Validate only the assigned field before storing it.
+    track:
+        Mark the assigned field in the per-instance dirty bitmask
+        after storing it.
+
+    Assignments to non-field attributes are not checked.
+    """
+    positions: Dict[str, int] = {
+        f.name: index for index, f in enumerate(fields(cls))
+    }
+
+    lines = [
+        "def __setattr__(self, name, value):",
+        "    index = __positions.get(name)",
+    ]
+    if validate:
+        lines += [
+            "    if index is not None:",
+            "        __get_plan(type(self)).fields[index].validate(value)",
+        ]
+    lines.append("    __parent_setattr(self, name, value)")
+    if track:
+        lines += [
+            "    if index is not None:",
+            f"        __set(self, {DIRTY_ATTRIBUTE!r},"
+            f" __get(self, {DIRTY_ATTRIBUTE!r}, -1) | (1 << index))",
+        ]
+
+    setter = _create_fn(
+        "\n".join(lines),
+        "__setattr__",
+        {
+            "__get_plan": get_plan,
+            "__positions": positions,
+            "__parent_setattr": _parent_method(cls, "__setattr__"),
+            "__set": object.__setattr__,
+            "__get": getattr,
+        },
+    )
+    setattr(setter, _GENERATED_ATTRIBUTE, None)
+    _set_method(cls, setter)
+
+
+def user_post_init(cls: type) -> Any:
+    """
+    Return the user-defined __post_init__ of a class, if any.
+
+    A generated hook inherited from a base class is unwrapped to the
+    user hook it calls, so fields are not validated twice.
+    """
+    hook = getattr(cls, "__post_init__", None)
+    if hook is not None and hasattr(hook, _GENERATED_ATTRIBUTE):
+        return getattr(hook, _GENERATED_ATTRIBUTE)
+    return hook
+
+
+def has_generated_hooks(cls: type) -> bool:
+    """
+    Return whether a class validates or tracks during construction.
+    """
+    return any(
+        hasattr(getattr(cls, name, None), _GENERATED_ATTRIBUTE)
+        for name in ("__post_init__", "__setattr__")
+    )
+
+
+def _create_fn(source: str, name: str, namespace: Dict[str, Any]) -> Any:
+    scope: Dict[str, Any] = {}
+    exec(source, dict(namespace), scope)
+    return scope[name]
+
+
+def _set_method(cls: type, function: Any) -> None:
+    function.__qualname__ = f"{cls.__qualname__}.{function.__name__}"
+    setattr(cls, function.__name__, function)
+
+
+def _parent_method(cls: type, name: str) -> Any:
+    # Called before the generated method is installed, so a method
+    # defined on cls itself is wrapped rather than replaced.
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    raise AttributeError(name)
+
+
+def add_slots(cls: type, extra: Tuple[str, ...] = ()) -> type:
+    """
+    Recreate a dataclass with __slots__ for its fields and extra names.
+
+    Modelled on dataclasses' own slots support, which cannot add
+    slots beyond the fields. Slots already provided by a base class
+    are not repeated, and __weakref__ is added unless a base provides
+    it. Frozen classes get __getstate__/__setstate__ so instances
+    stay picklable.
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__.")
+
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    inherited = set(
+        itertools.chain.from_iterable(
+            getattr(base, "__slots__", ()) for base in cls.__mro__[1:-1]
+        )
+    )
+    # Keep instances weak-referenceable (e.g. for ValidationCache).
+    if not any("__weakref__" in base.__dict__ for base in cls.__mro__[1:-1]):
+        extra += ("__weakref__",)
+    cls_dict["__slots__"] = tuple(
+        name
+        for name in dict.fromkeys(field_names + extra)
+        if name not in inherited
+    )
+
+    for name in field_names:
+        # Defaults live in the generated __init__, not on the class.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    qualname = getattr(cls, "__qualname__", None)
+    old_cls = cls
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+
+    # Zero-argument super() reads the __class__ cell, which still
+    # refers to the class that was replaced.
+    for member in cls_dict.values():
+        _rebind_class_cell(member, old_cls, cls)
+
+    if cls.__dataclass_params__.frozen:
+        cls.__getstate__ = _frozen_getstate
+        cls.__setstate__ = _frozen_setstate
+
+    return cls
+
+
+def _rebind_class_cell(member: Any, old_cls: type, new_cls: type) -> None:
+    if isinstance(member, (classmethod, staticmethod)):
+        member = member.__func__
+    if isinstance(member, property):
+        for accessor in (member.fget, member.fset, member.fdel):
+            if accessor is not None:
+                _rebind_class_cell(accessor, old_cls, new_cls)
+        return
+
+    code = getattr(member, "__code__", None)
+    if code is None or "__class__" not in code.co_freevars:
+        return
+    cell = member.__closure__[code.co_freevars.index("__class__")]
+    if cell.cell_contents is old_cls:
+        cell.cell_contents = new_cls
+
+
+def _frozen_getstate(self: Any) -> list:
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self: Any, state: list) -> None:
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
@@ -6,71 +6,811 @@ This module provides an explicit execution policy for field validation.
 Execution order (fixed for v1):
 1. Type validation
 2. Field rules (in declared order)
+3. Rules of the active profile, if the class is bound to a
+   profile registry (ADR-0003)
 
 Validation is never implicit.
+
+Each decorated class carries a precompiled validation plan:
+resolved type hints, compiled type checkers and a pre-checked
+rule tuple per field, with adjacent built-in rules fused.
+Validation only walks that plan.
+Plans are rebuilt when the type registry changes.
 """
 
+import asyncio
+import inspect
 from dataclasses import dataclass, fields
-from typing import Any, Type, TypeVar
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    get_args,
+    get_type_hints,
+)
 
-from cascade.core.types import validate_type
-from cascade.core.errors import ValidationError
+from cascade.core.batch import BatchReport, _check_batch
+from cascade.core.compiler import _compile, _Node
+from cascade.core.errors import (
+    ErrorDetail,
+    TypeValidationError,
+    ValidationError,
+    ValidationErrors,
+)
+from cascade.core.parallel import run_chunks
+from cascade.core.registry import get_registry_generation
+from cascade.dataclass.decoding import build_decoder
+from cascade.dataclass.hooks import (
+    CLEAN_TOKEN_ATTRIBUTE,
+    DIRTY_ATTRIBUTE,
+    PLAN_ATTRIBUTE,
+    RESOLVER_ATTRIBUTE,
+    add_slots,
+    install_post_init,
+    install_setattr,
+    user_post_init,
+)
+from cascade.rules.fusion import compile_rules
 
 
 T = TypeVar("T")
 
 
-def validated_dataclass(cls: Type[T]) -> Type[T]:
+def validated_dataclass(
+    cls: Optional[Type[T]] = None,
+    *,
+    on_init: bool = False,
+    on_assign: bool = False,
+    track_changes: bool = False,
+    slots: bool = False,
+    frozen: bool = False,
+) -> Any:
     """
     Decorate a class as a validated dataclass.
 
+    Can be used bare (@validated_dataclass) or with options
+    (@validated_dataclass(on_init=True)).
+
     The resulting dataclass provides explicit validation methods:
     - validate()
     - validate_field(name)
     - is_valid()
+    - collect_errors(nested=False)
+    - avalidate(concurrency=None, timeout=None) (coroutine)
+    - validate_many(instances, workers=None, executor="process")
+      (classmethod)
+    - from_dict(mapping, coerce=False) and from_dicts(mappings,
+      coerce=False) (classmethods)
+
+    from_dict() validates each value before building the instance.
+    Missing or unknown keys raise TypeValidationError. With
+    coerce=True, registered coercers are applied first. Nested
+    validated dataclasses are decoded recursively.
+
+    Like validate(), collect_errors() checks nested validated
+    dataclass instances by type only. With nested=True it also
+    collects their field failures, e.g. at items[3].price.
+
+    Rules that are coroutine functions (e.g. AsyncRule) only run
+    through avalidate(); the synchronous methods raise TypeError
+    when they reach one.
 
-    No validation occurs automatically on initialization or assignment.
+    By default, no validation occurs automatically on initialization
+    or assignment. Both are opt-in:
+
+    on_init:
+        Validate all fields after __init__ (and after a user-defined
+        __post_init__), raising the error validate() would raise.
+    on_assign:
+        Validate a field whenever it is assigned, including the
+        assignments made by __init__. Only the assigned field is
+        checked. Not supported for frozen dataclasses.
+    track_changes:
+        Record which fields were assigned since the last successful
+        validate() or is_valid() in a per-instance bitmask. Repeated
+        calls only re-check those fields and the fields declaring
+        them in depends_on, and return immediately if nothing
+        changed. In-place mutation of field values (e.g. appending
+        to a list) is not detected.
+    slots:
+        Generate a class with __slots__ and no per-instance __dict__.
+        The class stays a regular dataclass for fields() and friends.
+    frozen:
+        Generate a frozen dataclass, as with dataclass(frozen=True).
     """
-    cls = dataclass(cls)
+
+    def wrap(cls: Type[T]) -> Type[T]:
+        return _process_class(
+            cls,
+            on_init,
+            on_assign,
+            track_changes,
+            slots,
+            frozen,
+        )
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def _process_class(
+    cls: Type[T],
+    on_init: bool,
+    on_assign: bool,
+    track_changes: bool,
+    slots: bool,
+    frozen: bool,
+) -> Type[T]:
+    frozen = frozen or _is_frozen(cls)
+    if on_assign and frozen:
+        raise TypeError("on_assign cannot be used with frozen dataclasses.")
+
+    user_hook = user_post_init(cls)
+    if on_init and user_hook is None:
+        # dataclass() only calls __post_init__ if it exists when the
+        # class is processed; the generated hook replaces this stub.
+        cls.__post_init__ = _post_init_stub
+
+    cls = dataclass(cls, frozen=frozen)
+    if slots:
+        state = (DIRTY_ATTRIBUTE, CLEAN_TOKEN_ATTRIBUTE) if track_changes else ()
+        cls = add_slots(cls, state)
+    setattr(cls, PLAN_ATTRIBUTE, None)
+
+    # Frozen instances never change, so they need no tracking hook.
+    track_assignments = track_changes and not frozen
+    if on_assign or track_assignments:
+        install_setattr(
+            cls,
+            _get_plan,
+            validate=on_assign,
+            track=track_assignments,
+        )
+
+    if on_init:
+        # With on_assign, __init__ assignments are already checked.
+        install_post_init(cls, _get_plan, user_hook, check_fields=not on_assign)
+
+    try:
+        _build_plan(cls)
+    except NameError:
+        # Forward references are resolved on first validation instead.
+        pass
 
     def validate(self) -> None:
-        for f in fields(self):
-            _validate_field(self, f.name)
+        plan = _get_plan(type(self))
+        for entry, value in zip(plan.fields, plan.read(self)):
+            entry.validate(value)
+
+    def validate_tracked(self) -> None:
+        plan = _get_plan(type(self))
+        entries = _dirty_entries(self, plan)
+        if entries is None:
+            return
+
+        for entry in entries:
+            entry.validate(getattr(self, entry.name))
+        _mark_clean(self, plan)
 
     def validate_field(self, name: str) -> None:
-        if not hasattr(self, name):
+        entry = _get_plan(type(self)).by_name.get(name)
+        if entry is None:
             raise AttributeError(f"Field '{name}' does not exist.")
 
-        _validate_field(self, name)
+        entry.validate(getattr(self, name))
 
     def is_valid(self) -> bool:
-        try:
-            self.validate()
+        plan = _get_plan(type(self))
+        for entry, value in zip(plan.fields, plan.read(self)):
+            if not entry.is_valid(value):
+                return False
+        return True
+
+    def is_valid_tracked(self) -> bool:
+        plan = _get_plan(type(self))
+        entries = _dirty_entries(self, plan)
+        if entries is None:
             return True
-        except ValidationError:
-            return False
 
-    cls.validate = validate
+        for entry in entries:
+            if not entry.is_valid(getattr(self, entry.name)):
+                return False
+        _mark_clean(self, plan)
+        return True
+
+    def collect_errors(self, *, nested: bool = False) -> ValidationErrors:
+        errors: List[ErrorDetail] = []
+        _collect_instance(self, (), errors, set() if nested else None)
+        return ValidationErrors(errors)
+
+    async def avalidate(
+        self,
+        *,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        await _avalidate(self, concurrency, timeout)
+
+    def validate_many(
+        klass,
+        instances: Iterable[Any],
+        *,
+        workers: Optional[int] = None,
+        executor: str = "process",
+    ) -> BatchReport:
+        if workers is not None and workers > 1:
+            return _validate_parallel(klass, instances, workers, executor)
+        return _validate_batch(klass, instances)
+
+    def from_dict(klass, mapping: Mapping[str, Any], *, coerce: bool = False) -> Any:
+        return _get_plan(klass).decoder(klass, coerce)(mapping)
+
+    def from_dicts(
+        klass,
+        mappings: Iterable[Mapping[str, Any]],
+        *,
+        coerce: bool = False,
+    ) -> List[Any]:
+        decode = _get_plan(klass).decoder(klass, coerce)
+        return [decode(mapping) for mapping in mappings]
+
+    cls.validate = validate_tracked if track_changes else validate
     cls.validate_field = validate_field
-    cls.is_valid = is_valid
+    cls.is_valid = is_valid_tracked if track_changes else is_valid
+    cls.collect_errors = collect_errors
+    cls.avalidate = avalidate
+    cls.validate_many = classmethod(validate_many)
+    cls.from_dict = classmethod(from_dict)
+    cls.from_dicts = classmethod(from_dicts)
 
     return cls
 
 
-def _validate_field(instance: Any, name: str) -> None:
-    value = getattr(instance, name)
-    annotation = instance.__annotations__.get(name)
+def _post_init_stub(self: Any, *initvars: Any) -> None:
+    pass
+
+
+def _collect_instance(
+    instance: Any,
+    prefix: Tuple[Any, ...],
+    errors: List[ErrorDetail],
+    seen: Optional[set],
+) -> None:
+    # Instances reachable twice (or through a cycle) are collected once.
+    if seen is not None:
+        seen.add(id(instance))
+    plan = _get_plan(type(instance))
+    for entry, value in zip(plan.fields, plan.read(instance)):
+        entry.collect(value, errors, prefix, seen)
+
+
+def _collect_nested(
+    value: Any,
+    path: Tuple[Any, ...],
+    errors: List[ErrorDetail],
+    seen: set,
+) -> None:
+    if hasattr(type(value), PLAN_ATTRIBUTE):
+        if id(value) not in seen:
+            _collect_instance(value, path, errors, seen)
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            _collect_nested(item, path + (index,), errors, seen)
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            _collect_nested(item, path + ((key,),), errors, seen)
+
+
+def _mentions_validated_dataclass(annotation: Any) -> bool:
+    args = get_args(annotation)
+    if args:
+        return any(_mentions_validated_dataclass(arg) for arg in args)
+    return isinstance(annotation, type) and hasattr(annotation, PLAN_ATTRIBUTE)
+
+
+def _dirty_entries(instance: Any, plan: "_ValidationPlan") -> Optional[List[Any]]:
+    """
+    Return the entries to re-check, or None if the instance is clean.
+
+    Everything is dirty if the instance was last validated against
+    another plan (after a registry or profile change).
+    """
+    if getattr(instance, CLEAN_TOKEN_ATTRIBUTE, None) is not plan.token:
+        return list(plan.fields)
+
+    dirty = getattr(instance, DIRTY_ATTRIBUTE, -1)
+    if not dirty:
+        return None
+    return plan.select(dirty)
+
+
+def _mark_clean(instance: Any, plan: "_ValidationPlan") -> None:
+    object.__setattr__(instance, DIRTY_ATTRIBUTE, 0)
+    object.__setattr__(instance, CLEAN_TOKEN_ATTRIBUTE, plan.token)
+
+
+def _is_frozen(cls: type) -> bool:
+    # Covers classes already processed by @dataclass(frozen=True)
+    # and subclasses of frozen dataclasses.
+    params = getattr(cls, "__dataclass_params__", None)
+    return params is not None and params.frozen
+
+
+class _FieldPlan:
+    """
+    Precompiled validation steps for a single field.
+    """
+
+    __slots__ = (
+        "name",
+        "node",
+        "check",
+        "rules",
+        "fused",
+        "collected",
+        "steps",
+        "is_async",
+        "nested",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        node: _Node,
+        rules: Tuple[Callable[[Any], None], ...],
+    ):
+        self.name = name
+        self.node = node
+        self.check = node.check
+        self.rules = rules
+        # Whether collect() descends into nested validated dataclasses.
+        self.nested = _mentions_validated_dataclass(node.expected_type)
+
+        # Async rules and their fusion-free positions, for avalidate().
+        self.steps = tuple(
+            (rule, _is_async_rule(rule)) for rule in compile_rules(rules)
+        )
+        self.is_async = any(is_async for _, is_async in self.steps)
+
+        # Synchronous execution paths refuse to run async rules.
+        # Fused rules raise exactly what the first failing rule raises.
+        self.fused = tuple(
+            _sync_guard(name, rule) if is_async else rule
+            for rule, is_async in self.steps
+        )
+        self.collected = tuple(
+            _sync_guard(name, rule) if _is_async_rule(rule) else rule
+            for rule in rules
+        )
+
+    def validate(self, value: Any) -> None:
+        self.check(value)
+
+        for rule in self.fused:
+            rule(value)
+
+    def is_valid(self, value: Any) -> bool:
+        if not self.node.matches(value):
+            return False
+
+        try:
+            for rule in self.fused:
+                rule(value)
+        except ValidationError:
+            return False
+        return True
+
+    def collect(
+        self,
+        value: Any,
+        errors: List[ErrorDetail],
+        prefix: Tuple[Any, ...] = (),
+        seen: Optional[set] = None,
+    ) -> None:
+        """
+        Run every check for this field and record all failures.
+
+        Rules are skipped when the type check fails, matching the
+        fixed execution order. If seen is given (nested collection),
+        validated dataclass instances inside the value are then
+        collected as well, with their full path.
+        """
+        path = prefix + (self.name,)
+        if not self.node.matches(value):
+            self.node.collect(value, path, errors)
+            return
+
+        for rule in self.collected:
+            try:
+                rule(value)
+            except ValidationErrors as exc:
+                errors.extend(
+                    ErrorDetail(
+                        path + detail.path,
+                        detail.code,
+                        detail.expected,
+                        detail.value,
+                        detail.error,
+                    )
+                    for detail in exc.errors
+                )
+            except ValidationError as exc:
+                errors.append(ErrorDetail.from_error(path, exc))
+
+        if self.nested and seen is not None:
+            _collect_nested(value, path, errors, seen)
+
+    async def avalidate(
+        self,
+        value: Any,
+        limit: Optional[asyncio.Semaphore],
+        timeout: Optional[float],
+    ) -> None:
+        """
+        Run the type check and all rules, awaiting async rules.
+
+        Rules still run one after another in declared order.
+        """
+        self.check(value)
+
+        for rule, is_async in self.steps:
+            if not is_async:
+                rule(value)
+            elif limit is None:
+                await _await_rule(rule, value, timeout)
+            else:
+                async with limit:
+                    await _await_rule(rule, value, timeout)
 
-    if annotation is not None:
-        validate_type(value, annotation)
 
-    field_info = next(f for f in fields(instance) if f.name == name)
-    rules = field_info.metadata.get("cascade_rules", [])
+async def _await_rule(rule: Any, value: Any, timeout: Optional[float]) -> None:
+    if timeout is None:
+        await rule(value)
+    else:
+        await asyncio.wait_for(rule(value), timeout)
 
-    for rule in rules:
-        if not callable(rule) or not hasattr(rule, "name"):
-            raise TypeError(
-                "Field rules must be callable and expose a 'name' attribute."
+
+def _is_async_rule(rule: Any) -> bool:
+    """
+    Detect async rules by behavior: calling them returns a coroutine.
+    """
+    return inspect.iscoroutinefunction(rule) or inspect.iscoroutinefunction(
+        getattr(type(rule), "__call__", None)
+    )
+
+
+def _sync_guard(field_name: str, rule: Any) -> Callable[[Any], None]:
+    def async_rule(value: Any) -> None:
+        raise TypeError(
+            f"Field '{field_name}' has async rules; use avalidate() instead."
+        )
+
+    return async_rule
+
+
+async def _avalidate(
+    instance: Any,
+    concurrency: Optional[int],
+    timeout: Optional[float],
+) -> None:
+    """
+    Validate an instance, running fields with async rules concurrently.
+
+    Fields without async rules are validated inline. The error raised
+    is the one validate() would raise: the first error of the first
+    failing field in declared order.
+    """
+    if concurrency is not None and concurrency <= 0:
+        raise ValueError("concurrency must be positive.")
+
+    limit = asyncio.Semaphore(concurrency) if concurrency is not None else None
+    tasks = []
+    failure: Optional[BaseException] = None
+
+    for entry in _get_plan(type(instance)).fields:
+        value = getattr(instance, entry.name)
+        if entry.is_async:
+            tasks.append(asyncio.ensure_future(entry.avalidate(value, limit, timeout)))
+            continue
+        try:
+            entry.validate(value)
+        except Exception as exc:
+            # Earlier async fields may still fail and take precedence.
+            failure = exc
+            break
+
+    if tasks:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    if failure is not None:
+        raise failure
+
+
+class _ValidationPlan:
+    """
+    Flat, per-class validation plan.
+    """
+
+    __slots__ = (
+        "fields",
+        "by_name",
+        "generation",
+        "depends_on",
+        "closures",
+        "read",
+        "decoders",
+        "token",
+    )
+
+    def __init__(
+        self,
+        entries: Tuple[_FieldPlan, ...],
+        generation: int,
+        depends_on: Optional[Mapping[str, Tuple[str, ...]]] = None,
+    ):
+        self.fields = entries
+        self.generation = generation
+        self.by_name: Dict[str, _FieldPlan] = {
+            entry.name: entry for entry in entries
+        }
+        # Reads all field values of an instance in one call.
+        self.read = _field_reader(tuple(entry.name for entry in entries))
+        self.depends_on = depends_on or {}
+        self.decoders: Dict[Tuple[type, bool], Callable[[Any], Any]] = {}
+        # Identifies this plan in the change tracking state of instances.
+        self.token = object()
+        # Per field bit: the field plus every field depending on it,
+        # transitively. None if no field declares dependencies.
+        self.closures = (
+            _dependency_closures(entries, self.depends_on)
+            if self.depends_on
+            else None
+        )
+
+    def decoder(self, cls: type, coerce: bool) -> Callable[[Any], Any]:
+        """
+        Return the compiled from_dict() decoder for this plan.
+        """
+        key = (cls, coerce)
+        decode = self.decoders.get(key)
+        if decode is None:
+            decode = build_decoder(cls, self, coerce)
+            self.decoders[key] = decode
+        return decode
+
+    def select(self, dirty: int) -> List[_FieldPlan]:
+        """
+        Return the entries to re-check for a dirty-field bitmask.
+        """
+        closures = self.closures
+        if closures is not None:
+            mask = 0
+            remaining = dirty
+            while remaining:
+                lowest = remaining & -remaining
+                mask |= closures[lowest.bit_length() - 1]
+                remaining ^= lowest
+            dirty = mask
+
+        return [
+            entry
+            for index, entry in enumerate(self.fields)
+            if dirty >> index & 1
+        ]
+
+    def extend(self, extra_rules: Mapping[str, Iterable[Any]]) -> "_ValidationPlan":
+        """
+        Return a plan running extra rules after each field's own rules.
+        """
+        entries = []
+        for entry in self.fields:
+            extra = tuple(
+                _prepare_rule(rule) for rule in extra_rules.get(entry.name, ())
             )
+            if extra:
+                entry = _FieldPlan(entry.name, entry.node, entry.rules + extra)
+            entries.append(entry)
+        return _ValidationPlan(tuple(entries), self.generation, self.depends_on)
+
+
+def _field_reader(names: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    if not names:
+        return lambda instance: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda instance: (getter(instance),)
+    return attrgetter(*names)
+
+
+def _dependency_closures(
+    entries: Tuple[_FieldPlan, ...],
+    depends_on: Mapping[str, Tuple[str, ...]],
+) -> Tuple[int, ...]:
+    positions = {entry.name: index for index, entry in enumerate(entries)}
+    dependents = [0] * len(entries)
+
+    for name, dependencies in depends_on.items():
+        for dependency in dependencies:
+            if dependency not in positions:
+                raise ValueError(
+                    f"Field '{name}' depends on unknown field '{dependency}'."
+                )
+            dependents[positions[dependency]] |= 1 << positions[name]
+
+    closures = []
+    for index in range(len(entries)):
+        mask = frontier = 1 << index
+        while frontier:
+            reached = 0
+            for other, bits in enumerate(dependents):
+                if frontier >> other & 1:
+                    reached |= bits
+            frontier = reached & ~mask
+            mask |= frontier
+        closures.append(mask)
+    return tuple(closures)
+
+
+def _get_plan(cls: type) -> _ValidationPlan:
+    plan = cls.__dict__.get(PLAN_ATTRIBUTE)
+    if plan is None or plan.generation != get_registry_generation():
+        plan = _build_plan(cls)
+
+    resolver = getattr(cls, RESOLVER_ATTRIBUTE, None)
+    if resolver is not None:
+        return resolver(cls, plan)
+    return plan
+
+
+def _build_plan(cls: type) -> _ValidationPlan:
+    generation = get_registry_generation()
+    hints = get_type_hints(cls)
+
+    entries = tuple(
+        _FieldPlan(
+            f.name,
+            _compile(hints.get(f.name, Any)),
+            tuple(
+                _prepare_rule(rule)
+                for rule in f.metadata.get("cascade_rules", ())
+            ),
+        )
+        for f in fields(cls)
+    )
+
+    depends_on = {
+        f.name: tuple(f.metadata["cascade_depends_on"])
+        for f in fields(cls)
+        if f.metadata.get("cascade_depends_on")
+    }
+
+    plan = _ValidationPlan(entries, generation, depends_on)
+    setattr(cls, PLAN_ATTRIBUTE, plan)
+    return plan
+
+
+def _prepare_rule(rule: Any) -> Callable[[Any], None]:
+    if callable(rule) and hasattr(rule, "name"):
+        return rule
+
+    # Invalid rules are reported when they would have been executed.
+    def invalid_rule(value: Any) -> None:
+        raise TypeError(
+            "Field rules must be callable and expose a 'name' attribute."
+        )
+
+    return invalid_rule
+
+
+def _validate_batch(cls: type, instances: Iterable[Any]) -> BatchReport:
+    """
+    Validate a batch of instances column by column.
+
+    Each field is checked across all still-passing instances before
+    moving on to the next field, so each failing index reports the
+    same error validate() would have raised first. Rules providing
+    collect_many() (batch rules) are called once per column.
+    """
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+
+    plan = _get_plan(cls)
+    errors: Dict[int, ValidationError] = {}
+    pending = []
+
+    for index, instance in enumerate(instances):
+        if isinstance(instance, cls):
+            pending.append(index)
+        else:
+            errors[index] = TypeValidationError(value=instance, expected_type=cls)
+
+    for entry in plan.fields:
+        if not pending:
+            break
+
+        name = entry.name
+        column = [getattr(instances[index], name) for index in pending]
+
+        failed = _check_batch(entry.node, column)
+        for position, exc in failed.items():
+            errors[pending[position]] = exc
+
+        # Rules run rule by rule over the still-passing values, so
+        # batch rules can answer a whole column with one bulk call.
+        for rule in entry.fused:
+            live = [
+                position
+                for position in range(len(column))
+                if position not in failed
+            ]
+            if not live:
+                break
+
+            many = getattr(rule, "collect_many", None)
+            if many is not None:
+                found = many([column[position] for position in live])
+                for offset, exc in found.items():
+                    position = live[offset]
+                    errors[pending[position]] = exc
+                    failed[position] = exc
+                continue
+
+            for position in live:
+                try:
+                    rule(column[position])
+                except ValidationError as exc:
+                    errors[pending[position]] = exc
+                    failed[position] = exc
+
+        if failed:
+            pending = [
+                index
+                for position, index in enumerate(pending)
+                if position not in failed
+            ]
+
+    return BatchReport(len(instances), dict(sorted(errors.items())))
+
+
+def _validate_parallel(
+    cls: type,
+    instances: Iterable[Any],
+    workers: int,
+    executor: str,
+) -> BatchReport:
+    """
+    Validate a batch in chunks across a worker pool.
+
+    Each chunk is validated with _validate_batch, so reports match the
+    sequential path. Process workers rebuild the class's plan from the
+    class itself, which must be importable by its qualified name.
+    Batch rules are called once per chunk instead of once per column.
+    """
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+
+    errors = run_chunks(
+        _validate_chunk,
+        instances,
+        (cls,),
+        workers=workers,
+        executor=executor,
+    )
+    return BatchReport(len(instances), dict(sorted(errors.items())))
+
 
-        rule(value)
+def _validate_chunk(instances: Sequence[Any], cls: type) -> Dict[int, Any]:
+    return _validate_batch(cls, instances).errors
@@ -5,12 +5,13 @@ Profiles provide contextual rule selection without affecting
 type checking or coercion behavior.
 """
 
-from cascade.profiles.context import use_profile, current_profile
+from cascade.profiles.context import active_profiles, current_profile, use_profile
 from cascade.profiles.manager import Profile, ProfileRegistry
 
 __all__ = [
     "use_profile",
     "current_profile",
+    "active_profiles",
     "Profile",
     "ProfileRegistry",
 ]
@@ -2,36 +2,63 @@
 Profile context management.
 
 This module provides a lightweight context mechanism
-for activating a validation profile.
+for activating validation profiles.
+
+Activations stack: nested use_profile() blocks keep the outer
+profiles active, and the active profiles merge in activation order.
 """
 
 from contextvars import ContextVar
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple
+
+from cascade.core.parallel import propagate_context
 
 
-_current_profile: ContextVar[Optional[str]] = ContextVar(
-    "cascade_current_profile",
-    default=None,
+_active_profiles: ContextVar[Tuple[str, ...]] = ContextVar(
+    "cascade_active_profiles",
+    default=(),
 )
 
+# Active profiles also apply in process-pool validate_many().
+propagate_context("cascade.profiles.active", _active_profiles)
+
 
 def current_profile() -> Optional[str]:
     """
-    Return the name of the currently active profile, if any.
+    Return the name of the innermost active profile, if any.
     """
-    return _current_profile.get()
+    active = _active_profiles.get()
+    return active[-1] if active else None
+
+
+def active_profiles() -> Tuple[str, ...]:
+    """
+    Return the names of all active profiles, outermost first.
+    """
+    return _active_profiles.get()
 
 
 @contextmanager
-def use_profile(name: str) -> Iterator[None]:
+def use_profile(*names: str) -> Iterator[None]:
     """
-    Activate a profile within a controlled context.
+    Activate one or more profiles within a controlled context.
+
+    The profiles are added on top of any profiles that are already
+    active. The last name given becomes the innermost profile.
 
     Profiles are context-local and safe for concurrent and async usage.
     """
-    token = _current_profile.set(name)
+    if not names:
+        raise TypeError("use_profile() requires at least one profile name.")
+
+    # Re-activating a profile moves it to the innermost position.
+    names = tuple(dict.fromkeys(names))
+    active = _active_profiles.get()
+    token = _active_profiles.set(
+        tuple(name for name in active if name not in names) + names
+    )
     try:
         yield
     finally:
-        _current_profile.reset(token)
+        _active_profiles.reset(token)
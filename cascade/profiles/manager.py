@@ -3,23 +3,58 @@ Profile registry and rule resolution logic.
 
 This module defines how profiles map to rule sets.
 It does not execute rules and does not perform validation.
-"""
 
-from typing import Dict, Iterable, List
+Profiles can extend other profiles, and several profiles can be
+active at once. The rules of all active profiles and their ancestors
+are flattened once per combination of active profiles and cached,
+so lookups never walk the inheritance chain.
+
+A registry can be bound to validated dataclasses. Bound classes run
+the active profiles' rules for each field after the field's own rules.
+The merged per-field plans are built once per (profiles, class) pair.
+
+All caches are dropped whenever a profile or the registry changes.
+"""
 
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from cascade.core.registry import VersionedRegistry
+from cascade.dataclass.hooks import (
+    clear_plan_resolver,
+    is_validated_dataclass,
+    set_plan_resolver,
+)
 from cascade.rules.base import Rule
-from cascade.profiles.context import current_profile
+from cascade.profiles.context import active_profiles
 
 
-class Profile:
+T = TypeVar("T")
+
+
+class Profile(VersionedRegistry):
     """
     Definition of a validation profile.
 
     A profile maps a field or logical key to a list of rules.
+
+    A profile extending other profiles inherits their rules. For each
+    key, inherited rules run first, in the order the parents are
+    listed, followed by the profile's own rules.
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, extends: Optional[Iterable[str]] = None):
+        super().__init__()
         self.name = name
+        self.extends: Tuple[str, ...] = tuple(extends or ())
         self._rules: Dict[str, List[Rule]] = {}
 
     def add_rules(self, key: str, rules: Iterable[Rule]) -> None:
@@ -27,6 +62,7 @@ class Profile:
         Associate rules with a logical key under this profile.
         """
         self._rules[key] = list(rules)
+        self._changed("add_rules", key)
 
     def get_rules(self, key: str) -> List[Rule]:
         """
@@ -35,7 +71,7 @@ class Profile:
         return self._rules.get(key, [])
 
 
-class ProfileRegistry:
+class ProfileRegistry(VersionedRegistry):
     """
     Registry for validation profiles.
 
@@ -43,13 +79,24 @@ class ProfileRegistry:
     """
 
     def __init__(self):
+        super().__init__()
         self._profiles: Dict[str, Profile] = {}
+        # Active profile names -> flattened rules per key.
+        self._merged: Dict[Tuple[str, ...], Dict[str, List[Rule]]] = {}
+        # (active profile names, class) -> (base plan, merged plan)
+        self._plans: Dict[Tuple[Tuple[str, ...], type], Tuple[Any, Any]] = {}
 
     def register(self, profile: Profile) -> None:
         """
         Register a profile definition.
         """
+        previous = self._profiles.get(profile.name)
+        if previous is not None:
+            previous.unsubscribe(self._profile_changed)
+
         self._profiles[profile.name] = profile
+        profile.subscribe(self._profile_changed)
+        self._changed("register", profile.name)
 
     def get(self, name: str) -> Profile | None:
         """
@@ -59,17 +106,113 @@ class ProfileRegistry:
 
     def resolve_rules(self, key: str) -> List[Rule]:
         """
-        Resolve rules for the given key based on the active profile.
+        Resolve rules for the given key based on the active profiles.
+
+        Rules of all active profiles, including inherited rules,
+        are returned in activation order. Unknown profiles contribute
+        no rules. If no profile is active, an empty list is returned.
 
-        If no profile is active or the profile is unknown,
-        an empty rule list is returned.
+        Raises
+        ------
+        ValueError
+            If the inheritance of an active profile is cyclic.
         """
-        name = current_profile()
-        if name is None:
+        active = active_profiles()
+        if not active:
             return []
 
+        merged = self._merged.get(active)
+        if merged is None:
+            merged = self._merge(active)
+        return merged.get(key, [])
+
+    def bind(self, cls: Type[T]) -> Type[T]:
+        """
+        Bind this registry to a validated dataclass.
+
+        While profiles are active, validate(), is_valid(),
+        collect_errors() and validate_many() on the class also run
+        the profiles' rules for each field, after the field rules.
+        A class is bound to at most one registry.
+
+        Can be used as a class decorator.
+        """
+        if not is_validated_dataclass(cls):
+            raise TypeError(
+                "Only validated dataclasses can be bound to a profile registry."
+            )
+
+        set_plan_resolver(cls, self._resolve_plan)
+        return cls
+
+    def unbind(self, cls: type) -> None:
+        """
+        Remove a binding created by bind(). This operation is idempotent.
+        """
+        clear_plan_resolver(cls, self._resolve_plan)
+
+    def _resolve_plan(self, cls: type, base: Any) -> Any:
+        active = active_profiles()
+        if not active:
+            return base
+
+        key = (active, cls)
+        entry = self._plans.get(key)
+        # The base plan is rebuilt when the type registry changes.
+        if entry is None or entry[0] is not base:
+            merged = self._merged.get(active)
+            if merged is None:
+                merged = self._merge(active)
+            plan = base.extend(merged) if merged else base
+            entry = (base, plan)
+            self._plans[key] = entry
+
+        return entry[1]
+
+    def _merge(self, active: Tuple[str, ...]) -> Dict[str, List[Rule]]:
+        """
+        Flatten the rules of the active profiles and their ancestors.
+        """
+        order: List[Profile] = []
+        seen: Dict[str, None] = {}
+        for name in active:
+            self._linearize(name, seen, (), order)
+
+        merged: Dict[str, List[Rule]] = {}
+        for profile in order:
+            for key, rules in profile._rules.items():
+                merged.setdefault(key, []).extend(rules)
+
+        self._merged[active] = merged
+        return merged
+
+    def _linearize(
+        self,
+        name: str,
+        seen: Dict[str, None],
+        chain: Tuple[str, ...],
+        order: List[Profile],
+    ) -> None:
+        if name in chain:
+            cycle = " -> ".join(chain + (name,))
+            raise ValueError(f"Profile inheritance cycle: {cycle}.")
+        if name in seen:
+            return
+
         profile = self._profiles.get(name)
         if profile is None:
-            return []
+            return
+
+        for parent in profile.extends:
+            self._linearize(parent, seen, chain + (name,), order)
+
+        seen[name] = None
+        order.append(profile)
+
+    def _profile_changed(self, event: str, key: Any) -> None:
+        self._changed(event, key)
 
-        return profile.get_rules(key)
+    def _changed(self, event: str, target: Any) -> None:
+        self._merged.clear()
+        self._plans.clear()
+        super()._changed(event, target)
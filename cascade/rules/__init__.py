@@ -5,18 +5,24 @@ Rules are optional constraints applied after successful type validation.
 They are explicit, composable, and never executed implicitly.
 """
 
-from cascade.rules.base import Rule
+from cascade.rules.base import AsyncRule, Rule
+from cascade.rules.batch import BatchRule, Each
 from cascade.rules.common import (
     Min,
     Max,
     Length,
     Pattern,
 )
+from cascade.rules.fusion import compile_rules
 
 __all__ = [
     "Rule",
+    "AsyncRule",
+    "BatchRule",
+    "Each",
     "Min",
     "Max",
     "Length",
     "Pattern",
+    "compile_rules",
 ]
@@ -45,3 +45,28 @@ class Rule:
             rule_name=self.name,
             message=message,
         )
+
+
+class AsyncRule(Rule):
+    """
+    Reference base class for asynchronous rules.
+
+    Subclasses must implement check() as a coroutine function,
+    e.g. for uniqueness checks that need a database lookup.
+    Async rules are only executed by avalidate().
+    """
+
+    name: str = "async_rule"
+
+    async def __call__(self, value: Any) -> None:
+        await self.check(value)
+
+    async def check(self, value: Any) -> None:
+        """
+        Validate a value.
+
+        Must raise RuleValidationError on failure.
+        """
+        raise NotImplementedError(
+            "AsyncRule.check() must be implemented by subclasses."
+        )
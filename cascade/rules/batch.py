@@ -0,0 +1,170 @@
+"""
+Batched rules for Cascade.
+
+A batch rule answers many values with one bulk call, e.g. a single
+"SELECT ... WHERE id IN (...)" instead of one query per value.
+
+Subclasses of BatchRule implement check_many(values), returning
+which of the given (deduplicated) values are valid. Answers can be
+stored in a pluggable result cache shared across calls.
+
+Execution policies that validate many values at once look for a
+collect_many(values) method and use it instead of calling the rule
+once per value. Each(rule) applies a rule to every element of a
+container and forwards to the bulk path of the wrapped rule.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+)
+
+from cascade.core.errors import RuleValidationError, ValidationError
+from cascade.rules.base import Rule
+
+
+class BatchRule(Rule):
+    """
+    Reference base class for rules with a bulk lookup.
+
+    Subclasses must implement check_many(). Values must be hashable.
+
+    Parameters
+    ----------
+    cache:
+        Optional mapping storing answers per value across calls,
+        e.g. a dict or an LRU mapping. Values found in the cache
+        are not looked up again.
+    """
+
+    name: str = "batch_rule"
+
+    def __init__(self, *, cache: Optional[MutableMapping[Any, bool]] = None):
+        self.cache = cache
+
+    def check_many(self, values: Sequence[Any]) -> Mapping[Any, bool]:
+        """
+        Look up distinct values in bulk.
+
+        Must return a mapping from each given value to True if the
+        value is valid. Values missing from the result are invalid.
+        """
+        raise NotImplementedError(
+            "BatchRule.check_many() must be implemented by subclasses."
+        )
+
+    def message(self, value: Any) -> str:
+        """
+        Build the failure message for an invalid value.
+        """
+        return f"Value {value!r} is not valid."
+
+    def check(self, value: Any) -> None:
+        if not self.resolve((value,))[value]:
+            self.fail(value, self.message(value))
+
+    def resolve(self, values: Iterable[Any]) -> Dict[Any, bool]:
+        """
+        Answer every distinct value, with at most one check_many() call.
+        """
+        answers: Dict[Any, bool] = {}
+        missing = []
+        cache = self.cache
+
+        for value in dict.fromkeys(values):
+            if cache is not None and value in cache:
+                answers[value] = cache[value]
+            else:
+                missing.append(value)
+
+        if missing:
+            found = self.check_many(missing)
+            for value in missing:
+                valid = bool(found.get(value, False))
+                answers[value] = valid
+                if cache is not None:
+                    cache[value] = valid
+
+        return answers
+
+    def collect_many(self, values: Sequence[Any]) -> Dict[int, RuleValidationError]:
+        """
+        Validate many values with one bulk lookup.
+
+        Returns the error check() would raise, per failing index.
+        """
+        answers = self.resolve(values)
+        errors: Dict[int, RuleValidationError] = {}
+        for index, value in enumerate(values):
+            if not answers[value]:
+                errors[index] = self._error(value)
+        return errors
+
+    def _error(self, value: Any) -> RuleValidationError:
+        try:
+            self.fail(value, self.message(value))
+        except RuleValidationError as exc:
+            return exc
+        raise AssertionError("fail() must raise RuleValidationError.")
+
+
+class Each(Rule):
+    """
+    Apply a rule to every element of a container.
+
+    The first failing element's error is raised. If the wrapped rule
+    supports collect_many(), all elements are checked in bulk.
+    """
+
+    name = "each"
+
+    def __init__(self, rule: Any):
+        if not (callable(rule) and hasattr(rule, "name")):
+            raise TypeError("Each() requires a rule with a 'name' attribute.")
+        self.rule = rule
+
+    def check(self, value: Any) -> None:
+        many = getattr(self.rule, "collect_many", None)
+        if many is None:
+            for element in value:
+                self.rule(element)
+            return
+
+        elements = list(value)
+        errors = many(elements)
+        if errors:
+            raise errors[min(errors)]
+
+    def collect_many(self, values: Sequence[Any]) -> Dict[int, Exception]:
+        """
+        Validate many containers, bulk-checking all their elements.
+
+        Returns the error check() would raise, per failing index.
+        """
+        many = getattr(self.rule, "collect_many", None)
+        if many is None:
+            errors: Dict[int, Exception] = {}
+            for index, value in enumerate(values):
+                try:
+                    self.check(value)
+                except ValidationError as exc:
+                    errors[index] = exc
+            return errors
+
+        owners = []
+        elements = []
+        for index, value in enumerate(values):
+            for element in value:
+                owners.append(index)
+                elements.append(element)
+
+        errors = {}
+        # Positions are in order, so the first error per owner wins.
+        for position, exc in sorted(many(elements).items()):
+            errors.setdefault(owners[position], exc)
+        return errors
@@ -7,11 +7,21 @@ These rules cover basic and widely applicable constraints.
 import re
 from typing import Any
 
+from cascade.core.arrays import array_max, array_min, is_numeric_array
 from cascade.rules.base import Rule
 
 
+# Plain scalars skip array detection entirely.
+_SCALAR_TYPES = (int, float)
+
+
 class Min(Rule):
-    """Ensure a numeric value is greater than or equal to a minimum."""
+    """
+    Ensure a numeric value is greater than or equal to a minimum.
+
+    Numeric arrays (array.array, memoryview, NumPy) are checked
+    element-wise with a single min() reduction.
+    """
 
     name = "min"
 
@@ -19,6 +29,16 @@ class Min(Rule):
         self.minimum = minimum
 
     def check(self, value: Any) -> None:
+        if type(value) not in _SCALAR_TYPES and is_numeric_array(value):
+            # Empty arrays have no element to violate the bound.
+            lowest = array_min(value)
+            if lowest is not None and lowest < self.minimum:
+                self.fail(
+                    value,
+                    f"Element {lowest!r} is less than minimum {self.minimum!r}.",
+                )
+            return
+
         if value < self.minimum:
             self.fail(
                 value,
@@ -27,7 +47,12 @@ class Min(Rule):
 
 
 class Max(Rule):
-    """Ensure a numeric value is less than or equal to a maximum."""
+    """
+    Ensure a numeric value is less than or equal to a maximum.
+
+    Numeric arrays (array.array, memoryview, NumPy) are checked
+    element-wise with a single max() reduction.
+    """
 
     name = "max"
 
@@ -35,6 +60,16 @@ class Max(Rule):
         self.maximum = maximum
 
     def check(self, value: Any) -> None:
+        if type(value) not in _SCALAR_TYPES and is_numeric_array(value):
+            # Empty arrays have no element to violate the bound.
+            highest = array_max(value)
+            if highest is not None and highest > self.maximum:
+                self.fail(
+                    value,
+                    f"Element {highest!r} exceeds maximum {self.maximum!r}.",
+                )
+            return
+
         if value > self.maximum:
             self.fail(
                 value,
@@ -0,0 +1,174 @@
+"""
+Rule fusion for Cascade.
+
+compile_rules() turns a rule list into an equivalent, shorter tuple of
+callables. Adjacent built-in rules are merged:
+
+- Min and Max into a single range comparison
+- Length rules into a single len() call
+- Pattern rules into one combined regular expression
+
+A fused checker only decides whether a value passes. If it does not,
+the original rules run in their declared order, so the raised error
+(including which rule is reported) is exactly the same as without
+fusion. Any other rule, including subclasses of the built-in rules,
+is kept as-is and acts as a fusion boundary.
+"""
+
+import math
+import re
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from cascade.rules.common import Length, Max, Min, Pattern
+
+
+RuleCallable = Callable[[Any], None]
+
+_NUMBER_TYPES = (int, float)
+
+
+def compile_rules(rules: Sequence[Any]) -> Tuple[RuleCallable, ...]:
+    """
+    Fuse adjacent built-in rules into single checkers.
+
+    Parameters
+    ----------
+    rules:
+        Rules in declared order.
+
+    Returns
+    -------
+    tuple
+        Callables to run in order instead of the original rules.
+        Each raises the same error the original rules would raise.
+    """
+    compiled: List[RuleCallable] = []
+    group: List[Any] = []
+    group_kind: Optional[str] = None
+
+    for rule in rules:
+        kind = _fusion_kind(rule)
+        if group and kind != group_kind:
+            compiled.append(_fuse(group_kind, group))
+            group = []
+        if kind is None:
+            compiled.append(rule)
+            group_kind = None
+            continue
+        group.append(rule)
+        group_kind = kind
+
+    if group:
+        compiled.append(_fuse(group_kind, group))
+
+    return tuple(compiled)
+
+
+def _fusion_kind(rule: Any) -> Optional[str]:
+    rule_type = type(rule)
+
+    if rule_type is Min:
+        return "range" if _is_plain_bound(rule.minimum) else None
+    if rule_type is Max:
+        return "range" if _is_plain_bound(rule.maximum) else None
+    if rule_type is Length:
+        return "length"
+    if rule_type is Pattern:
+        pattern = rule.pattern
+        # Capture groups could be referenced by number or name, and
+        # flags would leak into the other patterns once combined.
+        if pattern.groups == 0 and pattern.flags == re.UNICODE:
+            return "pattern"
+    return None
+
+
+def _is_plain_bound(bound: Any) -> bool:
+    return type(bound) in _NUMBER_TYPES and not (
+        type(bound) is float and math.isnan(bound)
+    )
+
+
+def _fuse(kind: Optional[str], rules: List[Any]) -> RuleCallable:
+    if len(rules) == 1 and kind == "pattern":
+        # A single regex gains nothing from being rebuilt.
+        return rules[0]
+    if kind == "range":
+        return _fuse_range(tuple(rules))
+    if kind == "length":
+        return _fuse_length(tuple(rules))
+    return _fuse_patterns(tuple(rules))
+
+
+def _run_all(rules: Tuple[Any, ...], value: Any) -> None:
+    for rule in rules:
+        rule(value)
+
+
+def _fuse_range(rules: Tuple[Any, ...]) -> RuleCallable:
+    minima = [rule.minimum for rule in rules if type(rule) is Min]
+    maxima = [rule.maximum for rule in rules if type(rule) is Max]
+    low = max(minima) if minima else None
+    high = min(maxima) if maxima else None
+
+    if high is None:
+
+        def check(value: Any) -> None:
+            if type(value) in _NUMBER_TYPES and low <= value:
+                return
+            _run_all(rules, value)
+
+    elif low is None:
+
+        def check(value: Any) -> None:
+            if type(value) in _NUMBER_TYPES and value <= high:
+                return
+            _run_all(rules, value)
+
+    else:
+
+        def check(value: Any) -> None:
+            if type(value) in _NUMBER_TYPES and low <= value <= high:
+                return
+            _run_all(rules, value)
+
+    return check
+
+
+def _fuse_length(rules: Tuple[Any, ...]) -> RuleCallable:
+    minima = [rule.min for rule in rules if rule.min is not None]
+    maxima = [rule.max for rule in rules if rule.max is not None]
+    low = max(minima) if minima else 0
+    high = min(maxima) if maxima else None
+
+    def check(value: Any) -> None:
+        try:
+            size = len(value)
+        except TypeError:
+            size = None
+
+        if size is not None and low <= size and (high is None or size <= high):
+            return
+        _run_all(rules, value)
+
+    return check
+
+
+def _fuse_patterns(rules: Tuple[Any, ...]) -> RuleCallable:
+    # Each lookahead scans from the start, so the combined pattern
+    # matches exactly when every pattern is found somewhere.
+    try:
+        combined = re.compile(
+            "".join(
+                f"(?=[\\s\\S]*?(?:{rule.pattern.pattern}))" for rule in rules
+            )
+        )
+    except re.error:
+        return lambda value: _run_all(rules, value)
+    match = combined.match
+
+    def check(value: Any) -> None:
+        if type(value) is str and match(value) is not None:
+            return
+        _run_all(rules, value)
+
+    return check
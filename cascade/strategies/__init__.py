@@ -0,0 +1,25 @@
+"""
+Validation strategies for large containers.
+
+Strategies trade completeness for speed by checking only part of
+each container. They are a higher-level policy on top of Cascade Core:
+validate_type itself always checks every element.
+"""
+
+from cascade.strategies.policy import Strategy, Full, Sample, Head, MaxDepth
+from cascade.strategies.engine import (
+    StrategyResult,
+    compile_strategy,
+    validate_with,
+)
+
+__all__ = [
+    "Strategy",
+    "Full",
+    "Sample",
+    "Head",
+    "MaxDepth",
+    "StrategyResult",
+    "compile_strategy",
+    "validate_with",
+]
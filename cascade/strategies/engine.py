@@ -0,0 +1,310 @@
+"""
+Strategy-aware execution of compiled type plans.
+
+A compiled plan from cascade.core.compiler is rewritten so that
+container nodes only visit the elements selected by a strategy,
+and containers below the depth limit are checked by type only.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+
+from cascade.core.compiler import (
+    _cached_plan,
+    _ContainerNode,
+    _InstanceNode,
+    _IterableNode,
+    _MappingNode,
+    _mismatched_types,
+    _Node,
+    _TupleNode,
+    _UnionNode,
+)
+from cascade.core.errors import ErrorDetail, Path, TypeValidationError
+from cascade.core.registry import get_registry_generation
+from cascade.strategies.policy import Strategy
+
+
+class StrategyResult:
+    """
+    Outcome of a successful strategy-based validation.
+
+    The strategy is reported back so callers can tell a full check
+    from a probabilistic or depth-limited one.
+    """
+
+    __slots__ = ("strategy",)
+
+    def __init__(self, strategy: Strategy):
+        self.strategy = strategy
+
+    @property
+    def name(self) -> str:
+        return self.strategy.name
+
+    @property
+    def exhaustive(self) -> bool:
+        return self.strategy.exhaustive
+
+    def __repr__(self) -> str:
+        return f"StrategyResult({self.strategy!r})"
+
+
+class StrategyChecker:
+    """
+    Reusable checker for an annotation under a fixed strategy.
+
+    Like CompiledType, the checker recompiles itself after the type
+    registry has changed.
+    """
+
+    __slots__ = ("expected_type", "strategy", "_node", "_result", "_generation")
+
+    def __init__(self, expected_type: Any, strategy: Strategy):
+        self.expected_type = expected_type
+        self.strategy = strategy
+        self._result = StrategyResult(strategy)
+        self._recompile()
+
+    def __call__(self, value: Any) -> StrategyResult:
+        if self._generation != get_registry_generation():
+            self._recompile()
+        self._node.check(value)
+        return self._result
+
+    def matches(self, value: Any) -> bool:
+        if self._generation != get_registry_generation():
+            self._recompile()
+        return self._node.matches(value)
+
+    def _recompile(self) -> None:
+        self._generation = get_registry_generation()
+        self._node = _apply(_cached_plan(self.expected_type), self.strategy, 0)
+
+    def __repr__(self) -> str:
+        return f"StrategyChecker({self.expected_type!r}, {self.strategy!r})"
+
+
+def compile_strategy(expected_type: Any, strategy: Strategy) -> StrategyChecker:
+    """
+    Compile an annotation into a checker that follows a strategy.
+    """
+    return StrategyChecker(expected_type, strategy)
+
+
+def validate_with(
+    value: Any,
+    expected_type: Any,
+    strategy: Strategy,
+) -> StrategyResult:
+    """
+    Validate a value against an expected type under a strategy.
+
+    Parameters
+    ----------
+    value:
+        The value to be validated.
+    expected_type:
+        The expected Python type or typing construct.
+    strategy:
+        The strategy deciding which container elements are checked.
+
+    Returns
+    -------
+    StrategyResult
+        The result, reporting the strategy that was applied.
+
+    Raises
+    ------
+    TypeValidationError
+        If a checked part of the value does not satisfy the expected type.
+    """
+    try:
+        checker = _checkers.get((expected_type, strategy))
+    except TypeError:
+        # Unhashable annotations are compiled without caching.
+        return StrategyChecker(expected_type, strategy)(value)
+
+    if checker is None:
+        if len(_checkers) >= _CHECKER_CACHE_LIMIT:
+            _checkers.clear()
+        checker = StrategyChecker(expected_type, strategy)
+        _checkers[(expected_type, strategy)] = checker
+    return checker(value)
+
+
+# Checkers used by validate_with, keyed by annotation and strategy.
+# Checkers recompile themselves, so entries never go stale.
+_checkers: Dict[Tuple[Any, Strategy], StrategyChecker] = {}
+_CHECKER_CACHE_LIMIT = 256
+
+
+def _apply(node: _Node, strategy: Strategy, depth: int) -> _Node:
+    """
+    Rewrite a compiled plan so it follows the given strategy.
+    """
+    if type(node) is _UnionNode:
+        return _UnionNode(
+            node.expected_type,
+            tuple(_apply(option, strategy, depth) for option in node.options),
+        )
+
+    if not isinstance(node, (_IterableNode, _MappingNode, _TupleNode)):
+        return node
+
+    if strategy.max_depth is not None and depth >= strategy.max_depth:
+        return _ContainerNode(node.expected_type, node.origin)
+
+    if type(node) is _TupleNode:
+        # Fixed-shape tuples are small by definition and never sampled.
+        return _TupleNode(
+            node.expected_type,
+            tuple(
+                _apply(child, strategy, depth + 1)
+                for _, child in node.positions
+            ),
+        )
+
+    if type(node) is _MappingNode:
+        return _SelectedMappingNode(
+            node.expected_type,
+            node.origin,
+            _apply(node.key_node, strategy, depth + 1),
+            _apply(node.value_node, strategy, depth + 1),
+            strategy,
+        )
+
+    return _SelectedIterableNode(
+        node.expected_type,
+        node.origin,
+        _apply(node.item, strategy, depth + 1),
+        strategy,
+    )
+
+
+def _select(values: Any, strategy: Strategy) -> Iterable[Tuple[int, Any]]:
+    """
+    Yield (position, element) pairs selected by the strategy.
+    """
+    indices = strategy.indices(len(values))
+    if indices is None:
+        return enumerate(values)
+
+    if isinstance(values, (list, tuple)):
+        return zip(indices, map(values.__getitem__, indices))
+
+    if isinstance(indices, range):
+        return zip(indices, islice(values, indices.stop))
+
+    wanted = set(indices)
+    return (
+        (index, element)
+        for index, element in enumerate(values)
+        if index in wanted
+    )
+
+
+class _SelectedIterableNode(_IterableNode):
+    __slots__ = ("strategy",)
+
+    def __init__(
+        self,
+        expected_type: Any,
+        origin: Any,
+        item: _Node,
+        strategy: Strategy,
+    ):
+        super().__init__(expected_type, origin, item)
+        self.strategy = strategy
+
+    def check(self, value: Any) -> None:
+        if self.matches(value):
+            return
+
+        if not isinstance(value, self.origin):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+        check = self.item.check
+        for _, element in _select(value, self.strategy):
+            check(element)
+
+    def matches(self, value: Any) -> bool:
+        if not isinstance(value, self.origin):
+            return False
+
+        item = self.item
+        selected = [element for _, element in _select(value, self.strategy)]
+        if type(item) is _InstanceNode and item.plain:
+            if not _mismatched_types(selected, item.expected_type):
+                return True
+
+        matches = item.matches
+        for element in selected:
+            if not matches(element):
+                return False
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.origin):
+            self._record(value, path, errors)
+            return
+
+        item = self.item
+        for index, element in _select(value, self.strategy):
+            if not item.matches(element):
+                item.collect(element, path + (index,), errors)
+
+
+class _SelectedMappingNode(_MappingNode):
+    __slots__ = ("strategy",)
+
+    def __init__(
+        self,
+        expected_type: Any,
+        origin: Any,
+        key_node: _Node,
+        value_node: _Node,
+        strategy: Strategy,
+    ):
+        super().__init__(expected_type, origin, key_node, value_node)
+        self.strategy = strategy
+
+    def check(self, value: Any) -> None:
+        if not isinstance(value, self.origin):
+            raise TypeValidationError(
+                value=value,
+                expected_type=self.expected_type,
+            )
+
+        check_key = self.key_node.check
+        check_value = self.value_node.check
+        for _, (key, item) in _select(value.items(), self.strategy):
+            check_key(key)
+            check_value(item)
+
+    def matches(self, value: Any) -> bool:
+        if not isinstance(value, self.origin):
+            return False
+
+        matches_key = self.key_node.matches
+        matches_value = self.value_node.matches
+        for _, (key, item) in _select(value.items(), self.strategy):
+            if not (matches_key(key) and matches_value(item)):
+                return False
+        return True
+
+    def collect(self, value: Any, path: Path, errors: List[ErrorDetail]) -> None:
+        if not isinstance(value, self.origin):
+            self._record(value, path, errors)
+            return
+
+        key_node = self.key_node
+        value_node = self.value_node
+        for _, (key, item) in _select(value.items(), self.strategy):
+            if not key_node.matches(key):
+                key_node.collect(key, path + ((key,),), errors)
+            if not value_node.matches(item):
+                value_node.collect(item, path + ((key,),), errors)
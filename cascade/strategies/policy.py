@@ -0,0 +1,159 @@
+"""
+Named validation strategy objects.
+
+A strategy decides which elements of a container are checked.
+Strategies do not perform validation themselves.
+"""
+
+import random
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class Strategy:
+    """
+    Base class for validation strategies.
+
+    Subclasses override indices() to select container elements.
+    The optional max_depth limits how many container levels have
+    their elements checked: 0 checks only the outermost container
+    type, 1 also checks its elements, and so on.
+
+    The built-in strategies compare and hash by their parameters,
+    so equal strategies share compiled checkers.
+    """
+
+    name: str = "strategy"
+
+    def __init__(self, *, max_depth: Optional[int] = None):
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must be non-negative.")
+
+        self.max_depth = max_depth
+
+    @property
+    def exhaustive(self) -> bool:
+        """
+        True if the strategy checks every element at every depth.
+        """
+        return self.max_depth is None and self.selects_all
+
+    @property
+    def selects_all(self) -> bool:
+        """
+        True if indices() always selects every element.
+        """
+        return False
+
+    def indices(self, size: int) -> Optional[Sequence[int]]:
+        """
+        Return the ascending positions to check, or None for all.
+        """
+        return None
+
+    def _key(self) -> Tuple[Any, ...]:
+        # Custom strategies may hold other state; compare by identity.
+        return (type(self), id(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Strategy):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_depth={self.max_depth!r})"
+
+
+class Full(Strategy):
+    """Check every element, optionally up to a maximum depth."""
+
+    name = "full"
+
+    @property
+    def selects_all(self) -> bool:
+        return True
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (type(self), self.max_depth)
+
+
+class MaxDepth(Full):
+    """Check every element, but only up to the given container depth."""
+
+    name = "max_depth"
+
+    def __init__(self, depth: int):
+        super().__init__(max_depth=depth)
+
+    def __repr__(self) -> str:
+        return f"MaxDepth({self.max_depth!r})"
+
+
+class Head(Strategy):
+    """Check only the first n elements of each container."""
+
+    name = "head"
+
+    def __init__(self, n: int, *, max_depth: Optional[int] = None):
+        if n < 0:
+            raise ValueError("Head size must be non-negative.")
+
+        super().__init__(max_depth=max_depth)
+        self.n = n
+
+    def indices(self, size: int) -> Optional[Sequence[int]]:
+        if size <= self.n:
+            return None
+        return range(self.n)
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (type(self), self.n, self.max_depth)
+
+    def __repr__(self) -> str:
+        return f"Head({self.n!r}, max_depth={self.max_depth!r})"
+
+
+class Sample(Strategy):
+    """
+    Check a deterministic random subset of k elements per container.
+
+    The subset only depends on the seed and the container size,
+    so repeated runs check the same positions.
+    """
+
+    name = "sample"
+
+    _CACHE_LIMIT = 256
+
+    def __init__(self, k: int, *, seed: int = 0, max_depth: Optional[int] = None):
+        if k < 0:
+            raise ValueError("Sample size must be non-negative.")
+
+        super().__init__(max_depth=max_depth)
+        self.k = k
+        self.seed = seed
+        self._cache: Dict[int, Sequence[int]] = {}
+
+    def indices(self, size: int) -> Optional[Sequence[int]]:
+        if size <= self.k:
+            return None
+
+        selected = self._cache.get(size)
+        if selected is None:
+            rng = random.Random(self.seed)
+            selected = tuple(sorted(rng.sample(range(size), self.k)))
+            if len(self._cache) >= self._CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[size] = selected
+        return selected
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (type(self), self.k, self.seed, self.max_depth)
+
+    def __repr__(self) -> str:
+        return (
+            f"Sample({self.k!r}, seed={self.seed!r}, "
+            f"max_depth={self.max_depth!r})"
+        )
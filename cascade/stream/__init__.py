@@ -0,0 +1,16 @@
+"""
+Streaming validation for Cascade.
+
+Large newline-delimited JSON inputs are validated record by record
+through a lazy generator pipeline, without loading the input into
+memory. This is an execution policy on top of Cascade Core and the
+validated dataclass decoders.
+"""
+
+from cascade.stream.ndjson import validate_ndjson
+from cascade.stream.readers import iter_lines
+
+__all__ = [
+    "validate_ndjson",
+    "iter_lines",
+]
@@ -0,0 +1,151 @@
+"""
+Streaming validation of newline-delimited JSON.
+
+validate_ndjson() is a generator pipeline: lines are read lazily,
+parsed one at a time and validated one at a time, so only the current
+record is held in memory. Each non-blank line produces one
+(line_no, result) pair, where result is the validated value or a
+ValidationErrors describing why the line failed.
+
+Plain annotations are checked with a compiled validate_type plan.
+Validated dataclasses are decoded with from_dict(), so field rules
+and bound profiles apply exactly as for any other instance.
+"""
+
+import json
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from cascade.core.compiler import compile_type
+from cascade.core.conversion import compile_coercer
+from cascade.core.errors import (
+    CoercionError,
+    ErrorDetail,
+    ValidationError,
+    ValidationErrors,
+)
+from cascade.dataclass.hooks import is_validated_dataclass
+from cascade.stream.readers import DEFAULT_CHUNK_SIZE, Source, iter_lines
+
+
+ON_ERROR = ("skip", "stop")
+
+Validator = Callable[[Any], Any]
+
+
+def validate_ndjson(
+    source: Source,
+    expected_type: Any,
+    *,
+    on_error: str = "skip",
+    coerce: bool = False,
+    reader: str = "buffered",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Lazily validate every line of a newline-delimited JSON input.
+
+    Parameters
+    ----------
+    source:
+        A file path or an open binary (or text) file object.
+    expected_type:
+        The type every line must match, or a validated dataclass
+        to decode every line into.
+    on_error:
+        "skip" yields the errors of a failing line and continues.
+        "stop" yields the errors of the first failing line and
+        ends the stream.
+    coerce:
+        Apply registered coercers before validating.
+    reader, chunk_size:
+        How the input is read, see cascade.stream.iter_lines.
+
+    Returns
+    -------
+    Iterator
+        (line_no, result) pairs with 1-based line numbers. result is
+        the validated value (or instance) or a ValidationErrors.
+        Blank lines are skipped.
+    """
+    if on_error not in ON_ERROR:
+        raise ValueError(f"on_error must be one of {ON_ERROR!r}.")
+
+    lines = iter_lines(source, reader=reader, chunk_size=chunk_size)
+    results = _validate(_parse(lines), _validator(expected_type, coerce))
+    if on_error == "stop":
+        return _until_error(results)
+    return results
+
+
+def _parse(lines: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+    loads = json.loads
+    for line_no, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            yield line_no, loads(line)
+        except ValueError as exc:
+            # JSONDecodeError, or UnicodeDecodeError for bytes input.
+            detail = ErrorDetail(
+                (),
+                "json",
+                "JSON",
+                line,
+                ValidationError(f"Invalid JSON: {exc}.", value=line, expected="JSON"),
+            )
+            yield line_no, ValidationErrors((detail,))
+
+
+def _validate(
+    parsed: Iterable[Tuple[int, Any]],
+    validate: Validator,
+) -> Iterator[Tuple[int, Any]]:
+    for line_no, value in parsed:
+        if type(value) is ValidationErrors:
+            yield line_no, value
+        else:
+            yield line_no, validate(value)
+
+
+def _until_error(results: Iterable[Tuple[int, Any]]) -> Iterator[Tuple[int, Any]]:
+    for line_no, result in results:
+        yield line_no, result
+        if type(result) is ValidationErrors:
+            return
+
+
+def _validator(expected_type: Any, coerce: bool) -> Validator:
+    """
+    Build the per-record validator, returning the value or its errors.
+    """
+    if is_validated_dataclass(expected_type):
+        decode = expected_type.from_dict
+
+        def validate_instance(value: Any) -> Any:
+            try:
+                return decode(value, coerce=coerce)
+            except (ValidationError, CoercionError) as exc:
+                return ValidationErrors((_detail(exc),))
+
+        return validate_instance
+
+    checker = compile_type(expected_type)
+    convert = compile_coercer(expected_type) if coerce else None
+
+    def validate_value(value: Any) -> Any:
+        if convert is not None:
+            try:
+                value = convert(value)
+            except CoercionError as exc:
+                return ValidationErrors((_detail(exc),))
+        if checker.matches(value):
+            return value
+        return checker.collect(value)
+
+    return validate_value
+
+
+def _detail(error: Any) -> ErrorDetail:
+    if isinstance(error, CoercionError):
+        return ErrorDetail((), "coercion", error.target_type, error.value, error)
+    return ErrorDetail.from_error((), error)
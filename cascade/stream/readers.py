@@ -0,0 +1,117 @@
+"""
+Line readers for streaming validation.
+
+Input is read in fixed-size chunks (or through a read-only memory
+map) and split into lines lazily, so memory use is bounded by the
+chunk size and the longest line rather than by the size of the input.
+"""
+
+import mmap
+import os
+from typing import IO, Any, Iterator, List, Union
+
+
+READERS = ("buffered", "mmap")
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+Source = Union[str, "os.PathLike[str]", IO[Any]]
+
+
+def iter_lines(
+    source: Source,
+    *,
+    reader: str = "buffered",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Lazily iterate over the lines of a file or stream.
+
+    Parameters
+    ----------
+    source:
+        A file path, or an open file object. Binary streams yield
+        bytes, text streams yield str. Paths are opened in binary
+        mode and closed once the iterator is exhausted or closed.
+    reader:
+        "buffered" reads chunks of chunk_size with read().
+        "mmap" maps the whole file read-only and requires a real
+        file; it always starts at the beginning of the file.
+    chunk_size:
+        Size of each read() call for the buffered reader.
+
+    Returns
+    -------
+    Iterator
+        The lines without their line terminators.
+    """
+    if reader not in READERS:
+        raise ValueError(f"reader must be one of {READERS!r}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    if isinstance(source, (str, os.PathLike)):
+        return _open_lines(source, reader, chunk_size)
+    return _lines(source, reader, chunk_size)
+
+
+def _open_lines(path: Any, reader: str, chunk_size: int) -> Iterator[Any]:
+    with open(path, "rb") as stream:
+        yield from _lines(stream, reader, chunk_size)
+
+
+def _lines(stream: IO[Any], reader: str, chunk_size: int) -> Iterator[Any]:
+    if reader == "mmap":
+        return _mmap_lines(stream)
+    return _buffered_lines(stream, chunk_size)
+
+
+def _buffered_lines(stream: IO[Any], chunk_size: int) -> Iterator[Any]:
+    read = stream.read
+    chunk = read(chunk_size)
+    if not chunk:
+        return
+
+    newline = "\n" if isinstance(chunk, str) else b"\n"
+    empty = chunk[:0]
+    # Pieces of a line spanning several chunks, joined once complete.
+    parts: List[Any] = []
+
+    while chunk:
+        lines = chunk.split(newline)
+        if len(lines) > 1:
+            parts.append(lines[0])
+            yield _strip_cr(empty.join(parts))
+            for index in range(1, len(lines) - 1):
+                yield _strip_cr(lines[index])
+            parts = []
+        if lines[-1]:
+            parts.append(lines[-1])
+        chunk = read(chunk_size)
+
+    if parts:
+        yield _strip_cr(empty.join(parts))
+
+
+def _mmap_lines(stream: IO[Any]) -> Iterator[bytes]:
+    fileno = stream.fileno()
+    if os.fstat(fileno).st_size == 0:
+        # Empty files cannot be mapped.
+        return
+
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as view:
+        find = view.find
+        start = 0
+        end = len(view)
+        while start < end:
+            stop = find(b"\n", start)
+            if stop < 0:
+                stop = end
+            yield _strip_cr(view[start:stop])
+            start = stop + 1
+
+
+def _strip_cr(line: Any) -> Any:
+    if line[-1:] in ("\r", b"\r"):
+        return line[:-1]
+    return line
@@ -12,6 +12,12 @@ import cascade.core.errors as core_errors
 import cascade.core.types as core_types
 import cascade.core.registry as core_registry
 import cascade.core.coercion as core_coercion
+import cascade.core.compiler as core_compiler
+import cascade.core.batch as core_batch
+import cascade.core.cache as core_cache
+import cascade.core.conversion as core_conversion
+import cascade.core.arrays as core_arrays
+import cascade.core.parallel as core_parallel
 
 
 FORBIDDEN_MODULE_PREFIXES = (
@@ -19,6 +25,7 @@ FORBIDDEN_MODULE_PREFIXES = (
     "cascade.profiles",
     "cascade.dataclass",
     "cascade.jit",
+    "cascade.stream",
 )
 
 
@@ -59,3 +66,27 @@ def test_core_registry_has_no_upward_dependencies():
 
 def test_core_coercion_has_no_upward_dependencies():
     assert not _has_forbidden_imports(core_coercion)
+
+
+def test_core_compiler_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_compiler)
+
+
+def test_core_batch_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_batch)
+
+
+def test_core_cache_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_cache)
+
+
+def test_core_conversion_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_conversion)
+
+
+def test_core_arrays_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_arrays)
+
+
+def test_core_parallel_has_no_upward_dependencies():
+    assert not _has_forbidden_imports(core_parallel)
@@ -28,3 +28,20 @@ def _has_forbidden_imports(module) -> bool:
 
 def test_validated_dataclass_has_no_profile_dependency():
     assert not _has_forbidden_imports(validated)
+
+
+def test_profiles_use_only_public_dataclass_hooks():
+    import cascade.profiles.manager as manager
+
+    tree = ast.parse(inspect.getsource(manager))
+    imported = [
+        alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+        and node.module
+        and node.module.startswith("cascade.dataclass")
+        for alias in node.names
+    ]
+
+    assert imported
+    assert not [name for name in imported if name.startswith("_")]
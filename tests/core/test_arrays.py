@@ -0,0 +1,65 @@
+import array
+from typing import Collection, List, Sequence
+
+import pytest
+
+from cascade.core.arrays import (
+    array_element_type,
+    array_max,
+    array_min,
+    is_numeric_array,
+)
+from cascade.core.errors import TypeValidationError
+from cascade.core.types import is_instance_of, validate_type
+
+
+def test_array_element_types():
+    assert array_element_type(array.array("d", [1.0])) is float
+    assert array_element_type(array.array("q", [1])) is int
+    assert array_element_type(memoryview(b"ab")) is int
+    assert array_element_type(memoryview(b"ab").cast("c")) is bytes
+    assert array_element_type([1.0, 2.0]) is None
+
+
+def test_typed_arrays_are_checked_by_element_type(monkeypatch):
+    import cascade.core.compiler as compiler
+
+    def fail(values, item_type):
+        raise AssertionError("elements should not be inspected")
+
+    monkeypatch.setattr(compiler, "_mismatched_types", fail)
+
+    validate_type(array.array("d", [0.5] * 1000), Sequence[float])
+    assert is_instance_of(memoryview(b"\x00\x01"), Sequence[int])
+
+
+def test_array_element_type_mismatch_reports_element():
+    with pytest.raises(TypeValidationError) as exc_info:
+        validate_type(array.array("i", [1, 2]), Sequence[float])
+
+    assert exc_info.value.value == 1
+    assert not is_instance_of(array.array("i", [1]), List[int])
+
+
+def test_array_reductions():
+    values = array.array("d", [3.0, -1.5, 2.0])
+
+    assert array_min(values) == -1.5
+    assert array_max(values) == 3.0
+    assert array_min(array.array("d")) is None
+    assert array_min([1, 2]) is None
+    assert array_min(array.array("u", "ab")) is None
+    assert is_numeric_array(array.array("d"))
+    assert not is_numeric_array(array.array("u", "ab"))
+
+
+def test_numpy_arrays_are_checked_by_dtype():
+    numpy = pytest.importorskip("numpy")
+
+    frame = numpy.linspace(0.0, 1.0, 100)
+
+    validate_type(frame, Collection[float])
+    assert is_instance_of(numpy.arange(3), Collection[int])
+    assert not is_instance_of(frame, Collection[int])
+    assert array_min(frame) == 0.0
+    assert array_max(frame) == 1.0
@@ -0,0 +1,70 @@
+from typing import Dict, List, Optional
+
+from cascade.core.batch import validate_many
+from cascade.core.errors import TypeValidationError
+from cascade.core.registry import register_type, clear_registry
+
+
+def setup_function():
+    clear_registry()
+
+
+def test_homogeneous_batch_passes():
+    report = validate_many(list(range(1000)), int)
+
+    assert report.ok
+    assert report.total == 1000
+    assert report.failed_indices == ()
+
+
+def test_batch_reports_every_failing_index():
+    report = validate_many([1, "a", 2, 3.5, 4], int)
+
+    assert not report.ok
+    assert report.failed_indices == (1, 3)
+    assert isinstance(report.errors[1], TypeValidationError)
+    assert report.errors[3].value == 3.5
+
+
+def test_batch_accepts_subclasses():
+    report = validate_many([True, 1, False], int)
+
+    assert report.ok
+
+
+def test_batch_of_generic_values():
+    report = validate_many([[1, 2], [3, "x"], [], "nope"], List[int])
+
+    assert report.failed_indices == (1, 3)
+    assert report.errors[1].value == "x"
+
+
+def test_batch_of_nested_generic_values():
+    report = validate_many(
+        [{"a": None}, {"a": 1}, {"a": "x"}],
+        Dict[str, Optional[int]],
+    )
+
+    assert report.failed_indices == (2,)
+
+
+def test_batch_accepts_iterables():
+    report = validate_many((str(i) for i in range(3)), str)
+
+    assert report.ok
+    assert report.total == 3
+
+
+def test_batch_uses_registered_validators():
+    class UserId(int):
+        pass
+
+    def validate_user_id(value):
+        if not isinstance(value, UserId):
+            raise TypeValidationError(value=value, expected_type=UserId)
+
+    register_type(UserId, validate_user_id)
+
+    report = validate_many([UserId(1), 2], UserId)
+
+    assert report.failed_indices == (1,)
@@ -0,0 +1,110 @@
+import gc
+import pytest
+from dataclasses import dataclass
+from typing import FrozenSet, List, Tuple
+
+from cascade.core.cache import ValidationCache
+from cascade.core.errors import TypeValidationError
+from cascade.core.registry import register_type, clear_registry
+
+
+def setup_function():
+    clear_registry()
+
+
+def test_frozenset_hits_after_first_success():
+    cache = ValidationCache()
+    table = frozenset(range(100))
+
+    assert cache.validate(table, FrozenSet[int]) is True
+    assert cache.validate(table, FrozenSet[int]) is True
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_tuple_of_primitives_is_keyed_by_content():
+    cache = ValidationCache()
+
+    cache.validate((1, "a"), Tuple[int, str])
+    cache.validate((1, "a"), Tuple[int, str])
+
+    assert cache.hits == 1
+
+
+def test_content_key_distinguishes_element_types():
+    from typing import Literal
+
+    cache = ValidationCache()
+    cache.validate((1,), Tuple[Literal[1]])
+
+    with pytest.raises(TypeValidationError):
+        cache.validate((True,), Tuple[Literal[1]])
+
+
+def test_failures_are_not_cached():
+    cache = ValidationCache()
+
+    for _ in range(2):
+        with pytest.raises(TypeValidationError):
+            cache.validate(frozenset({"x"}), FrozenSet[int])
+
+    assert len(cache) == 0
+    assert cache.misses == 2
+
+
+def test_mutable_values_bypass_the_cache():
+    cache = ValidationCache()
+
+    cache.validate([1, 2], List[int])
+    cache.validate([1, 2], List[int])
+
+    assert cache.cache_info() == (0, 0, 1024, 0)
+
+
+def test_frozen_dataclass_entries_die_with_the_value():
+    @dataclass(frozen=True)
+    class Config:
+        name: str
+
+    cache = ValidationCache()
+    config = Config("a")
+
+    cache.validate(config, Config)
+    assert len(cache) == 1
+
+    del config
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = ValidationCache(maxsize=2)
+
+    cache.validate((1,), Tuple[int])
+    cache.validate((2,), Tuple[int])
+    cache.validate((1,), Tuple[int])
+    cache.validate((3,), Tuple[int])
+
+    assert len(cache) == 2
+    cache.validate((2,), Tuple[int])
+    assert cache.hits == 1
+
+
+def test_registry_changes_invalidate_the_cache():
+    class Code(str):
+        pass
+
+    cache = ValidationCache()
+    cache.validate((Code("a"),), Tuple[str])
+    table = frozenset({Code("a")})
+    cache.validate(table, FrozenSet[Code])
+
+    def reject(value):
+        raise TypeValidationError(value=value, expected_type=Code)
+
+    register_type(Code, reject)
+
+    with pytest.raises(TypeValidationError):
+        cache.validate(table, FrozenSet[Code])
@@ -46,3 +46,78 @@ def test_unregister_coercer():
     unregister_coercer(int)
 
     assert can_coerce("123", int) is False
+
+
+def test_coercion_generation_and_subscriptions():
+    from cascade.core.coercion import get_coercion_generation, subscribe_coercers
+
+    events = []
+    unsubscribe = subscribe_coercers(lambda event, target: events.append(event))
+    start = get_coercion_generation()
+
+    register_coercer(int, int)
+    unregister_coercer(int)
+    unsubscribe()
+    register_coercer(int, int)
+
+    assert get_coercion_generation() == start + 3
+    assert events == ["register", "unregister"]
+
+
+def test_coercion_chain_uses_registered_edges():
+    from decimal import Decimal
+
+    register_coercer(str, lambda value: value.decode(), source=bytes)
+    register_coercer(Decimal, Decimal, source=str)
+
+    assert coerce(b"1.5", Decimal) == Decimal("1.5")
+    assert can_coerce(b"1.5", Decimal) is True
+    assert can_coerce(1.5, Decimal) is False
+
+
+def test_coercion_chain_prefers_cheapest_path():
+    calls = []
+
+    def direct(value):
+        calls.append("direct")
+        return int(value)
+
+    def via_float(value):
+        calls.append("float")
+        return float(value)
+
+    register_coercer(int, direct, source=str, cost=5)
+    register_coercer(float, via_float, source=str)
+    register_coercer(int, int, source=float)
+
+    assert coerce("3", int) == 3
+    assert calls == ["float"]
+
+
+def test_edges_apply_to_subclasses_and_take_precedence():
+    class Name(str):
+        pass
+
+    register_coercer(int, lambda value: -1)
+    register_coercer(int, len, source=str)
+
+    assert coerce(Name("abc"), int) == 3
+    assert coerce(2.5, int) == -1
+
+    unregister_coercer(int, source=str)
+    assert coerce(Name("abc"), int) == -1
+
+
+def test_instances_of_target_type_never_route_through_edges():
+    register_coercer(int, int, source=str)
+    register_coercer(str, str, source=int)
+
+    for value, target in (("abc", str), (5, int), (True, int)):
+        assert not can_coerce(value, target)
+        with pytest.raises(CoercionError, match="No coercer registered"):
+            coerce(value, target)
+
+    register_coercer(str, str.strip)
+    register_coercer(int, int)
+    assert coerce(" abc ", str) == "abc"
+    assert coerce(True, int) == 1
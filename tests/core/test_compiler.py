@@ -0,0 +1,253 @@
+import pytest
+from typing import Any, Dict, List, Optional, Union
+
+from cascade.core.compiler import compile_type
+from cascade.core.errors import TypeValidationError
+from cascade.core.registry import register_type, clear_registry
+
+
+def setup_function():
+    clear_registry()
+
+
+def test_compiled_builtin_type():
+    check = compile_type(int)
+
+    assert check(10) is True
+
+    with pytest.raises(TypeValidationError):
+        check("10")
+
+
+def test_compiled_any_always_passes():
+    assert compile_type(Any)(object()) is True
+
+
+def test_compiled_optional_type():
+    check = compile_type(Optional[int])
+
+    assert check(None) is True
+    assert check(5) is True
+
+    with pytest.raises(TypeValidationError):
+        check("x")
+
+
+def test_compiled_nested_generic():
+    check = compile_type(List[Dict[str, Optional[int]]])
+
+    assert check([{"a": 1, "b": None}, {}]) is True
+
+    with pytest.raises(TypeValidationError):
+        check([{"a": "x"}])
+
+    with pytest.raises(TypeValidationError):
+        check([{1: 1}])
+
+    with pytest.raises(TypeValidationError):
+        check({"a": 1})
+
+
+def test_compiled_error_reports_failing_element():
+    check = compile_type(List[int])
+
+    with pytest.raises(TypeValidationError) as exc_info:
+        check([1, 2, "x"])
+
+    assert exc_info.value.value == "x"
+    assert exc_info.value.expected is int
+
+
+def test_compiled_union_error_reports_union():
+    check = compile_type(Union[int, str])
+
+    with pytest.raises(TypeValidationError) as exc_info:
+        check(1.5)
+
+    assert exc_info.value.expected == Union[int, str]
+
+
+def test_compiled_custom_registered_type():
+    class UserId(int):
+        pass
+
+    def validate_user_id(value):
+        if not isinstance(value, UserId):
+            raise ValueError("not a user id")
+
+    register_type(UserId, validate_user_id)
+    check = compile_type(List[UserId])
+
+    assert check([UserId(1)]) is True
+
+    with pytest.raises(TypeValidationError) as exc_info:
+        check([1])
+
+    assert "not a user id" in str(exc_info.value)
+
+
+def test_compiled_checker_is_reusable():
+    check = compile_type(Dict[str, List[int]])
+
+    for _ in range(3):
+        assert check({"a": [1, 2], "b": []}) is True
+
+
+def test_collect_reports_every_failure_with_paths():
+    from cascade.core.compiler import collect_type_errors
+
+    errors = collect_type_errors(
+        [{"a": 1}, {"b": "x"}, "nope", {"c": "y", 1: 2}],
+        List[Dict[str, int]],
+    )
+
+    assert [detail.location for detail in errors] == [
+        "[1]['b']",
+        "[2]",
+        "[3]['c']",
+        "[3][1]",
+    ]
+    assert all(detail.code == "type" for detail in errors)
+
+
+def test_collect_on_valid_value_is_empty():
+    errors = compile_type(List[int]).collect([1, 2, 3])
+
+    assert len(errors) == 0
+    assert not errors
+
+
+def test_fixed_shape_tuple_checks_each_position():
+    from typing import Tuple
+
+    check = compile_type(Tuple[int, str])
+
+    assert check((1, "a")) is True
+
+    with pytest.raises(TypeValidationError) as exc_info:
+        check((1, 2))
+    assert exc_info.value.value == 2
+
+    with pytest.raises(TypeValidationError):
+        check((1, "a", "b"))
+
+    with pytest.raises(TypeValidationError):
+        check([1, "a"])
+
+
+def test_variadic_and_empty_tuples():
+    from typing import Tuple
+
+    assert compile_type(Tuple[int, ...])((1, 2, 3)) is True
+    assert compile_type(tuple[()])(()) is True
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Tuple[int, ...])((1, "x"))
+
+    with pytest.raises(TypeValidationError):
+        compile_type(tuple[()])((1,))
+
+
+def test_literal_uses_value_and_type():
+    from typing import Literal
+
+    check = compile_type(Literal["a", "b", 1])
+
+    assert check("a") is True
+    assert check(1) is True
+
+    with pytest.raises(TypeValidationError):
+        check("c")
+
+    with pytest.raises(TypeValidationError):
+        check(True)
+
+    with pytest.raises(TypeValidationError):
+        check([])
+
+
+def test_annotated_and_final_check_inner_type():
+    from typing import Annotated, Final
+
+    assert compile_type(Annotated[int, "meta"])(1) is True
+    assert compile_type(Final[int])(1) is True
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Annotated[List[int], "meta"])(["x"])
+
+
+def test_callable_and_type_annotations():
+    from typing import Callable, Type
+
+    assert compile_type(Callable[[int], str])(str) is True
+    assert compile_type(Type[int])(bool) is True
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Callable[[int], str])(1)
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Type[int])(str)
+
+
+def test_abstract_collections_check_items():
+    from collections.abc import Mapping, Sequence
+
+    assert compile_type(Sequence[int])((1, 2)) is True
+    assert compile_type(Mapping[str, int])({"a": 1}) is True
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Sequence[int])([1, "x"])
+
+    with pytest.raises(TypeValidationError):
+        compile_type(Mapping[str, int])({"a": "x"})
+
+
+def test_pep_604_union():
+    check = compile_type(int | None)
+
+    assert check(None) is True
+    assert check(1) is True
+
+    with pytest.raises(TypeValidationError):
+        check("x")
+
+    with pytest.raises(TypeValidationError):
+        compile_type(list[int] | None)(["x"])
+
+
+def test_iterators_are_not_consumed():
+    from typing import Iterator
+
+    items = iter([1, "x"])
+
+    assert compile_type(Iterator[int])(items) is True
+    assert list(items) == [1, "x"]
+
+
+def test_collect_on_fixed_tuple():
+    from typing import Tuple
+
+    errors = compile_type(List[Tuple[int, str]]).collect([(1, "a"), ("x", 2)])
+
+    assert [detail.location for detail in errors] == ["[1][0]", "[1][1]"]
+
+
+def test_compiled_checker_recompiles_after_registry_change():
+    class Token(str):
+        pass
+
+    check = compile_type(List[Token])
+    assert check([Token("a")]) is True
+    assert check.stale is False
+
+    def reject(value):
+        raise ValueError("rejected")
+
+    register_type(Token, reject)
+    assert check.stale is True
+
+    with pytest.raises(TypeValidationError):
+        check([Token("a")])
+
+    assert check.stale is False
+    assert check.matches([Token("a")]) is False
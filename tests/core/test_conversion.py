@@ -0,0 +1,96 @@
+import pytest
+from typing import Dict, List, Optional, Set, Tuple
+
+from cascade.core.coercion import clear_coercers, register_coercer
+from cascade.core.conversion import compile_coercer
+from cascade.core.errors import CoercionError
+from cascade.core.registry import clear_registry
+
+
+def setup_function():
+    clear_coercers()
+    clear_registry()
+
+
+def test_leaf_coercion():
+    register_coercer(int, int)
+
+    assert compile_coercer(int)("12") == 12
+
+
+def test_values_of_the_right_type_are_returned_as_is():
+    convert = compile_coercer(List[Dict[str, int]])
+    value = [{"a": 1}, {"b": 2}]
+
+    assert convert(value) is value
+
+
+def test_nested_coercion_copies_only_changed_containers():
+    register_coercer(int, int)
+    convert = compile_coercer(List[Dict[str, int]])
+
+    untouched = {"a": 1}
+    value = [untouched, {"b": "2", "c": 3}]
+
+    result = convert(value)
+
+    assert result == [{"a": 1}, {"b": 2, "c": 3}]
+    assert result is not value
+    assert result[0] is untouched
+    assert value[1] == {"b": "2", "c": 3}
+
+
+def test_optional_coercion():
+    register_coercer(int, int)
+    convert = compile_coercer(Optional[int])
+
+    assert convert(None) is None
+    assert convert("5") == 5
+
+
+def test_json_arrays_become_tuples_and_sets():
+    register_coercer(int, int)
+
+    assert compile_coercer(Tuple[int, str])(["1", "a"]) == (1, "a")
+    assert compile_coercer(Tuple[int, ...])([1, "2"]) == (1, 2)
+    assert compile_coercer(Set[int])(["1", 2]) == {1, 2}
+
+
+def test_missing_coercer_raises():
+    with pytest.raises(CoercionError):
+        compile_coercer(List[int])(["1"])
+
+
+def test_coercer_result_is_checked():
+    register_coercer(int, lambda value: "not-int")
+
+    with pytest.raises(CoercionError):
+        compile_coercer(List[int])(["1"])
+
+
+def test_failing_coercer_is_wrapped():
+    register_coercer(int, int)
+
+    with pytest.raises(CoercionError):
+        compile_coercer(Dict[str, int])({"a": "x"})
+
+
+def test_converter_follows_registry_changes():
+    convert = compile_coercer(int)
+
+    with pytest.raises(CoercionError):
+        convert("1")
+
+    register_coercer(int, int)
+    assert convert("1") == 1
+
+
+def test_leaf_coercion_dispatches_on_value_type():
+    register_coercer(str, lambda value: value.decode(), source=bytes)
+    register_coercer(int, int, source=str)
+
+    convert = compile_coercer(List[int])
+
+    assert convert([b"1", "2", 3]) == [1, 2, 3]
+    with pytest.raises(CoercionError):
+        convert([1.5])
@@ -27,3 +27,85 @@ def test_rule_validation_error_contains_rule_name():
 def test_coercion_error_is_not_validation_error():
     err = CoercionError(value="1", target_type=int)
     assert not isinstance(err, ValidationError)
+
+
+def test_validation_errors_is_validation_error():
+    from cascade.core.errors import ValidationErrors
+
+    assert issubclass(ValidationErrors, ValidationError)
+    assert not ValidationErrors()
+
+
+def test_error_detail_location_rendering():
+    from cascade.core.errors import ErrorDetail
+
+    detail = ErrorDetail(("items", 3, "price"), "type", int, "x")
+    assert detail.location == "items[3].price"
+
+    detail = ErrorDetail(("scores", ("alice",)), "type", int, "x")
+    assert detail.location == "scores['alice']"
+
+
+def test_error_detail_message_is_rendered_on_access():
+    from cascade.core.errors import ErrorDetail, ValidationErrors
+
+    detail = ErrorDetail(("age",), "type", int, "x")
+    errors = ValidationErrors([detail])
+
+    assert "Expected value of type" in detail.message
+    assert "age:" in str(errors)
+
+
+def test_messages_are_rendered_lazily():
+    class ExplodingRepr:
+        def __repr__(self):
+            raise AssertionError("repr must not be called")
+
+    err = TypeValidationError(value=ExplodingRepr(), expected_type=int)
+
+    assert err.value is not None
+    assert err.expected is int
+
+
+def test_message_repr_is_truncated():
+    from cascade.core.errors import get_repr_limit, set_repr_limit
+
+    previous = get_repr_limit()
+    set_repr_limit(50)
+    try:
+        err = TypeValidationError(value="x" * 10_000, expected_type=int)
+        assert len(str(err)) < 200
+
+        err = RuleValidationError(value=list(range(10_000)), rule_name="min")
+        assert len(str(err)) < 200
+    finally:
+        set_repr_limit(previous)
+
+
+def test_explicit_message_is_kept():
+    err = TypeValidationError(value=1, expected_type=str, message="custom")
+
+    assert str(err) == "custom"
+    assert err.message == "custom"
+    assert err.args == ("custom",)
+    assert CascadeError("plain").args == ("plain",)
+
+
+def test_errors_are_picklable():
+    import pickle
+
+    err = pickle.loads(pickle.dumps(RuleValidationError(value=3, rule_name="min")))
+
+    assert isinstance(err, RuleValidationError)
+    assert err.rule_name == "min"
+    assert err.value == 3
+    assert "min" in str(err)
+
+
+def test_pickled_errors_keep_args():
+    import pickle
+
+    err = pickle.loads(pickle.dumps(CascadeError("plain")))
+
+    assert err.args == ("plain",)
+    assert str(err) == "plain"
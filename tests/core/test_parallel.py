@@ -0,0 +1,70 @@
+import pytest
+
+from cascade.core.batch import validate_many
+from cascade.core.coercion import (
+    _registry as _coercion_registry,
+    can_coerce,
+    clear_coercers,
+    register_coercer,
+)
+from cascade.core.errors import TypeValidationError
+from cascade.core.parallel import _install_registries, run_chunks
+from cascade.core.registry import (
+    _registry,
+    clear_registry,
+    get_registered_validator,
+    register_type,
+)
+
+
+class Even(int):
+    pass
+
+
+def validate_even(value):
+    if not isinstance(value, int) or value % 2:
+        raise TypeValidationError(value=value, expected_type=Even)
+
+
+def setup_function():
+    clear_registry()
+    clear_coercers()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_report_matches_sequential(executor):
+    values = [1, "a", 2, 3.5] * 50
+
+    report = validate_many(values, int, workers=3, executor=executor)
+
+    assert report.total == 200
+    assert report.failed_indices == validate_many(values, int).failed_indices
+    assert isinstance(report.errors[1], TypeValidationError)
+
+
+def test_process_workers_use_registered_validators():
+    register_type(Even, validate_even)
+
+    report = validate_many([2, 3, 4, 5], Even, workers=2)
+
+    assert report.failed_indices == (1, 3)
+
+
+def test_worker_initializer_installs_registry_snapshot():
+    register_type(Even, validate_even)
+    register_coercer(int, int)
+    snapshot = (_registry.snapshot(), _coercion_registry.snapshot())
+
+    clear_registry()
+    clear_coercers()
+    _install_registries(*snapshot)
+
+    assert get_registered_validator(Even) is validate_even
+    assert can_coerce("1", int)
+
+
+def test_run_chunks_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        run_chunks(dict, [1], (), workers=2, executor="fiber")
+    with pytest.raises(ValueError):
+        run_chunks(dict, [1], (), workers=0)
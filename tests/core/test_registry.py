@@ -34,3 +34,111 @@ def test_registry_is_global():
 
     register_type(str, validator)
     assert get_registered_validator(str) is validator
+
+
+def test_registry_generation_changes_on_updates():
+    from cascade.core.registry import get_registry_generation
+
+    def validator(value):
+        pass
+
+    start = get_registry_generation()
+    register_type(int, validator)
+    unregister_type(int)
+
+    assert get_registry_generation() == start + 2
+
+
+def test_subscribers_receive_change_events():
+    from cascade.core.registry import subscribe_registry
+
+    events = []
+
+    def listener(event, target):
+        events.append((event, target))
+
+    unsubscribe = subscribe_registry(listener)
+
+    def validator(value):
+        pass
+
+    register_type(int, validator)
+    unregister_type(int)
+    clear_registry()
+    unsubscribe()
+    register_type(str, validator)
+
+    assert events == [("register", int), ("unregister", int), ("clear", None)]
+
+
+def test_inherited_validator_resolves_through_mro():
+    from cascade.core.registry import resolve_validator
+
+    class UserId(int):
+        pass
+
+    class AdminId(UserId):
+        pass
+
+    def validator(value):
+        pass
+
+    register_type(UserId, validator, inherit=True)
+
+    assert resolve_validator(AdminId) is validator
+    assert get_registered_validator(AdminId) is None
+
+
+def test_exact_registration_wins_over_inherited():
+    from cascade.core.registry import resolve_validator
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    def base_validator(value):
+        pass
+
+    def child_validator(value):
+        pass
+
+    register_type(Base, base_validator, inherit=True)
+    register_type(Child, child_validator)
+
+    assert resolve_validator(Child) is child_validator
+
+
+def test_resolution_cache_follows_registry_changes():
+    from cascade.core.registry import resolve_validator
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    def validator(value):
+        pass
+
+    register_type(Base, validator)
+    assert resolve_validator(Child) is None
+
+    register_type(Base, validator, inherit=True)
+    assert resolve_validator(Child) is validator
+
+    unregister_type(Base)
+    assert resolve_validator(Child) is None
+
+
+def test_unhashable_annotations_resolve_to_no_validator():
+    from typing import Annotated
+
+    from cascade.core.registry import resolve_validator
+    from cascade.core.types import validate_type
+
+    annotation = Annotated[int, {"unit": "ms"}]
+
+    assert resolve_validator(annotation) is None
+    assert validate_type(1, annotation) is True
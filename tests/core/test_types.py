@@ -59,3 +59,83 @@ def test_custom_registered_type():
 
     with pytest.raises(TypeValidationError):
         validate_type(1, UserId)
+
+
+def test_is_instance_of_returns_bool():
+    from cascade.core.types import is_instance_of
+
+    assert is_instance_of(5, Optional[int]) is True
+    assert is_instance_of("x", Optional[int]) is False
+    assert is_instance_of([1, "x"], List[int]) is False
+    assert is_instance_of({"a": [1]}, Dict[str, List[int]]) is True
+
+
+def test_is_instance_of_with_failing_custom_validator():
+    from cascade.core.types import is_instance_of
+
+    class UserId(int):
+        pass
+
+    def validate_user_id(value):
+        raise ValueError("never valid")
+
+    register_type(UserId, validate_user_id)
+
+    assert is_instance_of(UserId(1), UserId) is False
+
+
+def test_union_rejection_does_not_raise_per_member(monkeypatch):
+    from typing import Union
+
+    created = []
+    original_init = TypeValidationError.__init__
+
+    def counting_init(self, **kwargs):
+        created.append(kwargs["expected_type"])
+        original_init(self, **kwargs)
+
+    monkeypatch.setattr(TypeValidationError, "__init__", counting_init)
+
+    assert validate_type("x", Union[int, float, bytes, str]) is True
+    assert created == []
+
+    with pytest.raises(TypeValidationError):
+        validate_type(None, Union[int, float, str])
+    assert created == [Union[int, float, str]]
+
+
+def test_registry_changes_apply_to_validate_type():
+    class Token(str):
+        pass
+
+    assert validate_type(Token("a"), Token) is True
+
+    def reject(value):
+        raise TypeValidationError(value=value, expected_type=Token)
+
+    register_type(Token, reject)
+
+    with pytest.raises(TypeValidationError):
+        validate_type(Token("a"), Token)
+
+
+def test_inherited_validator_applies_to_subclasses():
+    class UserId(int):
+        pass
+
+    class AdminId(UserId):
+        pass
+
+    def validate_user_id(value):
+        if value <= 0:
+            raise ValueError("user ids are positive")
+
+    register_type(UserId, validate_user_id, inherit=True)
+
+    assert validate_type(AdminId(1), AdminId) is True
+
+    with pytest.raises(TypeValidationError):
+        validate_type(AdminId(0), AdminId)
+
+    with pytest.raises(TypeValidationError):
+        validate_type(UserId(1), AdminId)
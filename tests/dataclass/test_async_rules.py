@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.errors import RuleValidationError, TypeValidationError
+from cascade.profiles import Profile, ProfileRegistry, current_profile, use_profile
+from cascade.rules import AsyncRule, Min
+
+
+class Unique(AsyncRule):
+    name = "unique"
+
+    def __init__(self, taken, delay=0.0, log=None):
+        self.taken = taken
+        self.delay = delay
+        self.log = log
+
+    async def check(self, value):
+        if self.log is not None:
+            self.log.append(("start", value, current_profile()))
+        await asyncio.sleep(self.delay)
+        if self.log is not None:
+            self.log.append(("end", value))
+        if value in self.taken:
+            self.fail(value, "Value is already taken.")
+
+
+def test_avalidate_runs_async_rules():
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique({"a@x"})])
+
+    asyncio.run(User(email="b@x").avalidate())
+
+    with pytest.raises(RuleValidationError):
+        asyncio.run(User(email="a@x").avalidate())
+
+
+def test_async_rules_run_concurrently_across_fields():
+    log = []
+
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique(set(), delay=0.01, log=log)])
+        name: str = field(rules=[Unique(set(), delay=0.01, log=log)])
+
+    asyncio.run(User(email="e", name="n").avalidate())
+
+    assert [entry[0] for entry in log] == ["start", "start", "end", "end"]
+
+
+def test_concurrency_limit_serializes_rules():
+    log = []
+
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique(set(), delay=0.01, log=log)])
+        name: str = field(rules=[Unique(set(), delay=0.01, log=log)])
+
+    asyncio.run(User(email="e", name="n").avalidate(concurrency=1))
+
+    assert [entry[0] for entry in log] == ["start", "end", "start", "end"]
+
+
+def test_avalidate_reports_first_failing_field_in_declared_order():
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique({"taken"}, delay=0.01)])
+        age: int = field(rules=[Min(18)])
+
+    with pytest.raises(RuleValidationError) as exc_info:
+        asyncio.run(User(email="taken", age=1).avalidate())
+    assert exc_info.value.rule_name == "unique"
+
+    with pytest.raises(TypeValidationError):
+        asyncio.run(User(email="free", age="x").avalidate())
+
+
+def test_avalidate_timeout():
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique(set(), delay=1)])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(User(email="e").avalidate(timeout=0.01))
+
+
+def test_sync_validation_rejects_async_rules():
+    @validated_dataclass
+    class User:
+        email: str = field(rules=[Unique(set())])
+
+    with pytest.raises(TypeError, match="avalidate"):
+        User(email="e").validate()
+    with pytest.raises(TypeError):
+        User(email="e").collect_errors()
+
+
+def test_avalidate_sees_active_profiles():
+    log = []
+    profiles = ProfileRegistry()
+    create = Profile("create")
+    create.add_rules("email", [Unique(set(), log=log)])
+    profiles.register(create)
+
+    @profiles.bind
+    @validated_dataclass
+    class User:
+        email: str
+
+    async def run():
+        with use_profile("create"):
+            await User(email="e").avalidate()
+
+    asyncio.run(run())
+
+    assert log[0] == ("start", "e", "create")
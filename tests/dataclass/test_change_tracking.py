@@ -0,0 +1,138 @@
+import pickle
+
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.errors import RuleValidationError
+from cascade.core.registry import clear_registry, register_type
+from cascade.rules import Max, Min
+
+
+@validated_dataclass(track_changes=True)
+class _Tracked:
+    score: int = field(rules=[Min(0), Max(10)])
+
+
+@validated_dataclass(track_changes=True, slots=True)
+class _SlottedTracked:
+    score: int = field(rules=[Min(0), Max(10)])
+
+
+def _counting(name, log):
+    def rule(value):
+        log.append(name)
+
+    rule.name = name
+    return rule
+
+
+def test_unchanged_instance_is_not_rechecked():
+    log = []
+
+    @validated_dataclass(track_changes=True)
+    class Aggregate:
+        a: int = field(rules=[_counting("a", log)])
+        b: int = field(rules=[_counting("b", log)])
+
+    item = Aggregate(1, 2)
+    item.validate()
+    assert log == ["a", "b"]
+
+    item.validate()
+    assert item.is_valid()
+    assert log == ["a", "b"]
+
+    item.b = 3
+    assert item.is_valid()
+    assert log == ["a", "b", "b"]
+
+
+def test_dependent_fields_are_rechecked():
+    log = []
+
+    @validated_dataclass(track_changes=True)
+    class Booking:
+        start: int = field(rules=[_counting("start", log)])
+        end: int = field(rules=[_counting("end", log)], depends_on=["start"])
+        note: str = field(rules=[_counting("note", log)])
+
+    booking = Booking(1, 2, "x")
+    booking.validate()
+    log.clear()
+
+    booking.start = 0
+    booking.validate()
+    assert log == ["start", "end"]
+
+
+def test_failed_validation_keeps_fields_dirty():
+    def positive(value):
+        if value <= 0:
+            raise RuleValidationError(value=value, rule_name="positive")
+
+    positive.name = "positive"
+
+    @validated_dataclass(track_changes=True)
+    class Item:
+        quantity: int = field(rules=[positive])
+
+    item = Item(1)
+    item.validate()
+    item.quantity = 0
+
+    assert not item.is_valid()
+    with pytest.raises(RuleValidationError):
+        item.validate()
+
+
+def test_registry_change_invalidates_cached_result():
+    class Code(str):
+        pass
+
+    def reject(value):
+        raise RuleValidationError(value=value, rule_name="reject")
+
+    @validated_dataclass(track_changes=True)
+    class Item:
+        code: Code
+
+    item = Item(Code("a"))
+    assert item.is_valid()
+
+    register_type(Code, reject)
+    try:
+        assert not item.is_valid()
+    finally:
+        clear_registry()
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+
+        @validated_dataclass(track_changes=True)
+        class Broken:
+            a: int = field(depends_on=["missing"])
+
+
+@pytest.mark.parametrize("cls", [_Tracked, _SlottedTracked])
+def test_validated_tracked_instances_stay_picklable(cls):
+    item = cls(5)
+    item.validate()
+
+    copy = pickle.loads(pickle.dumps(item))
+
+    assert copy == item
+    # Bypass tracking: only a full check can catch this value.
+    object.__setattr__(copy, "score", -1)
+    with pytest.raises(RuleValidationError):
+        copy.validate()
+
+
+def test_validated_tracked_instances_validate_in_processes():
+    items = [_Tracked(1), _Tracked(2), _Tracked(11)]
+    for item in items[:2]:
+        item.validate()
+
+    report = _Tracked.validate_many(items, workers=2, executor="process")
+
+    assert report.failed_indices == (2,)
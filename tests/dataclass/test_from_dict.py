@@ -0,0 +1,155 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.coercion import clear_coercers, register_coercer
+from cascade.core.errors import (
+    CoercionError,
+    RuleValidationError,
+    TypeValidationError,
+)
+from cascade.rules import Min
+
+
+@validated_dataclass
+class _Point:
+    x: int = field(rules=[Min(0)])
+    y: int = 0
+
+
+@validated_dataclass
+class _Shape:
+    name: str
+    origin: _Point
+    points: List[_Point] = field(default_factory=list)
+    anchor: Optional[_Point] = None
+    labels: Dict[str, _Point] = field(default_factory=dict)
+
+
+def setup_function():
+    clear_coercers()
+
+
+def test_from_dict_builds_validated_instance():
+    point = _Point.from_dict({"x": 1, "y": 2})
+
+    assert point == _Point(1, 2)
+    assert _Point.from_dict({"x": 3}) == _Point(3, 0)
+
+
+def test_from_dict_checks_types_and_rules():
+    with pytest.raises(TypeValidationError):
+        _Point.from_dict({"x": "1"})
+    with pytest.raises(RuleValidationError):
+        _Point.from_dict({"x": -1})
+
+
+def test_from_dict_rejects_missing_and_unknown_keys():
+    with pytest.raises(TypeValidationError, match="Missing required key 'x'"):
+        _Point.from_dict({"y": 1})
+    with pytest.raises(TypeValidationError, match="Unknown keys .*'z'"):
+        _Point.from_dict({"x": 1, "z": 2})
+    with pytest.raises(TypeValidationError, match="Expected a mapping"):
+        _Point.from_dict([("x", 1)])
+
+
+def test_from_dict_coerces_with_registered_coercers():
+    register_coercer(int, int, source=str)
+
+    assert _Point.from_dict({"x": "4", "y": "5"}, coerce=True) == _Point(4, 5)
+    with pytest.raises(TypeValidationError):
+        _Point.from_dict({"x": "4"})
+    with pytest.raises(RuleValidationError):
+        _Point.from_dict({"x": "-4"}, coerce=True)
+    with pytest.raises(CoercionError):
+        _Point.from_dict({"x": "four"}, coerce=True)
+
+
+def test_from_dict_decodes_nested_dataclasses():
+    shape = _Shape.from_dict(
+        {
+            "name": "triangle",
+            "origin": {"x": 0},
+            "points": [{"x": 1}, {"x": 2, "y": 3}],
+            "anchor": {"x": 5},
+            "labels": {"top": {"x": 2, "y": 3}},
+        }
+    )
+
+    assert shape.origin == _Point(0)
+    assert shape.points == [_Point(1), _Point(2, 3)]
+    assert shape.anchor == _Point(5)
+    assert shape.labels == {"top": _Point(2, 3)}
+    assert _Shape.from_dict({"name": "dot", "origin": _Point(1)}).anchor is None
+
+
+def test_from_dict_reports_nested_errors():
+    with pytest.raises(RuleValidationError):
+        _Shape.from_dict({"name": "bad", "origin": {"x": 0}, "points": [{"x": -1}]})
+    with pytest.raises(TypeValidationError, match="Missing required key 'x'"):
+        _Shape.from_dict({"name": "bad", "origin": {}})
+
+
+def test_from_dicts_decodes_every_mapping():
+    points = _Point.from_dicts([{"x": 1}, {"x": 2, "y": 1}])
+
+    assert points == [_Point(1), _Point(2, 1)]
+    with pytest.raises(RuleValidationError):
+        _Point.from_dicts([{"x": 1}, {"x": -2}])
+
+
+def _counting(log):
+    def rule(value):
+        log.append(value)
+
+    rule.name = "counting"
+    return rule
+
+
+@pytest.mark.parametrize("mode", [{"on_init": True}, {"on_assign": True}])
+def test_from_dict_validates_hooked_classes_once(mode):
+    log = []
+
+    @validated_dataclass(**mode)
+    class Hooked:
+        value: int = field(rules=[_counting(log)])
+
+    Hooked(1)
+    assert log == [1]
+
+    assert Hooked.from_dict({"value": 2}).value == 2
+    assert log == [1, 2]
+
+
+def test_from_dict_runs_user_post_init_of_hooked_classes():
+    from dataclasses import field as dataclass_field
+
+    @validated_dataclass(on_init=True)
+    class Window:
+        start: int
+        end: int
+        size: int = dataclass_field(init=False, default=0)
+        tags: List[str] = dataclass_field(init=False, default_factory=list)
+
+        def __post_init__(self):
+            self.size = self.end - self.start
+
+    window = Window.from_dict({"start": 2, "end": 5})
+
+    assert (window.size, window.tags) == (3, [])
+    with pytest.raises(TypeValidationError):
+        Window.from_dict({"start": 2, "end": "5"})
+
+
+@pytest.mark.parametrize("mode", [{}, {"on_init": True}])
+def test_from_dict_rechecks_fields_rewritten_by_post_init(mode):
+    @validated_dataclass(**mode)
+    class Rewritten:
+        a: int
+
+        def __post_init__(self):
+            self.a = "bad"
+
+    with pytest.raises(TypeValidationError):
+        Rewritten.from_dict({"a": 1})
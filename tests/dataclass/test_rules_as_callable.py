@@ -39,3 +39,31 @@ def test_invalid_rule_rejected_at_execution_time():
 
     with pytest.raises(TypeError):
         item.validate()
+
+
+def test_range_rules_reduce_numeric_arrays():
+    import array
+    from typing import Sequence
+
+    from cascade.rules import Max, Min
+
+    @validated_dataclass
+    class Frame:
+        points: Sequence[float] = field(rules=[Min(0.0), Max(1.0)])
+
+    Frame(points=array.array("d", [0.0, 0.5, 1.0])).validate()
+
+    with pytest.raises(RuleValidationError) as exc_info:
+        Frame(points=array.array("d", [0.2, 1.5, 0.9])).validate()
+
+    assert exc_info.value.rule_name == "max"
+
+
+def test_range_rules_accept_empty_arrays():
+    import array
+
+    from cascade.rules import Max, Min
+
+    for empty in (array.array("d"), memoryview(b"")):
+        Min(0)(empty)
+        Max(1)(empty)
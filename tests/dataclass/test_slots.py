@@ -0,0 +1,117 @@
+import pickle
+from dataclasses import FrozenInstanceError, fields
+from typing import List
+
+import pytest
+
+from cascade import ValidationCache, field, validated_dataclass
+from cascade.core.errors import RuleValidationError, TypeValidationError
+from cascade.rules import Min
+
+
+@validated_dataclass(slots=True, frozen=True)
+class _Record:
+    key: str
+    score: int = field(rules=[Min(0)], default=0)
+
+
+def test_slotted_class_has_no_instance_dict():
+    record = _Record("a", 1)
+
+    assert not hasattr(record, "__dict__")
+    assert _Record.__slots__ == ("key", "score", "__weakref__")
+    assert [f.name for f in fields(record)] == ["key", "score"]
+    assert _Record("b").score == 0
+
+
+def test_slotted_class_validates():
+    _Record("a", 1).validate()
+
+    with pytest.raises(RuleValidationError):
+        _Record("a", -1).validate()
+    with pytest.raises(TypeValidationError):
+        _Record(1, 1).validate()
+
+
+def test_frozen_slotted_instances_are_immutable_and_picklable():
+    record = _Record("a", 1)
+
+    with pytest.raises(FrozenInstanceError):
+        record.score = 2
+
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_slots_combine_with_change_tracking_and_assignment_checks():
+    @validated_dataclass(slots=True, on_assign=True, track_changes=True)
+    class Basket:
+        items: List[str]
+        total: int = field(rules=[Min(0)])
+
+    basket = Basket(["a"], 1)
+    assert basket.is_valid()
+
+    with pytest.raises(RuleValidationError):
+        basket.total = -1
+
+    basket.total = 3
+    assert basket.is_valid()
+    assert not hasattr(basket, "__dict__")
+
+
+def test_frozen_instances_cache_their_result():
+    calls = []
+
+    def counted(value):
+        calls.append(value)
+
+    counted.name = "counted"
+
+    @validated_dataclass(frozen=True, slots=True, track_changes=True)
+    class Point:
+        x: int = field(rules=[counted])
+
+    point = Point(1)
+    assert point.is_valid()
+    assert point.is_valid()
+    assert calls == [1]
+
+
+def test_slotted_instances_are_weak_referenceable():
+    import weakref
+
+    record = _Record("a", 1)
+    cache = ValidationCache()
+
+    assert weakref.ref(record)() is record
+    assert cache.validate(record, _Record)
+    assert cache.validate(record, _Record)
+    assert cache.cache_info().hits == 1
+
+
+def test_slotted_methods_can_use_zero_argument_super():
+    @validated_dataclass
+    class Base:
+        value: int
+
+        def hello(self):
+            return "base"
+
+    @validated_dataclass(slots=True)
+    class Child(Base):
+        def hello(self):
+            return "child+" + super().hello()
+
+        @property
+        def doubled(self):
+            return super().hello() * 2
+
+        @classmethod
+        def make(cls):
+            return super().__new__(cls)
+
+    child = Child(1)
+
+    assert child.hello() == "child+base"
+    assert child.doubled == "basebase"
+    assert type(Child.make()) is Child
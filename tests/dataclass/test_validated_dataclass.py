@@ -6,6 +6,7 @@ from cascade.core.errors import (
     TypeValidationError,
     RuleValidationError,
 )
+from cascade.rules import Min
 
 
 class GreaterThanZero:
@@ -92,3 +93,182 @@ def test_no_validation_on_init():
 
     user = User(age=0)
     assert user.age == 0
+
+
+def test_inherited_fields_are_type_checked():
+    @validated_dataclass
+    class Base:
+        id: int
+
+    @validated_dataclass
+    class User(Base):
+        age: int = 0
+
+    user = User(id="not-int", age=1)
+
+    with pytest.raises(TypeValidationError):
+        user.validate()
+
+
+def test_string_annotations_are_resolved():
+    @validated_dataclass
+    class User:
+        age: "int"
+
+    User(age=1).validate()
+
+    with pytest.raises(TypeValidationError):
+        User(age="x").validate()
+
+
+def test_plan_follows_registry_changes():
+    from cascade.core.registry import register_type, unregister_type
+
+    class UserId(int):
+        pass
+
+    @validated_dataclass
+    class User:
+        id: UserId
+
+    user = User(id=UserId(1))
+    user.validate()
+
+    def reject(value):
+        raise TypeValidationError(value=value, expected_type=UserId)
+
+    register_type(UserId, reject)
+    try:
+        with pytest.raises(TypeValidationError):
+            user.validate()
+    finally:
+        unregister_type(UserId)
+
+    user.validate()
+
+
+def test_wide_dataclass_validates_every_field():
+    namespace = {f"f{i}": int for i in range(100)}
+    Wide = validated_dataclass(type("Wide", (), {"__annotations__": namespace}))
+
+    values = {name: 1 for name in namespace}
+    Wide(**values).validate()
+
+    values["f99"] = "x"
+    with pytest.raises(TypeValidationError):
+        Wide(**values).validate()
+
+
+def test_validate_many_reports_first_error_per_instance():
+    @validated_dataclass
+    class User:
+        id: int
+        age: int = field(rules=[GreaterThanZero()])
+
+    users = [
+        User(id=1, age=10),
+        User(id="x", age=0),
+        User(id=3, age=0),
+        User(id=4, age=5),
+    ]
+
+    report = User.validate_many(users)
+
+    assert report.total == 4
+    assert report.failed_indices == (1, 2)
+    assert isinstance(report.errors[1], TypeValidationError)
+    assert isinstance(report.errors[2], RuleValidationError)
+
+
+def test_validate_many_rejects_foreign_instances():
+    @validated_dataclass
+    class User:
+        id: int
+
+    report = User.validate_many([User(id=1), object()])
+
+    assert report.failed_indices == (1,)
+    assert isinstance(report.errors[1], TypeValidationError)
+
+
+def test_collect_errors_runs_every_check():
+    from typing import List
+
+    @validated_dataclass
+    class Order:
+        id: int
+        quantity: int = field(rules=[GreaterThanZero()])
+        items: List[int] = field(default_factory=list)
+
+    order = Order(id="x", quantity=0, items=[1, "a", 3, "b"])
+
+    errors = order.collect_errors()
+
+    assert [detail.location for detail in errors] == [
+        "id",
+        "quantity",
+        "items[1]",
+        "items[3]",
+    ]
+    assert [detail.code for detail in errors] == [
+        "type",
+        "greater_than_zero",
+        "type",
+        "type",
+    ]
+    assert Order(id=1, quantity=1).collect_errors().errors == ()
+
+
+def test_nested_collect_errors_descends_into_nested_dataclasses():
+    from typing import Dict, List, Optional
+
+    @validated_dataclass
+    class Item:
+        price: int = field(rules=[GreaterThanZero()])
+
+    @validated_dataclass
+    class Order:
+        items: List[Item]
+        gift: Optional[Item] = None
+        by_sku: Dict[str, Item] = field(default_factory=dict)
+
+    order = Order(
+        [Item(1), Item("x"), Item(-5)],
+        gift=Item(0),
+        by_sku={"a": Item("y")},
+    )
+
+    assert order.is_valid()
+    assert order.collect_errors().errors == ()
+
+    errors = order.collect_errors(nested=True)
+
+    assert [detail.location for detail in errors] == [
+        "items[1].price",
+        "items[2].price",
+        "gift.price",
+        "by_sku['a'].price",
+    ]
+    assert [detail.code for detail in errors] == [
+        "type",
+        "greater_than_zero",
+        "greater_than_zero",
+        "type",
+    ]
+
+
+@validated_dataclass
+class _Reading:
+    sensor: str
+    value: float = field(rules=[Min(0.0)])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_validate_many_in_parallel(executor):
+    readings = [_Reading("a", 1.0), _Reading("b", -1.0), _Reading(3, 2.0)] * 20
+
+    report = _Reading.validate_many(readings, workers=2, executor=executor)
+
+    assert report.total == 60
+    assert report.failed_indices == _Reading.validate_many(readings).failed_indices
+    assert report.errors[1].rule_name == "min"
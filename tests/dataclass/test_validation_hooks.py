@@ -0,0 +1,101 @@
+from dataclasses import InitVar, dataclass, fields
+
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.errors import RuleValidationError, TypeValidationError
+from cascade.rules import Min
+
+
+def test_default_has_no_implicit_validation():
+    @validated_dataclass
+    class Item:
+        quantity: int
+
+    item = Item(quantity="x")
+    item.quantity = "y"
+
+
+def test_on_init_validates_after_construction():
+    @validated_dataclass(on_init=True)
+    class Item:
+        quantity: int = field(rules=[Min(1)])
+
+    Item(quantity=2)
+    with pytest.raises(TypeValidationError):
+        Item(quantity="2")
+    with pytest.raises(RuleValidationError):
+        Item(quantity=0)
+
+    item = Item(quantity=2)
+    item.quantity = 0
+
+
+def test_on_init_runs_user_post_init_first():
+    @validated_dataclass(on_init=True)
+    class Item:
+        quantity: int
+        total: int = field(default=0)
+        factor: InitVar[int] = 1
+
+        def __post_init__(self, factor):
+            self.total = self.quantity * factor
+
+    assert Item(quantity=2, factor=3).total == 6
+    assert "factor" not in [f.name for f in fields(Item)]
+
+
+def test_on_assign_checks_only_the_assigned_field(monkeypatch):
+    calls = []
+
+    def tracked(value):
+        calls.append(value)
+
+    tracked.name = "tracked"
+
+    @validated_dataclass(on_assign=True)
+    class Item:
+        quantity: int = field(rules=[Min(0)])
+        label: str = field(rules=[tracked])
+
+    item = Item(quantity=1, label="a")
+    calls.clear()
+
+    item.quantity = 5
+    assert calls == []
+
+    with pytest.raises(RuleValidationError):
+        item.quantity = -1
+    assert item.quantity == 5
+
+    with pytest.raises(TypeValidationError):
+        Item(quantity="x", label="a")
+
+    item.note = "not a field"
+
+
+def test_on_assign_wraps_user_setattr():
+    seen = []
+
+    @validated_dataclass(on_assign=True)
+    class Item:
+        quantity: int
+
+        def __setattr__(self, name, value):
+            seen.append(name)
+            object.__setattr__(self, name, value)
+
+    item = Item(quantity=1)
+    with pytest.raises(TypeValidationError):
+        item.quantity = "x"
+
+    assert seen == ["quantity"]
+
+
+def test_on_assign_rejects_frozen_dataclasses():
+    with pytest.raises(TypeError):
+
+        @validated_dataclass(on_assign=True)
+        @dataclass(frozen=True)
+        class Item:
+            quantity: int
@@ -0,0 +1,6 @@
+"""
+Tests for Cascade profiles.
+
+These tests cover contextual rule resolution and profile
+registries bound to validated dataclasses.
+"""
@@ -0,0 +1,167 @@
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.errors import RuleValidationError
+from cascade.profiles import Profile, ProfileRegistry, use_profile
+from cascade.rules import Max, Min
+
+
+def _registry():
+    profiles = ProfileRegistry()
+
+    create = Profile("create")
+    create.add_rules("age", [Min(18)])
+    profiles.register(create)
+
+    update = Profile("update")
+    update.add_rules("age", [Min(0)])
+    profiles.register(update)
+
+    return profiles
+
+
+# Module level, so spawned worker processes can import the binding.
+_PROFILES = _registry()
+
+
+@_PROFILES.bind
+@validated_dataclass
+class _Member:
+    age: int
+
+
+def test_resolve_rules_follows_active_profile():
+    profiles = _registry()
+
+    assert profiles.resolve_rules("age") == []
+    with use_profile("create"):
+        assert [rule.minimum for rule in profiles.resolve_rules("age")] == [18]
+    with use_profile("missing"):
+        assert profiles.resolve_rules("age") == []
+
+
+def test_bound_dataclass_runs_profile_rules_after_field_rules():
+    profiles = _registry()
+
+    @profiles.bind
+    @validated_dataclass
+    class User:
+        age: int = field(rules=[Max(150)])
+
+    User(age=15).validate()
+
+    with use_profile("update"):
+        User(age=15).validate()
+
+    with use_profile("create"):
+        assert not User(age=15).is_valid()
+        with pytest.raises(RuleValidationError) as exc_info:
+            User(age=200).validate()
+        assert exc_info.value.rule_name == "max"
+
+        report = User.validate_many([User(age=20), User(age=15)])
+        assert report.failed_indices == (1,)
+
+
+def test_bound_plans_are_cached_and_invalidated():
+    profiles = _registry()
+
+    @profiles.bind
+    @validated_dataclass
+    class User:
+        age: int
+
+    from cascade.dataclass.validated import _get_plan
+
+    with use_profile("create"):
+        first = _get_plan(User)
+        assert _get_plan(User) is first
+
+        profiles.get("create").add_rules("age", [Min(21)])
+        assert _get_plan(User) is not first
+        assert not User(age=20).is_valid()
+
+        replacement = Profile("create")
+        profiles.register(replacement)
+        assert User(age=20).is_valid()
+
+
+def test_bind_rejects_plain_classes_and_unbind_restores():
+    profiles = _registry()
+
+    with pytest.raises(TypeError):
+        profiles.bind(object)
+
+    @validated_dataclass
+    class User:
+        age: int
+
+    profiles.bind(User)
+    profiles.unbind(User)
+
+    with use_profile("create"):
+        assert User(age=1).is_valid()
+
+
+def test_profiles_inherit_and_stack():
+    from cascade.profiles import active_profiles, current_profile
+
+    profiles = ProfileRegistry()
+    base = Profile("update")
+    base.add_rules("age", [Min(0)])
+    admin = Profile("admin_update", extends=["update"])
+    admin.add_rules("age", [Max(200)])
+    tenant = Profile("tenant")
+    tenant.add_rules("age", [Max(120)])
+    for profile in (base, admin, tenant):
+        profiles.register(profile)
+
+    with use_profile("admin_update"):
+        inherited = base.get_rules("age") + admin.get_rules("age")
+        assert profiles.resolve_rules("age") == inherited
+
+        with use_profile("tenant"):
+            assert active_profiles() == ("admin_update", "tenant")
+            assert current_profile() == "tenant"
+            assert len(profiles.resolve_rules("age")) == 3
+
+    assert current_profile() is None
+
+
+def test_merged_rules_are_cached_per_combination():
+    profiles = _registry()
+
+    with use_profile("create", "update"):
+        first = profiles.resolve_rules("age")
+        assert profiles.resolve_rules("age") is first
+
+        profiles.get("update").add_rules("age", [])
+        assert [rule.minimum for rule in profiles.resolve_rules("age")] == [18]
+
+
+def test_profile_inheritance_cycle_is_reported():
+    profiles = ProfileRegistry()
+    profiles.register(Profile("a", extends=["b"]))
+    profiles.register(Profile("b", extends=["a"]))
+
+    with use_profile("a"):
+        with pytest.raises(ValueError, match="a -> b -> a"):
+            profiles.resolve_rules("age")
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_validate_many_applies_active_profiles(executor, monkeypatch):
+    import multiprocessing
+
+    from cascade.core import parallel
+
+    monkeypatch.setattr(parallel, "_MP_CONTEXT", multiprocessing.get_context("spawn"))
+    members = [_Member(age) for age in (10, 30, 12, 40)]
+
+    with use_profile("create"):
+        sequential = _Member.validate_many(members)
+        report = _Member.validate_many(members, workers=2, executor=executor)
+
+    assert sequential.failed_indices == (0, 2)
+    assert report.failed_indices == sequential.failed_indices
+    assert _Member.validate_many(members, workers=2, executor=executor).ok
@@ -0,0 +1,5 @@
+"""
+Tests for Cascade validation rules.
+
+These tests cover the built-in rules and rule fusion.
+"""
@@ -0,0 +1,93 @@
+from typing import List
+
+import pytest
+
+from cascade import field, validated_dataclass
+from cascade.core.errors import RuleValidationError
+from cascade.rules import BatchRule, Each, Min
+
+
+class ExistsIn(BatchRule):
+    """Dict-backed stand-in for a database existence check."""
+
+    name = "exists_in"
+
+    def __init__(self, table, **kwargs):
+        super().__init__(**kwargs)
+        self.table = table
+        self.calls = []
+
+    def check_many(self, values):
+        self.calls.append(list(values))
+        return {value: value in self.table for value in values}
+
+    def message(self, value):
+        return f"Unknown key {value!r}."
+
+
+def test_single_value_check():
+    rule = ExistsIn({1: "a"})
+
+    rule(1)
+    with pytest.raises(RuleValidationError) as exc_info:
+        rule(2)
+
+    assert exc_info.value.rule_name == "exists_in"
+    assert exc_info.value.message == "Unknown key 2."
+
+
+def test_validate_many_makes_one_deduplicated_call():
+    products = ExistsIn({1: "pen", 2: "ink"})
+
+    @validated_dataclass
+    class Line:
+        product_id: int = field(rules=[Min(0), products])
+
+    lines = [Line(1), Line(2), Line(1), Line(3), Line(-1), Line("x")]
+    report = Line.validate_many(lines)
+
+    assert products.calls == [[1, 2, 3]]
+    assert report.failed_indices == (3, 4, 5)
+    assert report.errors[3].rule_name == "exists_in"
+    assert report.errors[4].rule_name == "min"
+
+
+def test_result_cache_is_consulted():
+    cache = {}
+    rule = ExistsIn({1: "pen"}, cache=cache)
+
+    rule.collect_many([1, 2])
+    errors = rule.collect_many([1, 2, 3])
+
+    assert rule.calls == [[1, 2], [3]]
+    assert cache == {1: True, 2: False, 3: False}
+    assert sorted(errors) == [1, 2]
+
+
+def test_each_checks_list_elements_in_bulk():
+    products = ExistsIn({1: "pen", 2: "ink"})
+
+    @validated_dataclass
+    class Order:
+        product_ids: List[int] = field(rules=[Each(products)])
+
+    Order([1, 2, 1]).validate()
+    with pytest.raises(RuleValidationError) as exc_info:
+        Order([1, 4, 5]).validate()
+    assert exc_info.value.value == 4
+
+    products.calls.clear()
+    report = Order.validate_many([Order([1, 2]), Order([2, 9, 8]), Order([])])
+
+    assert products.calls == [[1, 2, 9, 8]]
+    assert report.failed_indices == (1,)
+    assert report.errors[1].value == 9
+
+
+def test_each_with_plain_rule():
+    rule = Each(Min(0))
+
+    rule([0, 1])
+    with pytest.raises(RuleValidationError):
+        rule([1, -1])
+    assert sorted(rule.collect_many([[1], [-1], [2, -2]])) == [1, 2]
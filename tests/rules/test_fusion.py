@@ -0,0 +1,62 @@
+import pytest
+
+from cascade.core.errors import RuleValidationError
+from cascade.rules import Length, Max, Min, Pattern, compile_rules
+
+
+def _error(rules, value):
+    try:
+        for rule in rules:
+            rule(value)
+    except RuleValidationError as exc:
+        return exc.rule_name, exc.message
+    return None
+
+
+def test_adjacent_builtin_rules_are_fused():
+    rules = [Min(5), Max(20), Length(min=1), Pattern("a"), Pattern("b")]
+
+    assert len(compile_rules(rules)) == 3
+
+
+@pytest.mark.parametrize("value", [4, 5, 12, 20, 21, 7.5, float("nan"), True])
+def test_fused_range_reports_same_error(value):
+    rules = [Min(5), Max(20), Min(6)]
+
+    assert _error(compile_rules(rules), value) == _error(rules, value)
+
+
+@pytest.mark.parametrize("value", ["", "ab", "abcd", "abcdef"])
+def test_fused_length_reports_same_error(value):
+    rules = [Length(min=1, max=5), Length(min=2)]
+
+    assert _error(compile_rules(rules), value) == _error(rules, value)
+
+
+@pytest.mark.parametrize("value", ["a1", "1a", "a", "1", "", "x\na1"])
+def test_fused_patterns_match_search_semantics(value):
+    rules = [Pattern("^[a-z]"), Pattern(r"\d"), Pattern("1$")]
+
+    assert _error(compile_rules(rules), value) == _error(rules, value)
+
+
+def test_unfusable_rules_are_kept_in_order():
+    class Even(Min):
+        name = "even"
+
+        def check(self, value):
+            if value % 2:
+                self.fail(value, "odd")
+
+    grouped = Pattern("(a)")
+    even = Even(0)
+    compiled = compile_rules([Min(0), even, grouped, Pattern("b")])
+
+    assert compiled[1] is even
+    assert compiled[2] is grouped
+    assert len(compiled) == 4
+
+
+def test_fused_rules_raise_non_validation_errors_unchanged():
+    with pytest.raises(TypeError):
+        compile_rules([Length(min=1), Length(max=3)])[0](5)
@@ -0,0 +1,6 @@
+"""
+Tests for Cascade validation strategies.
+
+These tests cover partial validation of large containers
+through sampling and depth limits.
+"""
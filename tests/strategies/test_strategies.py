@@ -0,0 +1,151 @@
+import pytest
+from typing import Dict, List, Optional
+
+from cascade.core.errors import TypeValidationError
+from cascade.core.registry import clear_registry, register_type
+from cascade.strategies import (
+    Full,
+    Head,
+    MaxDepth,
+    Sample,
+    compile_strategy,
+    validate_with,
+)
+
+
+def test_full_strategy_checks_everything():
+    result = validate_with([1.0, 2.0], List[float], Full())
+
+    assert result.name == "full"
+    assert result.exhaustive is True
+
+    with pytest.raises(TypeValidationError):
+        validate_with([1.0, "x"], List[float], Full())
+
+
+def test_head_checks_only_leading_elements():
+    values = [1.0] * 10 + ["bad"]
+
+    result = validate_with(values, List[float], Head(10))
+
+    assert result.name == "head"
+    assert result.exhaustive is False
+
+    with pytest.raises(TypeValidationError):
+        validate_with(values, List[float], Head(11))
+
+
+def test_head_on_sets_and_mappings():
+    assert validate_with({1, 2, 3}, set[int], Head(2)).name == "head"
+
+    data = {"a": 1, "b": 2, "c": "x"}
+    validate_with(data, Dict[str, int], Head(2))
+
+    with pytest.raises(TypeValidationError):
+        validate_with(data, Dict[str, int], Head(3))
+
+
+def test_sample_is_deterministic():
+    strategy = Sample(5, seed=42)
+
+    assert strategy.indices(1000) == Sample(5, seed=42).indices(1000)
+    assert len(strategy.indices(1000)) == 5
+    assert strategy.indices(3) is None
+
+
+def test_sample_checks_selected_positions():
+    strategy = Sample(3, seed=1)
+    positions = strategy.indices(100)
+
+    values = [0.5] * 100
+    validate_with(values, List[float], strategy)
+
+    values[positions[0]] = "bad"
+    with pytest.raises(TypeValidationError):
+        validate_with(values, List[float], strategy)
+
+    missed = next(i for i in range(100) if i not in positions)
+    values = [0.5] * 100
+    values[missed] = "bad"
+    validate_with(values, List[float], strategy)
+
+
+def test_max_depth_limits_nested_checks():
+    value = [[1, "x"], [2]]
+
+    result = validate_with(value, List[List[int]], MaxDepth(1))
+    assert result.name == "max_depth"
+
+    with pytest.raises(TypeValidationError):
+        validate_with(value, List[List[int]], MaxDepth(2))
+
+    with pytest.raises(TypeValidationError):
+        validate_with([["x"], "not-a-list"], List[List[int]], MaxDepth(1))
+
+
+def test_max_depth_zero_checks_container_only():
+    validate_with(["x"], List[int], MaxDepth(0))
+
+    with pytest.raises(TypeValidationError):
+        validate_with(("x",), List[int], MaxDepth(0))
+
+
+def test_strategies_apply_inside_unions():
+    checker = compile_strategy(Optional[List[int]], Head(1))
+
+    assert checker(None).name == "head"
+    assert checker([1, "x"]).name == "head"
+    assert checker.matches(["x"]) is False
+
+
+def test_invalid_strategy_arguments():
+    with pytest.raises(ValueError):
+        Sample(-1)
+
+    with pytest.raises(ValueError):
+        Head(1, max_depth=-1)
+
+
+def test_strategy_checkers_follow_registry_changes():
+    class Token(str):
+        pass
+
+    def reject(value):
+        raise TypeValidationError(value=value, expected_type=Token)
+
+    full = Full()
+    check = compile_strategy(List[Token], Head(1))
+    check([Token("a")])
+    validate_with([Token("a")], List[Token], full)
+
+    register_type(Token, reject)
+    try:
+        with pytest.raises(TypeValidationError):
+            check([Token("a")])
+        assert not check.matches([Token("a")])
+        with pytest.raises(TypeValidationError):
+            validate_with([Token("a")], List[Token], full)
+    finally:
+        clear_registry()
+
+    check([Token("a")])
+
+
+def test_validate_with_reuses_checkers_for_equal_strategies():
+    from cascade.strategies import engine
+
+    validate_with([1], List[int], Sample(2, seed=3))
+    checker = engine._checkers[(List[int], Sample(2, seed=3))]
+
+    validate_with([2], List[int], Sample(2, seed=3))
+
+    assert engine._checkers[(List[int], Sample(2, seed=3))] is checker
+
+
+def test_strategies_compare_by_parameters():
+    assert Sample(5, seed=1) == Sample(5, seed=1)
+    assert hash(Head(3, max_depth=2)) == hash(Head(3, max_depth=2))
+    assert MaxDepth(2) == MaxDepth(2)
+    assert Sample(5, seed=1) != Sample(5, seed=2)
+    assert Head(3) != Sample(3)
+    assert Full(max_depth=2) != MaxDepth(2)
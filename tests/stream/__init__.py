@@ -0,0 +1,6 @@
+"""
+Tests for Cascade streaming validation.
+
+These tests cover lazy line readers and newline-delimited JSON
+validation against types and validated dataclasses.
+"""
@@ -0,0 +1,117 @@
+import io
+from typing import Dict, List
+
+import pytest
+
+from cascade import ValidationErrors, field, validated_dataclass
+from cascade.core.coercion import clear_coercers, register_coercer
+from cascade.rules import Min
+from cascade.stream import iter_lines, validate_ndjson
+
+
+@validated_dataclass
+class _Event:
+    id: int
+    score: int = field(rules=[Min(0)], default=0)
+
+
+def setup_function():
+    clear_coercers()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_buffered_reader_splits_lines_across_chunks(chunk_size):
+    data = b'{"a": 1}\r\n\n[1, 2]\nlast'
+
+    lines = list(iter_lines(io.BytesIO(data), chunk_size=chunk_size))
+
+    assert lines == [b'{"a": 1}', b"", b"[1, 2]", b"last"]
+
+
+def test_mmap_reader_matches_buffered_reader(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_bytes(b'{"id": 1}\r\n\n{"id": 2}\n')
+    empty = tmp_path / "empty.ndjson"
+    empty.write_bytes(b"")
+
+    assert list(iter_lines(path, reader="mmap")) == list(iter_lines(path))
+    assert list(iter_lines(empty, reader="mmap")) == []
+
+
+def test_text_streams_are_supported():
+    lines = iter_lines(io.StringIO("1\n2\n"), chunk_size=1)
+
+    assert list(lines) == ["1", "2"]
+
+
+def test_invalid_options_raise_eagerly():
+    with pytest.raises(ValueError):
+        iter_lines(io.BytesIO(), reader="lines")
+    with pytest.raises(ValueError):
+        iter_lines(io.BytesIO(), chunk_size=0)
+    with pytest.raises(ValueError):
+        validate_ndjson(io.BytesIO(), int, on_error="ignore")
+
+
+def test_validates_each_line_against_a_type():
+    data = b'{"a": [1, 2]}\n\n{"a": ["x"]}\nnot json\n{"b": []}\n'
+
+    results = list(validate_ndjson(io.BytesIO(data), Dict[str, List[int]]))
+
+    assert [line_no for line_no, _ in results] == [1, 3, 4, 5]
+    assert results[0][1] == {"a": [1, 2]}
+    assert results[3][1] == {"b": []}
+
+    type_errors = results[1][1]
+    assert isinstance(type_errors, ValidationErrors)
+    assert [detail.location for detail in type_errors] == ["['a'][0]"]
+
+    json_errors = results[2][1]
+    assert [detail.code for detail in json_errors] == ["json"]
+    assert "Invalid JSON" in str(json_errors)
+
+
+def test_decodes_validated_dataclasses(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_text('{"id": 1, "score": 2}\n{"id": 2, "score": -1}\n{"id": 3}\n')
+
+    results = list(validate_ndjson(path, _Event, reader="mmap"))
+
+    assert results[0] == (1, _Event(1, 2))
+    assert results[2] == (3, _Event(3))
+    assert [detail.code for detail in results[1][1]] == ["min"]
+
+
+def test_stop_policy_ends_after_first_error():
+    data = b'{"id": 1}\n{"id": "x"}\n{"id": 3}\n'
+
+    results = list(validate_ndjson(io.BytesIO(data), _Event, on_error="stop"))
+
+    assert [line_no for line_no, _ in results] == [1, 2]
+    assert isinstance(results[1][1], ValidationErrors)
+
+
+def test_coercion_failures_are_reported_per_line():
+    register_coercer(int, int, source=str)
+    data = b'"1"\n"x"\n3\n'
+
+    results = list(validate_ndjson(io.BytesIO(data), int, coerce=True))
+
+    assert results[0] == (1, 1)
+    assert [detail.code for detail in results[1][1]] == ["coercion"]
+    assert results[2] == (3, 3)
+
+
+def test_results_are_produced_lazily():
+    reads = []
+
+    class _Stream(io.BytesIO):
+        def read(self, size=-1):
+            reads.append(size)
+            return super().read(size)
+
+    results = validate_ndjson(_Stream(b"1\n2\n3\n4\n"), int, chunk_size=2)
+
+    assert reads == []
+    assert next(results) == (1, 1)
+    assert len(reads) == 1